@@ -0,0 +1,100 @@
+"""Lookup throughput and memory of the mmap address index vs a Python set
+
+Each variant runs in a fresh interpreter so RSS deltas are not polluted
+by the other.
+
+    python benchmarks/bench_address_index.py [--size 1000000] [--lookups 200000]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.address import b58encode  # noqa: E402
+from src.address_index import AddressIndex  # noqa: E402
+
+
+def rss_kb() -> int:
+    """Current resident set size in KiB (Linux), falling back to peak RSS"""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    import resource
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def measure(variant: str, index_path: str, list_path: str, probes_path: str) -> dict:
+    """Load one representation, then time lookups over the probe addresses"""
+    probes = Path(probes_path).read_text().split()
+    before = rss_kb()
+    started = time.perf_counter()
+    if variant == "mmap":
+        table = AddressIndex(Path(index_path))
+    else:
+        table = set(Path(list_path).read_text().split())
+    load_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    hits = sum(1 for address in probes if address in table)
+    lookup_seconds = time.perf_counter() - started
+    # Touching the keys is what brings mmap pages into RSS
+    return {
+        "variant": variant,
+        "load_s": load_seconds,
+        "lookups_per_s": len(probes) / lookup_seconds,
+        "hits": hits,
+        "rss_delta_mb": (rss_kb() - before) / 1024,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=1_000_000, help="Addresses in the list")
+    parser.add_argument("--lookups", type=int, default=200_000, help="Lookups to time (half hits)")
+    parser.add_argument("--measure", nargs=4, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        print(json.dumps(measure(*args.measure)))
+        return
+
+    with tempfile.TemporaryDirectory() as workdir:
+        work = Path(workdir)
+        addresses = [b58encode(os.urandom(32)) for _ in range(args.size)]
+        misses = [b58encode(os.urandom(32)) for _ in range(args.lookups // 2)]
+        probes = addresses[:args.lookups - len(misses)] + misses
+
+        (work / "list.txt").write_text("\n".join(addresses))
+        (work / "probes.txt").write_text("\n".join(probes))
+        started = time.perf_counter()
+        AddressIndex.build(addresses, work / "list.idx")
+        print(f"built {args.size} keys in {time.perf_counter() - started:.1f}s, "
+              f"{(work / 'list.idx').stat().st_size / 1e6:.1f} MB on disk "
+              f"vs {(work / 'list.txt').stat().st_size / 1e6:.1f} MB text")
+
+        for variant in ("mmap", "set"):
+            result = subprocess.run(
+                [sys.executable, __file__, "--measure", variant,
+                 str(work / "list.idx"), str(work / "list.txt"), str(work / "probes.txt")],
+                capture_output=True, text=True, check=True,
+            )
+            stats = json.loads(result.stdout)
+            print(f"{stats['variant']:>5}: load {stats['load_s'] * 1000:8.1f} ms | "
+                  f"{stats['lookups_per_s']:>10,.0f} lookups/s | "
+                  f"RSS +{stats['rss_delta_mb']:.1f} MB | hits {stats['hits']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Memory and lookup cost of base58 strings vs 32-byte address keys
+
+Builds the same set of addresses both ways, as the dedup cache holds them,
+and times membership checks with freshly created probes (as each scan
+parses new objects, so hashes are never cached on the probe).
+
+    python benchmarks/bench_address_keys.py [--size 1000000] [--lookups 200000]
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.address import b58decode, b58encode, to_key  # noqa: E402
+
+
+def measure_set(items) -> tuple:
+    """Traced bytes of a set holding the items (set table plus objects)"""
+    tracemalloc.start()
+    table = set(item for item in items)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return table, size
+
+
+def time_lookups(table, probes) -> float:
+    started = time.perf_counter()
+    hits = sum(1 for probe in probes if probe in table)
+    elapsed = time.perf_counter() - started
+    assert hits == len(probes)
+    return len(probes) / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=1_000_000, help="Addresses in the set")
+    parser.add_argument("--lookups", type=int, default=200_000, help="Membership checks to time")
+    args = parser.parse_args()
+
+    raw = [os.urandom(32) for _ in range(args.size)]
+    encoded = [b58encode(key) for key in raw]
+
+    # Rebuild each object from scratch so the set owns fresh copies
+    strings, string_bytes = measure_set("".join(address) for address in encoded)
+    keys, key_bytes = measure_set(bytes(bytearray(key)) for key in raw)
+    print(f"{args.size:,} addresses: str set {string_bytes / 1e6:.1f} MB, "
+          f"key set {key_bytes / 1e6:.1f} MB ({1 - key_bytes / string_bytes:.0%} smaller)")
+
+    sample = encoded[:args.lookups]
+    string_probes = ["".join(address) for address in sample]
+    key_probes = [bytes(bytearray(key)) for key in raw[:args.lookups]]
+    print(f"lookups: str {time_lookups(strings, string_probes):,.0f}/s, "
+          f"key {time_lookups(keys, key_probes):,.0f}/s")
+
+    started = time.perf_counter()
+    for address in sample:
+        to_key(address)
+    decode_us = (time.perf_counter() - started) / len(sample) * 1e6
+    started = time.perf_counter()
+    for key in key_probes:
+        b58encode(key)
+    encode_us = (time.perf_counter() - started) / len(key_probes) * 1e6
+    print(f"one-time decode at parse {decode_us:.1f} us/address, "
+          f"encode for display {encode_us:.1f} us/address")
+    assert b58decode(sample[0]) == raw[0]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Cold-start latency per CLI mode, with a -X importtime breakdown
+
+Each mode runs in a fresh interpreter with network access stubbed out, so
+the numbers reflect import and setup cost rather than DexScreener latency.
+
+    python benchmarks/bench_startup.py [--repeat 5] [--top 10]
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Stub the HTTP layer; every mode imports the client module anyway
+_OFFLINE = (
+    "import src.dexscreener_client as c\n"
+    "c.DexScreenerClient._fetch_json = lambda self, url, deadline=None: {'pairs': []}\n"
+)
+
+_RUN_MAIN = "import src.main as m\nm.main()\n"
+
+# Dashboard mode: stop after the first scan so the loop exits
+_ONE_SCAN = (
+    "import src.main as m\n"
+    "scan = m.SolanaScraperOrchestrator._scan_once\n"
+    "def once(self):\n"
+    "    scan(self)\n"
+    "    self.running = False\n"
+    "m.SolanaScraperOrchestrator._scan_once = once\n"
+    "m.main()\n"
+)
+
+MODES: Dict[str, Tuple[List[str], str]] = {
+    "help": (["--help"], _RUN_MAIN),
+    "verify-token": (["--verify-token", "TOKEN"], _OFFLINE + _RUN_MAIN),
+    "dry-run": (["--dry-run"], _OFFLINE + _RUN_MAIN),
+    "dashboard": ([], _OFFLINE + _ONE_SCAN),
+}
+
+
+def run_mode(args: List[str], script: str, workdir: Path) -> Tuple[float, str]:
+    """Run one cold start, return wall seconds and importtime output"""
+    argv = ", ".join(repr(arg) for arg in ["solana-scraper", *args])
+    code = f"import sys\nsys.argv = [{argv}]\n{script}"
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=workdir,
+        env={"PYTHONPATH": str(ROOT), "PATH": ""},
+        capture_output=True,
+        text=True,
+    )
+    elapsed = time.perf_counter() - started
+    if result.returncode not in (0,):
+        raise RuntimeError(f"mode {args} failed:\n{result.stderr[-2000:]}")
+    return elapsed, result.stderr
+
+
+def parse_importtime(output: str) -> Tuple[int, Dict[str, int], List[Tuple[int, str]]]:
+    """Total cumulative us, self us per top-level package, and per module"""
+    total = 0
+    per_package: Dict[str, int] = defaultdict(int)
+    modules: List[Tuple[int, str]] = []
+
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = len(name) - len(name.lstrip())
+        name = name.strip()
+        if depth == 1:
+            total += int(cumulative_us)
+        per_package[name.split(".")[0]] += int(self_us)
+        modules.append((int(self_us), name))
+
+    modules.sort(reverse=True)
+    return total, per_package, modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per mode (default: 5)")
+    parser.add_argument("--top", type=int, default=8, help="Packages to list per mode")
+    args = parser.parse_args()
+
+    workdir = ROOT / "benchmarks" / ".startup"
+    workdir.mkdir(exist_ok=True)
+    (workdir / "config.json").write_text("{}")
+
+    for mode, (mode_args, script) in MODES.items():
+        walls = []
+        output = ""
+        for _ in range(args.repeat):
+            wall, output = run_mode(mode_args, script, workdir)
+            walls.append(wall)
+
+        total, per_package, _ = parse_importtime(output)
+        print(f"\n{mode}: wall median {statistics.median(walls) * 1000:.0f} ms "
+              f"(min {min(walls) * 1000:.0f} ms), imports {total / 1000:.0f} ms")
+        ranked = sorted(per_package.items(), key=lambda item: item[1], reverse=True)
+        for package, self_us in ranked[:args.top]:
+            print(f"  {package:<24} {self_us / 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
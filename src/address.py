@@ -0,0 +1,69 @@
+"""Base58 helpers and compact keys for Solana (and EVM) addresses"""
+import sys
+from typing import Optional, Union
+
+
+ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+KEY_SIZE = 32
+EVM_KEY_SIZE = 20
+
+# 32 raw bytes for a Solana address, the interned string for anything else
+AddressKey = Union[bytes, str]
+
+_INDEX = {char: value for value, char in enumerate(ALPHABET)}
+
+
+def b58decode(text: str) -> bytes:
+    """Decode a base58 string, raising ValueError on invalid characters"""
+    number = 0
+    try:
+        for char in text:
+            number = number * 58 + _INDEX[char]
+    except KeyError as e:
+        raise ValueError(f"Invalid base58 character: {e.args[0]!r}") from None
+
+    leading_zeros = len(text) - len(text.lstrip("1"))
+    body = number.to_bytes((number.bit_length() + 7) // 8, "big")
+    return b"\x00" * leading_zeros + body
+
+
+def b58encode(data: bytes) -> str:
+    """Encode bytes as base58"""
+    number = int.from_bytes(data, "big")
+    chars = []
+    while number:
+        number, remainder = divmod(number, 58)
+        chars.append(ALPHABET[remainder])
+
+    leading_zeros = len(data) - len(data.lstrip(b"\x00"))
+    return "1" * leading_zeros + "".join(reversed(chars))
+
+
+def address_key(address: str) -> Optional[bytes]:
+    """32-byte key for a Solana address, None if it is not one"""
+    try:
+        key = b58decode(address)
+    except ValueError:
+        return None
+    return key if len(key) == KEY_SIZE else None
+
+
+def hex_key(address: str) -> Optional[bytes]:
+    """20-byte key for a 0x-prefixed EVM address (any case), None if it is not one"""
+    if len(address) != 2 + 2 * EVM_KEY_SIZE or address[:2] not in ("0x", "0X"):
+        return None
+    try:
+        return bytes.fromhex(address[2:])
+    except ValueError:
+        return None
+
+
+def to_key(address: str) -> AddressKey:
+    """Compact key for an address, decoded once at parse time"""
+    key = address_key(address)
+    return key if key is not None else sys.intern(address)
+
+
+def to_address(key: AddressKey) -> str:
+    """base58 text of a key, for display and output only"""
+    return b58encode(key) if isinstance(key, bytes) else key
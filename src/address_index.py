@@ -0,0 +1,159 @@
+"""Memory-mapped sorted index of fixed-size address keys"""
+import argparse
+import mmap
+import struct
+from pathlib import Path
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, Optional, Tuple
+from src.address import EVM_KEY_SIZE, KEY_SIZE, AddressKey, address_key, hex_key
+
+MAGIC = b"SADX"
+VERSION = 1
+# magic, version, key size, key count
+HEADER = struct.Struct("<4sHHQ")
+# Keys before each 2-byte prefix, plus a final total, as little-endian uint32
+FANOUT_SLOTS = 1 << 16
+FANOUT = struct.Struct(f"<{FANOUT_SLOTS + 1}I")
+KEYS_OFFSET = HEADER.size + FANOUT.size
+_BOUNDS = struct.Struct("<2I")
+
+# Key size recorded in the header -> decoder for the text addresses it holds
+DECODERS: Dict[int, Callable[[str], Optional[bytes]]] = {
+    KEY_SIZE: address_key,      # base58 Solana addresses
+    EVM_KEY_SIZE: hex_key,      # 0x hex EVM addresses
+}
+FORMATS = {"base58": KEY_SIZE, "hex": EVM_KEY_SIZE}
+
+
+class AddressIndex:
+    """Read-only address set backed by an mmap'd file of sorted keys
+
+    The file is a fixed header, a fanout table of key counts per 2-byte
+    prefix, then unique decoded keys in ascending byte order: 32-byte
+    base58 (Solana) or 20-byte 0x hex (EVM) keys, per the header.
+    Lookups read their prefix's range from the fanout and binary-search
+    only that slice of the mapping, so every process opening the same
+    file shares its pages through the OS page cache instead of building
+    its own set.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"Address index is empty: {self.path}")
+
+        if len(self._map) < HEADER.size:
+            self.close()
+            raise ValueError(f"Address index too short: {self.path}")
+
+        magic, version, key_size, count = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION or key_size not in DECODERS:
+            self.close()
+            raise ValueError(f"Not a version {VERSION} address index: {self.path}")
+        if len(self._map) != KEYS_OFFSET + count * key_size:
+            self.close()
+            raise ValueError(f"Address index is truncated: {self.path}")
+
+        self._count = count
+        self.key_size = key_size
+        self._decode = DECODERS[key_size]
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, address: AddressKey) -> bool:
+        """Membership for a text address in the index's format, or a decoded key"""
+        key = self._decode(address) if isinstance(address, str) else address
+        return key is not None and self.contains_key(key)
+
+    def contains_key(self, key: bytes) -> bool:
+        """Binary search for a key of the index's size"""
+        key_size = self.key_size
+        if len(key) != key_size:
+            return False
+        data = self._map
+        low, high = _BOUNDS.unpack_from(data, HEADER.size + 4 * ((key[0] << 8) | key[1]))
+        while low < high:
+            middle = (low + high) // 2
+            offset = KEYS_OFFSET + middle * key_size
+            probe = data[offset:offset + key_size]
+            if probe < key:
+                low = middle + 1
+            elif probe > key:
+                high = middle
+            else:
+                return True
+        return False
+
+    def close(self) -> None:
+        if getattr(self, "_map", None) is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    @staticmethod
+    def build(addresses: Iterable[str], path: Path, key_size: int = KEY_SIZE) -> Tuple[int, int]:
+        """Write an index file, returning (keys written, invalid addresses skipped)
+
+        key_size picks the address format: KEY_SIZE for base58 Solana
+        addresses, EVM_KEY_SIZE for 0x hex EVM addresses.
+        """
+        decode = DECODERS[key_size]
+        keys = set()
+        invalid = 0
+        for address in addresses:
+            key = decode(address)
+            if key is None:
+                invalid += 1
+                continue
+            keys.add(key)
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        ordered = sorted(keys)
+        prefixes = [(key[0] << 8) | key[1] for key in ordered]
+        fanout = [bisect_left(prefixes, prefix) for prefix in range(FANOUT_SLOTS)]
+        fanout.append(len(ordered))
+
+        temporary = path.with_suffix(path.suffix + ".tmp")
+        with open(temporary, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, key_size, len(ordered)))
+            f.write(FANOUT.pack(*fanout))
+            f.write(b"".join(ordered))
+        temporary.replace(path)
+        return len(keys), invalid
+
+
+def read_address_lists(paths: Iterable[Path]) -> Iterable[str]:
+    """Addresses from text files: one per line, '#' starts a comment"""
+    for path in paths:
+        with open(path, "r") as f:
+            for line in f:
+                address = line.split("#", 1)[0].strip()
+                if address:
+                    yield address
+
+
+def main():
+    """Build an address index from text lists"""
+    parser = argparse.ArgumentParser(description="Build a memory-mapped address index")
+    parser.add_argument("output", type=Path, help="Index file to write")
+    parser.add_argument("lists", type=Path, nargs="+", help="Text files with one address per line")
+    parser.add_argument(
+        "--format",
+        choices=sorted(FORMATS),
+        default="base58",
+        help="Address format: base58 (Solana, default) or hex (0x EVM addresses)"
+    )
+    args = parser.parse_args()
+
+    written, invalid = AddressIndex.build(read_address_lists(args.lists), args.output, FORMATS[args.format])
+    print(f"Wrote {written} addresses to {args.output} ({invalid} invalid skipped)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""Streaming per-token anomaly detection over successive scans"""
+import math
+from collections import OrderedDict
+from typing import List, Literal, Optional
+from pydantic import BaseModel
+from src.address import AddressKey
+from src.config_manager import AnomalyConfig
+from src.dexscreener_client import TokenData
+
+
+class OnlineStats:
+    """Welford running mean/variance plus an EWMA, O(1) per update"""
+
+    __slots__ = ("count", "mean", "m2", "ewma", "alpha")
+
+    def __init__(self, alpha: float):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.ewma = 0.0
+        self.alpha = alpha
+
+    @property
+    def variance(self) -> float:
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stddev(self) -> float:
+        return math.sqrt(self.variance)
+
+    def z_score(self, value: float) -> Optional[float]:
+        """Standard score of value against the samples so far"""
+        stddev = self.stddev
+        if self.count < 2 or stddev == 0:
+            return None
+        return (value - self.mean) / stddev
+
+    def update(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.ewma = value if self.count == 1 else self.alpha * value + (1 - self.alpha) * self.ewma
+
+
+class _TokenState:
+    """Per-token series: liquidity levels and volume added between scans"""
+
+    __slots__ = ("liquidity", "volume_delta", "last_liquidity", "last_volume", "matched")
+
+    def __init__(self, alpha: float):
+        self.liquidity = OnlineStats(alpha)
+        self.volume_delta = OnlineStats(alpha)
+        self.last_liquidity: Optional[float] = None
+        self.last_volume: Optional[float] = None
+        self.matched = False
+
+
+class AnomalyEvent(BaseModel):
+    """A flagged move in one token's metrics"""
+    address: str
+    symbol: str
+    kind: Literal["liquidity_drop", "volume_spike"]
+    value: float
+    baseline: float
+    change_pct: Optional[float] = None
+    z_score: Optional[float] = None
+    matched: bool = False
+    at_ms: int
+
+
+class AnomalyDetector:
+    """Flags liquidity pulls and volume spikes as pairs stream through
+
+    Each observation compares the new value against the token's history
+    (before folding it in) and then updates the running statistics, so a
+    spike cannot mask itself. A liquidity drop fires on a large fall from
+    the previous scan, or a low z-score once enough scans have been seen.
+    A volume spike fires on a high z-score of the 24h volume added since
+    the previous scan. Tokens are kept in LRU order up to max_tokens.
+    """
+
+    def __init__(self, config: AnomalyConfig):
+        self.config = config
+        self._states: "OrderedDict[AddressKey, _TokenState]" = OrderedDict()
+        self.flagged = 0
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def mark_matched(self, key: AddressKey) -> None:
+        """Remember a token was shown as a match, so its alerts are surfaced"""
+        state = self._states.get(key)
+        if state is None:
+            state = self._new_state(key)
+        state.matched = True
+
+    def observe(self, token: TokenData, at_ms: int) -> List[AnomalyEvent]:
+        """Fold one scan's metrics into the token's statistics"""
+        state = self._states.get(token.key)
+        if state is None:
+            state = self._new_state(token.key)
+        else:
+            self._states.move_to_end(token.key)
+
+        events: List[AnomalyEvent] = []
+        config = self.config
+
+        liquidity = token.liquidity_usd
+        if state.last_liquidity:
+            change_pct = (liquidity - state.last_liquidity) / state.last_liquidity * 100
+            z_score = state.liquidity.z_score(liquidity)
+            sudden = -change_pct >= config.liquidity_drop_pct
+            unusual = (
+                z_score is not None
+                and state.liquidity.count >= config.min_samples
+                and z_score <= -config.z_threshold
+                and change_pct < 0
+            )
+            if sudden or unusual:
+                events.append(self._event(token, state, "liquidity_drop", liquidity,
+                                          state.liquidity.ewma, change_pct, z_score, at_ms))
+        state.liquidity.update(liquidity)
+        state.last_liquidity = liquidity
+
+        if state.last_volume is not None:
+            added = max(token.volume_24h - state.last_volume, 0.0)
+            z_score = state.volume_delta.z_score(added)
+            if (
+                z_score is not None
+                and state.volume_delta.count >= config.min_samples
+                and z_score >= config.z_threshold
+            ):
+                baseline = state.volume_delta.ewma
+                change_pct = (added - baseline) / baseline * 100 if baseline else None
+                events.append(self._event(token, state, "volume_spike", added,
+                                          baseline, change_pct, z_score, at_ms))
+            state.volume_delta.update(added)
+        state.last_volume = token.volume_24h
+
+        self.flagged += len(events)
+        return events
+
+    def _new_state(self, key: AddressKey) -> _TokenState:
+        state = _TokenState(self.config.ewma_alpha)
+        self._states[key] = state
+        if len(self._states) > self.config.max_tokens:
+            self._states.popitem(last=False)
+        return state
+
+    @staticmethod
+    def _event(
+        token: TokenData,
+        state: _TokenState,
+        kind: str,
+        value: float,
+        baseline: float,
+        change_pct: Optional[float],
+        z_score: Optional[float],
+        at_ms: int
+    ) -> AnomalyEvent:
+        return AnomalyEvent(
+            address=token.address,
+            symbol=token.symbol,
+            kind=kind,
+            value=value,
+            baseline=baseline,
+            change_pct=change_pct,
+            z_score=z_score,
+            matched=state.matched,
+            at_ms=at_ms,
+        )
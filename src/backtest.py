@@ -0,0 +1,304 @@
+"""Offline parameter sweep of filter configs over recorded scans
+
+Snapshots are loaded once, sorted by liquidity, and reduced to TokenFilter
+component scores. Every config then becomes a handful of big-integer
+bitset operations: the liquidity gate is a suffix of the sorted order,
+the maker gate a cached mask, and scoring an OR over the (age, volume,
+momentum) buckets whose weighted total clears min_score. Each chain's
+snapshots are scored with that chain's overrides, as live scans are.
+"""
+import argparse
+import itertools
+import json
+import os
+import random
+import re
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from pydantic import BaseModel
+from src.config_manager import ConfigManager, ScraperConfig
+from src.dexscreener_client import TokenData
+from src.history_store import HistoryStore
+from src.token_filter import AgeTiers, TokenFilter
+
+
+_ONE_BIT = re.compile("1")
+_HAS_BIT_COUNT = hasattr(int, "bit_count")
+
+
+def _popcount(mask: int) -> int:
+    """Number of set bits (int.bit_count on Python 3.10+)"""
+    return mask.bit_count() if _HAS_BIT_COUNT else bin(mask).count("1")
+
+
+class BacktestResult(BaseModel):
+    """Outcome of one config over the recorded snapshots"""
+    index: int
+    overrides: Dict[str, Any]
+    matched_snapshots: int
+    matched_tokens: int
+    overlap_tokens: int
+    jaccard: float
+    score_histogram: Dict[int, int]
+
+
+class SnapshotSet:
+    """Recorded pair snapshots in columnar form, sorted by liquidity
+
+    Tokens are (chain_id, address) pairs, so one contract on two chains
+    counts as two tokens.
+    """
+
+    def __init__(self, rows: Iterable[tuple]):
+        scorer = TokenFilter(ScraperConfig())
+        records = []
+        for scan_ms, address, price, liquidity, volume, makers, change_5m, change_1h, created_ms, chain_id in rows:
+            token = TokenData.model_construct(
+                key=address, price_usd=price, liquidity_usd=liquidity, volume_24h=volume,
+                maker_count=makers, price_change_5m=change_5m, price_change_1h=change_1h,
+                created_at_ms=created_ms
+            )
+            records.append((
+                liquidity, makers, price > 0, (chain_id, address), scan_ms, created_ms,
+                scorer._calculate_volume_score(token),
+                scorer._calculate_momentum_score(token),
+            ))
+        records.sort(key=lambda record: record[0])
+
+        self.size = len(records)
+        self.liquidity = [record[0] for record in records]
+        self.makers = [record[1] for record in records]
+        self.price_ok = self._mask(record[2] for record in records)
+        self.tokens = sorted({record[3] for record in records})
+        index = {token: i for i, token in enumerate(self.tokens)}
+        self.token_id_of = [index[record[3]] for record in records]
+        self.chain_masks = {
+            chain_id: self._mask(record[3][0] == chain_id for record in records)
+            for chain_id in sorted({token[0] for token in self.tokens})
+        }
+        self.scan_ms = [record[4] for record in records]
+        self.created_ms = [record[5] for record in records]
+        self.volume_scores = [record[6] for record in records]
+        self.momentum_scores = [record[7] for record in records]
+
+        self._makers_masks: Dict[int, int] = {}
+        self._bucket_masks: Dict[tuple, Dict[Tuple[int, int, int], int]] = {}
+
+    def __getstate__(self) -> dict:
+        # Masks are rebuilt lazily in each worker
+        state = dict(self.__dict__)
+        state["_makers_masks"] = {}
+        state["_bucket_masks"] = {}
+        return state
+
+    def liquidity_mask(self, min_liquidity: float) -> int:
+        """Snapshots with liquidity >= min_liquidity (a suffix of the order)"""
+        start = bisect_left(self.liquidity, min_liquidity)
+        return ((1 << self.size) - 1) >> start << start
+
+    def makers_mask(self, min_makers: int) -> int:
+        mask = self._makers_masks.get(min_makers)
+        if mask is None:
+            mask = self._mask(makers >= min_makers for makers in self.makers)
+            self._makers_masks[min_makers] = mask
+        return mask
+
+    def bucket_masks(self, config: ScraperConfig) -> Dict[Tuple[int, int, int], int]:
+        """Priced snapshots grouped by (age, volume, momentum) component scores"""
+        key = tuple((tier.max_age_minutes, tier.points) for tier in config.scoring.age_tiers)
+        buckets = self._bucket_masks.get(key)
+        if buckets is not None:
+            return buckets
+
+        # One bucket id byte per snapshot, then one C-speed translate per bucket
+        tiers = AgeTiers(config.scoring.age_tiers)
+        bucket_ids = bytearray(self.size)
+        index: Dict[Tuple[int, int, int], int] = {}
+        for i in range(self.size):
+            bucket = (
+                tiers.points(self.created_ms[i], self.scan_ms[i]),
+                self.volume_scores[i],
+                self.momentum_scores[i],
+            )
+            bucket_ids[i] = index.setdefault(bucket, len(index))
+
+        buckets = {}
+        for bucket, bucket_id in index.items():
+            digits = bucket_ids.translate(bytes(49 if j == bucket_id else 48 for j in range(256)))
+            buckets[bucket] = int(digits[::-1], 2) & self.price_ok
+        self._bucket_masks[key] = buckets
+        return buckets
+
+    def token_ids(self, mask: int) -> Set[int]:
+        """Distinct token ids of the snapshots set in a mask"""
+        digits = format(mask, "b")[::-1]
+        return {self.token_id_of[match.start()] for match in _ONE_BIT.finditer(digits)}
+
+    @staticmethod
+    def _mask(flags: Iterable[bool]) -> int:
+        """Pack flags into an int with bit i set for snapshot i"""
+        digits = bytes(49 if flag else 48 for flag in flags)
+        return int(digits[::-1], 2) if digits else 0
+
+
+def evaluate(data: SnapshotSet, config: ScraperConfig) -> Tuple[int, Set[int], Dict[int, int]]:
+    """Matched snapshot count, matched token ids and score histogram for a config"""
+    matched_mask = 0
+    histogram: Dict[int, int] = defaultdict(int)
+    for chain_id, chain_mask in data.chain_masks.items():
+        chain_config = config.for_chain(chain_id)
+        token_filter = TokenFilter(chain_config)
+        eligible = (
+            chain_mask
+            & data.liquidity_mask(chain_config.hard_filters.min_liquidity_usd)
+            & data.makers_mask(chain_config.hard_filters.min_maker_count)
+        )
+
+        for (age, volume, momentum), bucket in data.bucket_masks(chain_config).items():
+            passing = bucket & eligible
+            if not passing:
+                continue
+            total = token_filter.weighted_total(age, volume, momentum)
+            histogram[total] += _popcount(passing)
+            if total >= chain_config.scoring.min_score:
+                matched_mask |= passing
+
+    return _popcount(matched_mask), data.token_ids(matched_mask), dict(sorted(histogram.items()))
+
+
+def expand_grid(grid: Dict[str, List[Any]], samples: Optional[int] = None, seed: int = 0) -> List[Dict[str, Any]]:
+    """All combinations of dotted-path overrides, or a random sample of them"""
+    keys = sorted(grid)
+    combos = itertools.product(*(grid[key] for key in keys))
+    if samples is None:
+        return [dict(zip(keys, combo)) for combo in combos]
+
+    rng = random.Random(seed)
+    total = 1
+    for key in keys:
+        total *= len(grid[key])
+    if samples >= total:
+        return [dict(zip(keys, combo)) for combo in combos]
+    return [
+        {key: rng.choice(grid[key]) for key in keys}
+        for _ in range(samples)
+    ]
+
+
+def apply_overrides(base: ScraperConfig, overrides: Dict[str, Any]) -> ScraperConfig:
+    """Build a validated config from base plus dotted-path overrides"""
+    data = base.model_dump()
+    for path, value in overrides.items():
+        target = data
+        *parents, leaf = path.split(".")
+        for part in parents:
+            target = target[part]
+        target[leaf] = value
+    return ScraperConfig(**data)
+
+
+_worker_data: Optional[SnapshotSet] = None
+_worker_baseline: Set[int] = set()
+_worker_base: Optional[ScraperConfig] = None
+
+
+def _init_worker(data: SnapshotSet, baseline: Set[int], base: ScraperConfig) -> None:
+    global _worker_data, _worker_baseline, _worker_base
+    _worker_data, _worker_baseline, _worker_base = data, baseline, base
+
+
+def _run_one(job: Tuple[int, Dict[str, Any]]) -> BacktestResult:
+    index, overrides = job
+    config = apply_overrides(_worker_base, overrides)
+    snapshots, tokens, histogram = evaluate(_worker_data, config)
+    overlap = len(tokens & _worker_baseline)
+    union = len(tokens | _worker_baseline)
+    return BacktestResult(
+        index=index,
+        overrides=overrides,
+        matched_snapshots=snapshots,
+        matched_tokens=len(tokens),
+        overlap_tokens=overlap,
+        jaccard=overlap / union if union else 1.0,
+        score_histogram=histogram,
+    )
+
+
+def run_backtest(
+    data: SnapshotSet,
+    base: ScraperConfig,
+    combos: List[Dict[str, Any]],
+    workers: int = 1
+) -> List[BacktestResult]:
+    """Evaluate every override set; overlap is measured against the base config"""
+    _, baseline, _ = evaluate(data, base)
+    jobs = list(enumerate(combos))
+
+    if workers <= 1:
+        _init_worker(data, baseline, base)
+        return [_run_one(job) for job in jobs]
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(data, baseline, base)
+    ) as pool:
+        chunksize = max(1, len(jobs) // (workers * 8))
+        return list(pool.map(_run_one, jobs, chunksize=chunksize))
+
+
+def main():
+    """Entry point for the backtest CLI"""
+    parser = argparse.ArgumentParser(description="Sweep filter configs over recorded scans")
+    parser.add_argument("--db", type=Path, default=Path("data/history.sqlite3"),
+                        help="History database to replay (default: data/history.sqlite3)")
+    parser.add_argument("--config", type=Path, default=Path("config.json"),
+                        help="Base config; overlap is measured against it (default: config.json)")
+    parser.add_argument("--grid", type=Path, required=True,
+                        help='JSON of dotted paths to value lists, e.g. {"scoring.min_score": [4, 5, 6]}')
+    parser.add_argument("--samples", type=int, help="Random sample size instead of the full grid")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for --samples")
+    parser.add_argument("--hours", type=float, help="Only replay the last N hours")
+    parser.add_argument("--workers", type=int, default=0, help="Worker processes (default: CPU count)")
+    parser.add_argument("--limit", type=int, default=20, help="Rows to print (default: 20)")
+    parser.add_argument("--output", type=Path, help="Write all results as JSON")
+    args = parser.parse_args()
+
+    if not args.db.exists():
+        parser.error(f"History database not found: {args.db}")
+
+    base = ConfigManager.load(args.config)
+    combos = expand_grid(json.loads(args.grid.read_text()), args.samples, args.seed)
+
+    started = time.perf_counter()
+    store = HistoryStore(args.db)
+    since_ms = int((time.time() - args.hours * 3600) * 1000) if args.hours else 0
+    data = SnapshotSet(store.iter_snapshots(since_ms))
+    store.close()
+    loaded = time.perf_counter()
+
+    workers = args.workers or os.cpu_count() or 1
+    results = run_backtest(data, base, combos, workers)
+    finished = time.perf_counter()
+
+    print(f"{data.size} snapshots of {len(data.tokens)} tokens loaded in {loaded - started:.1f}s; "
+          f"{len(combos)} configs evaluated in {finished - loaded:.1f}s")
+
+    ranked = sorted(results, key=lambda result: result.matched_tokens, reverse=True)
+    for result in ranked[:args.limit]:
+        overrides = ", ".join(f"{key}={value}" for key, value in result.overrides.items())
+        histogram = " ".join(f"{score}:{count}" for score, count in result.score_histogram.items())
+        print(f"#{result.index:<5} tokens {result.matched_tokens:>6} | snapshots {result.matched_snapshots:>8} | "
+              f"overlap {result.overlap_tokens:>6} (J={result.jaccard:.2f}) | {overrides}")
+        print(f"       scores {histogram}")
+
+    if args.output:
+        args.output.write_text(json.dumps([result.model_dump() for result in results], indent=2))
+
+
+if __name__ == "__main__":
+    main()
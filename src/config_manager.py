@@ -1,7 +1,7 @@
 """Configuration management with validation"""
 from pathlib import Path
-from typing import Optional
-from pydantic import BaseModel, Field, field_validator
+from typing import Any, Dict, List, Literal, Optional
+from pydantic import BaseModel, Field, field_validator, model_validator
 import json
 
 
@@ -11,19 +11,175 @@ class HardFilters(BaseModel):
     min_maker_count: int = Field(default=20, ge=0)
 
 
+class AgeTier(BaseModel):
+    """Points awarded to tokens younger than max_age_minutes"""
+    max_age_minutes: int = Field(gt=0)
+    points: int = Field(ge=0, le=10)
+
+
+def _default_age_tiers() -> List[AgeTier]:
+    return [
+        AgeTier(max_age_minutes=30, points=3),
+        AgeTier(max_age_minutes=60, points=2),
+        AgeTier(max_age_minutes=120, points=1),
+    ]
+
+
 class ScoringConfig(BaseModel):
     """Scoring weights and thresholds"""
     min_score: int = Field(default=5, ge=0, le=20)
     age_weight: float = Field(default=1.0, ge=0, le=5)
     volume_weight: float = Field(default=1.0, ge=0, le=5)
     momentum_weight: float = Field(default=0.5, ge=0, le=5)
+    age_tiers: List[AgeTier] = Field(default_factory=_default_age_tiers)
+
+    @field_validator("age_tiers")
+    @classmethod
+    def _sort_age_tiers(cls, tiers: List[AgeTier]) -> List[AgeTier]:
+        """Order tiers youngest first and reject duplicate boundaries"""
+        tiers = sorted(tiers, key=lambda tier: tier.max_age_minutes)
+        ages = [tier.max_age_minutes for tier in tiers]
+        if len(set(ages)) != len(ages):
+            raise ValueError("age_tiers must have distinct max_age_minutes")
+        return tiers
+
+
+class HotScanConfig(BaseModel):
+    """Per-pair re-scan of young, fast-moving tokens between bulk scans"""
+    enabled: bool = True
+    interval_seconds: int = Field(default=5, ge=1, le=300)
+    max_tracked: int = Field(default=200, ge=1, le=10000)
+    max_age_minutes: int = Field(default=120, ge=1)
+    max_requests_per_minute: int = Field(default=120, ge=1, le=300)
+
+
+class HistoryConfig(BaseModel):
+    """Persistent record of every scored token"""
+    enabled: bool = False
+    path: Path = Path("data/history.sqlite3")
+
+
+class LoggingConfig(BaseModel):
+    """Log file rotation, format and sampling"""
+    path: Path = Path("logs/scraper.log")
+    rotation: Literal["size", "time"] = "size"
+    max_bytes: int = Field(default=10_000_000, ge=1024)
+    rotate_when: str = "midnight"
+    backup_count: int = Field(default=5, ge=0)
+    json_lines: bool = False
+    sample_burst: int = Field(default=5, ge=0)
+    sample_window_seconds: float = Field(default=60, gt=0)
+    # Only these loggers (and their children) are sampled
+    sample_loggers: List[str] = Field(default_factory=lambda: ["src.dexscreener_client"])
+
+
+class AnomalyConfig(BaseModel):
+    """Streaming detection of liquidity pulls and volume spikes"""
+    enabled: bool = True
+    matched_only: bool = True
+    ewma_alpha: float = Field(default=0.3, gt=0, le=1)
+    z_threshold: float = Field(default=3.0, gt=0)
+    min_samples: int = Field(default=5, ge=2)
+    liquidity_drop_pct: float = Field(default=30, gt=0, le=100)
+    max_tokens: int = Field(default=50_000, ge=1)
+
+
+class LiveFeedConfig(BaseModel):
+    """Embedded Server-Sent Events feed for browser viewers"""
+    enabled: bool = False
+    host: str = "127.0.0.1"
+    port: int = Field(default=8765, ge=0, le=65535)
+    client_buffer: int = Field(default=256, ge=1, le=100_000)
+    replay_matches: int = Field(default=10, ge=0, le=1000)
+
+
+class MemoryProfileConfig(BaseModel):
+    """Opt-in tracemalloc sampling written to a text report"""
+    enabled: bool = False
+    report_path: Path = Path("logs/memory.log")
+    interval_seconds: int = Field(default=300, ge=1)
+    top_n: int = Field(default=15, ge=1, le=500)
+    frames: int = Field(default=1, ge=1, le=100)
+
+
+class LeaderboardConfig(BaseModel):
+    """Session top-K of matches by score, optionally decayed by age"""
+    size: int = Field(default=10, ge=1, le=100)
+    half_life_minutes: Optional[float] = Field(default=None, gt=0)
+    max_entries: int = Field(default=10_000, ge=1)
+
+
+class WorkerConfig(BaseModel):
+    """Sharded worker mode coordinated through a shared store"""
+    enabled: bool = False
+    worker_id: Optional[str] = None
+    shard_by: Literal["address", "chain"] = "address"
+    store_url: str = "sqlite:///data/coordination.sqlite3"
+    heartbeat_seconds: float = Field(default=10, gt=0)
+    worker_ttl_seconds: float = Field(default=30, gt=0)
+    match_ttl_seconds: int = Field(default=86_400, ge=1)
+
+    @model_validator(mode="after")
+    def _ttl_outlives_heartbeat(self) -> "WorkerConfig":
+        if self.worker_ttl_seconds <= self.heartbeat_seconds:
+            raise ValueError("worker_ttl_seconds must exceed heartbeat_seconds")
+        return self
 
 
 class ScraperConfig(BaseModel):
     """Main configuration model"""
     scan_interval_seconds: int = Field(default=30, ge=10, le=300)
+    scan_deadline_seconds: Optional[float] = Field(default=None, gt=0, le=300)
+    pipeline_queue_size: int = Field(default=64, ge=1, le=10000)
+    score_cache_size: int = Field(default=50_000, ge=1)
+    blocklist_path: Optional[Path] = None
+    allowlist_path: Optional[Path] = None
     hard_filters: HardFilters = Field(default_factory=HardFilters)
     scoring: ScoringConfig = Field(default_factory=ScoringConfig)
+    hot_scan: HotScanConfig = Field(default_factory=HotScanConfig)
+    history: HistoryConfig = Field(default_factory=HistoryConfig)
+    logging: LoggingConfig = Field(default_factory=LoggingConfig)
+    anomaly: AnomalyConfig = Field(default_factory=AnomalyConfig)
+    live_feed: LiveFeedConfig = Field(default_factory=LiveFeedConfig)
+    memory_profile: MemoryProfileConfig = Field(default_factory=MemoryProfileConfig)
+    leaderboard: LeaderboardConfig = Field(default_factory=LeaderboardConfig)
+    worker: WorkerConfig = Field(default_factory=WorkerConfig)
+    chains: List[str] = Field(default_factory=lambda: ["solana"], min_length=1)
+    chain_overrides: Dict[str, Dict[str, Any]] = Field(default_factory=dict)
+
+    @field_validator("chains")
+    @classmethod
+    def _unique_chains(cls, chains: List[str]) -> List[str]:
+        if len(set(chains)) != len(chains):
+            raise ValueError("chains must not repeat")
+        return chains
+
+    @model_validator(mode="after")
+    def _overrides_name_known_chains(self) -> "ScraperConfig":
+        unknown = set(self.chain_overrides) - set(self.chains)
+        if unknown:
+            raise ValueError(f"chain_overrides for chains not in chains: {sorted(unknown)}")
+        for chain in self.chain_overrides:
+            self.for_chain(chain)
+        return self
+
+    def for_chain(self, chain: str) -> "ScraperConfig":
+        """This config with the chain's overrides deep-merged in"""
+        overrides = self.chain_overrides.get(chain)
+        if not overrides:
+            return self
+        data = _deep_merge(self.model_dump(exclude={"chain_overrides"}), overrides)
+        return ScraperConfig(**data)
+
+
+def _deep_merge(base: Dict[str, Any], overrides: Dict[str, Any]) -> Dict[str, Any]:
+    merged = dict(base)
+    for key, value in overrides.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _deep_merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
 
 
 class ConfigManager:
@@ -0,0 +1,243 @@
+"""Shared-store coordination of sharded scraper workers"""
+import hashlib
+from abc import ABC, abstractmethod
+import logging
+import os
+import socket
+import sqlite3
+import time
+from pathlib import Path
+from typing import Callable, List, Optional, Sequence, Union
+from pydantic import BaseModel
+from src.config_manager import WorkerConfig
+
+
+logger = logging.getLogger(__name__)
+
+
+class SharedStore(ABC):
+    """Worker membership and first-writer-wins claims shared between workers
+
+    Backends must make claim() atomic across every process using the store.
+    Times are wall-clock milliseconds so workers on different hosts agree.
+    """
+
+    @abstractmethod
+    def heartbeat(self, worker_id: str, expires_ms: int) -> None:
+        """Mark a worker alive until expires_ms"""
+
+    @abstractmethod
+    def leave(self, worker_id: str) -> None:
+        """Remove a worker so the others take over its share at once"""
+
+    @abstractmethod
+    def live_workers(self, now_ms: int) -> List[str]:
+        """Workers whose heartbeat has not expired"""
+
+    @abstractmethod
+    def claim(self, key: str, owner: str, now_ms: int, ttl_ms: int) -> bool:
+        """Record owner against key for ttl_ms unless another live claim exists"""
+
+    def close(self) -> None:
+        pass
+
+
+class SQLiteStore(SharedStore):
+    """Shared store in a local SQLite file, for tests and single-host workers"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), timeout=10, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(
+            "CREATE TABLE IF NOT EXISTS workers (worker_id TEXT PRIMARY KEY, expires_ms INTEGER NOT NULL);"
+            "CREATE TABLE IF NOT EXISTS claims (key TEXT PRIMARY KEY, owner TEXT NOT NULL, expires_ms INTEGER NOT NULL);"
+        )
+
+    def heartbeat(self, worker_id: str, expires_ms: int) -> None:
+        self._conn.execute(
+            "INSERT INTO workers (worker_id, expires_ms) VALUES (?, ?) "
+            "ON CONFLICT (worker_id) DO UPDATE SET expires_ms = excluded.expires_ms",
+            (worker_id, expires_ms)
+        )
+
+    def leave(self, worker_id: str) -> None:
+        self._conn.execute("DELETE FROM workers WHERE worker_id = ?", (worker_id,))
+
+    def live_workers(self, now_ms: int) -> List[str]:
+        cursor = self._conn.execute(
+            "SELECT worker_id FROM workers WHERE expires_ms > ? ORDER BY worker_id", (now_ms,)
+        )
+        return [row[0] for row in cursor]
+
+    def claim(self, key: str, owner: str, now_ms: int, ttl_ms: int) -> bool:
+        # IMMEDIATE takes the write lock up front, so check-and-insert is atomic
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            cursor = self._conn.execute(
+                "INSERT INTO claims (key, owner, expires_ms) VALUES (?, ?, ?) "
+                "ON CONFLICT (key) DO UPDATE SET owner = excluded.owner, expires_ms = excluded.expires_ms "
+                "WHERE claims.expires_ms <= ?",
+                (key, owner, now_ms + ttl_ms, now_ms)
+            )
+            claimed = cursor.rowcount == 1
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+        return claimed
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+class RedisStore(SharedStore):
+    """Shared store on any Redis-protocol server (needs the redis package)"""
+
+    WORKERS = "solana-scraper:workers"
+    CLAIM_PREFIX = "solana-scraper:claim:"
+
+    def __init__(self, url: str):
+        import redis
+        self._redis = redis.Redis.from_url(url)
+
+    def heartbeat(self, worker_id: str, expires_ms: int) -> None:
+        self._redis.zadd(self.WORKERS, {worker_id: expires_ms})
+
+    def leave(self, worker_id: str) -> None:
+        self._redis.zrem(self.WORKERS, worker_id)
+
+    def live_workers(self, now_ms: int) -> List[str]:
+        self._redis.zremrangebyscore(self.WORKERS, "-inf", now_ms)
+        return sorted(member.decode() for member in self._redis.zrange(self.WORKERS, 0, -1))
+
+    def claim(self, key: str, owner: str, now_ms: int, ttl_ms: int) -> bool:
+        # Expiry is kept by the server, so now_ms is not needed here
+        return bool(self._redis.set(self.CLAIM_PREFIX + key, owner, nx=True, px=ttl_ms))
+
+    def close(self) -> None:
+        self._redis.close()
+
+
+def open_store(url: str) -> SharedStore:
+    """Store for a sqlite:///path or redis:// (rediss://, unix://) URL"""
+    if url.startswith("sqlite:///"):
+        return SQLiteStore(Path(url[len("sqlite:///"):]))
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        return RedisStore(url)
+    raise ValueError(f"Unsupported coordination store URL: {url}")
+
+
+def rendezvous_owner(key: Union[bytes, str], workers: Sequence[str]) -> str:
+    """Highest-random-weight owner of key among workers
+
+    Only the keys of a worker that joins or leaves change hands; every
+    other key keeps its owner.
+    """
+    if isinstance(key, str):
+        key = key.encode()
+    return max(
+        workers,
+        key=lambda worker: hashlib.blake2b(key, digest_size=8, key=worker.encode()[:64]).digest()
+    )
+
+
+class WorkerStats(BaseModel):
+    """Membership and claim counters for one worker"""
+    workers: int = 1
+    rebalances: int = 0
+    claims_won: int = 0
+    claims_lost: int = 0
+    store_errors: int = 0
+
+
+class WorkerCoordinator:
+    """One worker's view of the shard map and its shared match claims
+
+    Membership comes from heartbeats in the shared store and is refreshed
+    at most every heartbeat_seconds. Work is split by rendezvous hashing
+    of token keys (shard_by="address") or chain ids (shard_by="chain"),
+    so a join or leave moves only the departed or new worker's share.
+    Matches are claimed in the store before they are emitted; the claim
+    fails for any worker but the first, even while a rebalance settles.
+    If the store is unreachable the last known membership is kept.
+    """
+
+    def __init__(
+        self,
+        config: WorkerConfig,
+        store: Optional[SharedStore] = None,
+        clock: Callable[[], float] = time.time
+    ):
+        self.config = config
+        self.worker_id = config.worker_id or f"{socket.gethostname()}-{os.getpid()}"
+        self.store = store or open_store(config.store_url)
+        self._clock = clock
+        self._workers: List[str] = [self.worker_id]
+        self._next_heartbeat = 0.0
+        self.stats = WorkerStats()
+
+    @property
+    def workers(self) -> List[str]:
+        return list(self._workers)
+
+    def heartbeat(self, force: bool = False) -> bool:
+        """Renew this worker and refresh membership; True if the shard map changed"""
+        now = self._clock()
+        if not force and now < self._next_heartbeat:
+            return False
+        self._next_heartbeat = now + self.config.heartbeat_seconds
+
+        now_ms = int(now * 1000)
+        try:
+            self.store.heartbeat(self.worker_id, now_ms + int(self.config.worker_ttl_seconds * 1000))
+            workers = self.store.live_workers(now_ms)
+        except Exception as e:
+            self.stats.store_errors += 1
+            logger.error("Coordination store unavailable: %s", e)
+            return False
+
+        if self.worker_id not in workers:
+            workers = sorted(workers + [self.worker_id])
+        if workers == self._workers:
+            return False
+
+        logger.info("Workers changed: %s -> %s", self._workers, workers)
+        self._workers = workers
+        self.stats.workers = len(workers)
+        self.stats.rebalances += 1
+        return True
+
+    def owns(self, key: Union[bytes, str]) -> bool:
+        """Whether key falls in this worker's share"""
+        if len(self._workers) == 1:
+            return True
+        return rendezvous_owner(key, self._workers) == self.worker_id
+
+    def claim_match(self, chain_id: str, address: str) -> bool:
+        """Take the right to alert on a token; False if another worker already has"""
+        try:
+            claimed = self.store.claim(
+                f"match:{chain_id}:{address}", self.worker_id,
+                int(self._clock() * 1000), self.config.match_ttl_seconds * 1000
+            )
+        except Exception as e:
+            # Alerting twice beats missing a match while the store is down
+            self.stats.store_errors += 1
+            logger.error("Match claim failed for %s: %s", address, e)
+            return True
+
+        if claimed:
+            self.stats.claims_won += 1
+        else:
+            self.stats.claims_lost += 1
+        return claimed
+
+    def close(self) -> None:
+        """Leave the worker set and release the store"""
+        try:
+            self.store.leave(self.worker_id)
+        except Exception as e:
+            logger.error("Could not leave worker set: %s", e)
+        self.store.close()
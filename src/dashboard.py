@@ -1,14 +1,20 @@
 """Live terminal dashboard using Rich library"""
+from collections import deque
 from datetime import datetime
-from typing import List
+from typing import TYPE_CHECKING, Deque, List, Optional
 from pydantic import BaseModel
-from rich.console import Console
-from rich.live import Live
-from rich.panel import Panel
-from rich.table import Table
-from rich.text import Text
 from src.dexscreener_client import TokenData
-from src.token_filter import TokenScore
+from src.token_filter import MS_PER_MINUTE, TokenScore, now_ms
+from src.pipeline import StageStats
+from src.scan_scheduler import ScheduleStats
+from src.score_cache import ScoreCacheStats
+from src.anomaly_detector import AnomalyEvent
+from src.config_manager import LeaderboardConfig
+from src.leaderboard import Leaderboard
+
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.panel import Panel
 
 
 class MatchedToken(BaseModel):
@@ -20,31 +26,78 @@ class MatchedToken(BaseModel):
 class Dashboard:
     """Terminal UI for displaying matched tokens"""
 
-    def __init__(self):
-        self.console = Console()
-        self.matches: List[MatchedToken] = []
+    def __init__(self, leaderboard: Optional[Leaderboard] = None):
+        self._console: Optional["Console"] = None
+        # Last 10 matches, newest first
+        self.matches: Deque[MatchedToken] = deque(maxlen=10)
+        self.leaderboard = leaderboard or Leaderboard(LeaderboardConfig())
         self.total_scanned = 0
         self.total_matches = 0
         self.total_duplicates = 0
+        self.total_blocked = 0
         self.last_scan: datetime = datetime.now()
+        self.queue_stats: List[StageStats] = []
+        self.schedule_stats = ScheduleStats()
+        self.truncated_scans = 0
+        self.cache_stats = ScoreCacheStats()
+        self.hot_tracked = 0
+        self.hot_refreshes = 0
+        self.anomalies: List[AnomalyEvent] = []
+        self.total_anomalies = 0
+
+    @property
+    def console(self) -> "Console":
+        """Rich console, created on first use so headless modes skip Rich"""
+        if self._console is None:
+            from rich.console import Console
+            self._console = Console()
+        return self._console
 
     def add_match(self, matched: MatchedToken) -> None:
         """Add a new matched token to display"""
-        self.matches.insert(0, matched)  # Newest first
+        self.matches.appendleft(matched)
+        self.leaderboard.update(matched.token, matched.score, now_ms())
         self.total_matches += 1
 
-        # Keep only last 10 matches displayed
-        if len(self.matches) > 10:
-            self.matches = self.matches[:10]
+    def add_anomaly(self, event: AnomalyEvent) -> None:
+        """Add a flagged liquidity or volume move to the alerts list"""
+        self.anomalies.insert(0, event)
+        self.total_anomalies += 1
+        del self.anomalies[5:]
 
-    def update_stats(self, scanned: int, duplicates: int) -> None:
+    def update_stats(self, scanned: int, duplicates: int, blocked: int = 0) -> None:
         """Update scan statistics"""
         self.total_scanned += scanned
         self.total_duplicates += duplicates
+        self.total_blocked += blocked
         self.last_scan = datetime.now()
 
-    def render(self, next_scan_in: int) -> Panel:
+    def update_queue_stats(self, stats: List[StageStats]) -> None:
+        """Record pipeline queue depths from the last scan"""
+        self.queue_stats = stats
+
+    def update_schedule_stats(self, stats: ScheduleStats) -> None:
+        """Record scan scheduling jitter and overruns"""
+        self.schedule_stats = stats
+
+    def update_cache_stats(self, stats: ScoreCacheStats) -> None:
+        """Record score cache effectiveness"""
+        self.cache_stats = stats
+
+    def record_truncated_scan(self) -> None:
+        """Count a scan cut short by its deadline"""
+        self.truncated_scans += 1
+
+    def update_hot_stats(self, tracked: int, refreshes: int) -> None:
+        """Record hot pair scheduler activity"""
+        self.hot_tracked = tracked
+        self.hot_refreshes = refreshes
+
+    def render(self, next_scan_in: int) -> "Panel":
         """Render the dashboard as a Rich Panel"""
+        from rich.panel import Panel
+        from rich.text import Text
+
         # Header
         header = Text()
         header.append("🔍 Solana Token Scraper - Live Feed\n", style="bold cyan")
@@ -52,8 +105,11 @@ class Dashboard:
         header.append(f"Next: {next_scan_in}s | ", style="dim")
         header.append(f"Matches: {self.total_matches}", style="bold green")
 
-        # Matches table
-        table = Table(show_header=False, box=None, padding=(1, 2))
+        # One reference time for every age in this frame
+        reference_ms = now_ms()
+
+        # Recent matches
+        recent = Text()
 
         for match in self.matches:
             token = match.token
@@ -62,16 +118,18 @@ class Dashboard:
             # Match header
             match_text = Text()
             match_text.append("✨ NEW MATCH - ", style="bold yellow")
+            match_text.append(f"[{token.chain_id}] ", style="magenta")
             match_text.append(f"Score: {score.total_score}/10\n", style="bold")
 
             # Token address
             match_text.append(f"Token: {token.address}\n", style="cyan")
 
             # Metrics line
-            age_str = self._format_age(token.created_at)
+            age_str = self._format_age(token.created_at_ms, reference_ms)
             liq_str = self._format_currency(token.liquidity_usd)
             vol_str = self._format_currency(token.volume_24h)
-            match_text.append(f"Age: {age_str} | Liquidity: {liq_str} | Volume: {vol_str}\n")
+            pools_str = f" ({token.pool_count} pools)" if token.pool_count > 1 else ""
+            match_text.append(f"Age: {age_str} | Liquidity: {liq_str}{pools_str} | Volume: {vol_str}\n")
 
             # Price and momentum
             price_5m = f"{token.price_change_5m:+.1f}%" if token.price_change_5m is not None else "N/A"
@@ -83,25 +141,86 @@ class Dashboard:
                 style="green"
             )
 
-            table.add_row(match_text)
-            table.add_row(Text("─" * 60, style="dim"))
+            recent.append(match_text)
+            recent.append("─" * 60 + "\n", style="dim")
+
+        # Session leaderboard, read from the index rather than sorted here
+        board = Text()
+        leaders = self.leaderboard.top(reference_ms)
+        if leaders:
+            decayed = self.leaderboard.config.half_life_minutes is not None
+            board.append(f"🏆 Top {len(leaders)} this session\n", style="bold yellow")
+            for rank, entry in enumerate(leaders, 1):
+                score = f"{entry.effective_score:.1f}" if decayed else f"{entry.score.total_score}"
+                board.append(f"{rank:>2}. ", style="bold")
+                board.append(f"{entry.token.symbol:<10} ", style="cyan")
+                board.append(
+                    f"score {score:>4} | [{entry.token.chain_id}] | "
+                    f"{self._format_age(entry.token.created_at_ms, reference_ms)} | "
+                    f"liq {self._format_currency(entry.token.liquidity_usd)} | {entry.token.address}\n"
+                )
+
+        # Alerts on watched tokens, newest first
+        alerts = Text()
+        for event in self.anomalies:
+            label = "LIQUIDITY PULL" if event.kind == "liquidity_drop" else "VOLUME SPIKE"
+            change = f"{event.change_pct:+.0f}%" if event.change_pct is not None else ""
+            alerts.append(f"⚠ {label} ", style="bold red")
+            alerts.append(
+                f"{event.symbol} {change} | {self._format_currency(event.value)} "
+                f"(baseline {self._format_currency(event.baseline)}) | {event.address}\n",
+                style="red"
+            )
 
         # Stats footer
         footer = Text()
         footer.append(
             f"Stats: {self.total_scanned} tokens scanned | "
             f"{self.total_matches} matches shown | "
-            f"{self.total_duplicates} duplicates filtered\n",
+            f"{self.total_duplicates} duplicates filtered | "
+            f"{self.total_blocked} blocked\n",
             style="dim"
         )
+        if self.schedule_stats.ticks:
+            schedule = self.schedule_stats
+            footer.append(
+                f"Scheduler: jitter {schedule.last_jitter_ms:.0f}ms "
+                f"(max {schedule.max_jitter_ms:.0f}ms) | "
+                f"scan {schedule.last_duration_ms:.0f}ms | "
+                f"late {schedule.late_ticks} | skipped {schedule.skipped_ticks} | "
+                f"truncated {self.truncated_scans}\n",
+                style="dim"
+            )
+        if self.cache_stats.hits or self.cache_stats.misses:
+            footer.append(
+                f"Score cache: {self.cache_stats.hit_rate:.0%} hit rate "
+                f"({self.cache_stats.hits} hits, {self.cache_stats.misses} misses)\n",
+                style="dim"
+            )
+        if self.hot_tracked or self.hot_refreshes:
+            footer.append(
+                f"Hot pairs: {self.hot_tracked} tracked | {self.hot_refreshes} refreshes\n",
+                style="dim"
+            )
+        if self.queue_stats:
+            depths = " | ".join(
+                f"{stats.name} {stats.max_depth}/{stats.capacity}" for stats in self.queue_stats
+            )
+            footer.append(f"Queue peaks: {depths}\n", style="dim")
         footer.append("Press Ctrl+C to exit", style="dim italic")
 
         # Combine all
         content = Text()
         content.append(header)
         content.append("\n\n")
+        if self.anomalies:
+            content.append(alerts)
+            content.append("\n")
+        if leaders:
+            content.append(board)
+            content.append("\n")
         if self.matches:
-            content.append(table)
+            content.append(recent)
         else:
             content.append("Waiting for matches...\n", style="dim italic")
         content.append("\n")
@@ -109,10 +228,11 @@ class Dashboard:
 
         return Panel(content, border_style="cyan", padding=(1, 2))
 
-    def _format_age(self, created_at: datetime) -> str:
+    def _format_age(self, created_at_ms: int, reference_ms: Optional[int] = None) -> str:
         """Format token age for display"""
-        age = datetime.now() - created_at
-        total_minutes = age.total_seconds() / 60
+        if reference_ms is None:
+            reference_ms = now_ms()
+        total_minutes = (reference_ms - created_at_ms) / MS_PER_MINUTE
 
         if total_minutes < 60:
             return f"{int(total_minutes)} minutes"
@@ -1,18 +1,26 @@
 """DexScreener API client with retry logic"""
 import time
 import logging
-from typing import List, Optional
+import threading
+from concurrent.futures import Future
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 from datetime import datetime
-from pydantic import BaseModel
-import requests
+from pydantic import BaseModel, model_validator
+from src.address import AddressKey, to_address, to_key
+from src.pair_aggregator import PairAggregator, aggregate_pools
 
 
 logger = logging.getLogger(__name__)
 
 
 class TokenData(BaseModel):
-    """Parsed token data from DexScreener"""
-    address: str
+    """Parsed token data from DexScreener
+
+    The token address is held as a compact key (see src.address) and
+    only encoded back to base58 through the address property.
+    """
+    key: AddressKey
+    pair_address: Optional[str] = None
     name: str
     symbol: str
     price_usd: float
@@ -21,77 +29,250 @@ class TokenData(BaseModel):
     maker_count: int
     price_change_5m: Optional[float] = None
     price_change_1h: Optional[float] = None
-    created_at: datetime
+    created_at_ms: int
+    pool_count: int = 1
+    chain_id: str = "solana"
+
+    @model_validator(mode="before")
+    @classmethod
+    def _accept_address_and_created_at(cls, data: Any) -> Any:
+        """Allow construction from a base58 address and a created_at datetime"""
+        if isinstance(data, dict) and ("address" in data or "created_at" in data):
+            data = dict(data)
+            if "address" in data:
+                data.setdefault("key", to_key(data.pop("address")))
+            if "created_at" in data:
+                created_at = data.pop("created_at")
+                data.setdefault("created_at_ms", int(created_at.timestamp() * 1000))
+        return data
+
+    @property
+    def address(self) -> str:
+        """base58 token address (for display and output)"""
+        return to_address(self.key)
+
+    @property
+    def created_at(self) -> datetime:
+        """Pair creation time (for display, not the scoring hot path)"""
+        return datetime.fromtimestamp(self.created_at_ms / 1000)
+
+
+class HttpPool:
+    """One requests.Session shared by every chain's client
+
+    Created on first request (so offline commands skip loading requests)
+    and reused for connection pooling and keep-alive across chains and
+    threads.
+    """
+
+    POOL_SIZE = 16
+
+    def __init__(self):
+        self._session = None
+        self._lock = threading.Lock()
+
+    def get(self, url: str, timeout: float):
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    import requests
+                    session = requests.Session()
+                    adapter = requests.adapters.HTTPAdapter(pool_maxsize=self.POOL_SIZE)
+                    session.mount("https://", adapter)
+                    self._session = session
+        return self._session.get(url, timeout=timeout)
+
+    def close(self) -> None:
+        if self._session is not None:
+            self._session.close()
+            self._session = None
 
 
 class DexScreenerClient:
-    """Client for DexScreener API with error handling"""
+    """Client for DexScreener API with error handling, bound to one chain"""
 
     BASE_URL = "https://api.dexscreener.com/latest/dex"
+    MAX_ADDRESSES_PER_REQUEST = 30
+    REQUEST_TIMEOUT = 10
 
-    def __init__(self, max_retries: int = 3, retry_delay: int = 5):
+    def __init__(
+        self,
+        max_retries: int = 3,
+        retry_delay: int = 5,
+        chain: str = "solana",
+        http: Optional[HttpPool] = None
+    ):
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.chain = chain
+        self.http = http or HttpPool()
+        self._inflight: Dict[str, "Future[Optional[TokenData]]"] = {}
+        self._inflight_lock = threading.Lock()
+
+    def fetch_latest_tokens(self) -> List[TokenData]:
+        """Fetch latest tokens on this chain, one entry per token"""
+        return aggregate_pools(self.iter_latest_tokens())
 
     def fetch_solana_tokens(self) -> List[TokenData]:
-        """Fetch latest Solana tokens from DexScreener"""
-        url = f"{self.BASE_URL}/tokens/solana"
+        """Fetch latest tokens; kept for callers from before chain support
+
+        Returns this client's chain, which is Solana unless one was given.
+        """
+        return self.fetch_latest_tokens()
+
+    def iter_latest_tokens(self) -> Iterator[TokenData]:
+        """Lazily parse latest tokens on this chain, one pair at a time (not aggregated)"""
+        for pair in self.iter_pairs():
+            token = self.parse_pair(pair)
+            if token is not None:
+                yield token
+
+    def iter_pairs(self, deadline: Optional[float] = None) -> Iterator[Dict[str, Any]]:
+        """Yield raw pair objects on this chain from the latest DexScreener response"""
+        data = self._fetch_json(f"{self.BASE_URL}/tokens/{self.chain}", deadline)
+        if data is None:
+            return
+
+        for pair in data.get("pairs", []):
+            if pair.get("chainId") == self.chain:
+                yield pair
+
+    def fetch_pair(self, pair_address: str, deadline: Optional[float] = None) -> Optional[TokenData]:
+        """Fetch a single pair on this chain by its pair address"""
+        data = self._fetch_json(f"{self.BASE_URL}/pairs/{self.chain}/{pair_address}", deadline)
+        if data is None:
+            return None
 
+        pairs = data.get("pairs") or ([data["pair"]] if data.get("pair") else [])
+        for pair in pairs:
+            if pair.get("chainId") == self.chain:
+                return self.parse_pair(pair)
+        return None
+
+    def fetch_tokens(self, addresses: Iterable[str]) -> Dict[str, TokenData]:
+        """Look up many token addresses via the multi-address endpoint
+
+        Addresses are split into batches of MAX_ADDRESSES_PER_REQUEST.
+        Concurrent callers asking for an address that is already being
+        fetched wait for that request instead of issuing their own.
+        Addresses with no Solana pair are left out of the result.
+        """
+        owned: Dict[str, "Future[Optional[TokenData]]"] = {}
+        waiting: Dict[str, "Future[Optional[TokenData]]"] = {}
+
+        with self._inflight_lock:
+            for address in dict.fromkeys(addresses):
+                future = self._inflight.get(address)
+                if future is None:
+                    future = Future()
+                    self._inflight[address] = future
+                    owned[address] = future
+                waiting[address] = future
+
+        batches = list(owned)
+        try:
+            for start in range(0, len(batches), self.MAX_ADDRESSES_PER_REQUEST):
+                batch = batches[start:start + self.MAX_ADDRESSES_PER_REQUEST]
+                found = self._fetch_token_batch(batch)
+                self._resolve_inflight({address: owned[address] for address in batch}, found)
+        finally:
+            # Never leave waiters hanging if a batch raised
+            self._resolve_inflight(owned, {})
+
+        results = {address: future.result() for address, future in waiting.items()}
+        return {address: token for address, token in results.items() if token is not None}
+
+    def _fetch_token_batch(self, addresses: List[str]) -> Dict[str, TokenData]:
+        """Fetch one batch of addresses, aggregating each token's pools"""
+        data = self._fetch_json(f"{self.BASE_URL}/tokens/{','.join(addresses)}")
+        if data is None:
+            return {}
+
+        wanted = {to_key(address): address for address in addresses}
+        aggregator = PairAggregator()
+        for pair in data.get("pairs") or []:
+            if pair.get("chainId") != self.chain:
+                continue
+            token = self.parse_pair(pair)
+            if token is not None and token.key in wanted:
+                aggregator.add(token)
+        return {wanted[token.key]: token for token in aggregator.results()}
+
+    def _resolve_inflight(
+        self,
+        futures: Dict[str, "Future[Optional[TokenData]]"],
+        found: Dict[str, TokenData]
+    ) -> None:
+        """Complete our in-flight futures that are still pending"""
+        with self._inflight_lock:
+            for address, future in futures.items():
+                if self._inflight.get(address) is future:
+                    del self._inflight[address]
+                if not future.done():
+                    future.set_result(found.get(address))
+
+    def _fetch_json(self, url: str, deadline: Optional[float] = None) -> Optional[dict]:
+        """GET a DexScreener endpoint with retries, None on failure
+
+        deadline is a time.monotonic() value; no attempt or retry starts
+        after it has passed. The timeout shrinks to fit it but bounds each
+        socket wait, not the whole transfer, so a scan's pipeline enforces
+        the deadline itself.
+        """
         for attempt in range(self.max_retries):
+            timeout = self.REQUEST_TIMEOUT
+            if deadline is not None:
+                timeout = min(timeout, deadline - time.monotonic())
+                if timeout <= 0:
+                    logger.warning("Deadline passed, skipping request to %s", url)
+                    return None
+
             try:
-                response = requests.get(url, timeout=10)
+                response = self.http.get(url, timeout=timeout)
 
                 if response.status_code == 429:
                     logger.warning("Rate limited by DexScreener API")
-                    return []
+                    return None
 
                 if response.status_code != 200:
-                    logger.error(f"API error: {response.status_code}")
-                    return []
+                    logger.error("API error: %s", response.status_code)
+                    return None
 
-                data = response.json()
-                return self._parse_tokens(data)
+                return response.json()
 
             except Exception as e:
-                logger.error(f"API call failed (attempt {attempt + 1}): {e}")
+                logger.error("API call failed (attempt %d): %s", attempt + 1, e)
                 if attempt < self.max_retries - 1:
+                    if deadline is not None and time.monotonic() + self.retry_delay >= deadline:
+                        return None
                     time.sleep(self.retry_delay)
                 continue
 
-        return []
-
-    def _parse_tokens(self, data: dict) -> List[TokenData]:
-        """Parse API response into TokenData objects"""
-        tokens = []
+        return None
 
-        for pair in data.get("pairs", []):
-            if pair.get("chainId") != "solana":
-                continue
+    def parse_pair(self, pair: Dict[str, Any]) -> Optional[TokenData]:
+        """Parse a single pair object, None if it is malformed"""
+        try:
+            base_token = pair["baseToken"]
+            txns = pair.get("txns", {}).get("h24", {})
+            buys = txns.get("buys", 0)
+            sells = txns.get("sells", 0)
 
-            try:
-                base_token = pair["baseToken"]
-                txns = pair.get("txns", {}).get("h24", {})
-                buys = txns.get("buys", 0)
-                sells = txns.get("sells", 0)
-
-                token = TokenData(
-                    address=base_token["address"],
-                    name=base_token.get("name", "Unknown"),
-                    symbol=base_token.get("symbol", "???"),
-                    price_usd=float(pair.get("priceUsd", 0)),
-                    liquidity_usd=pair.get("liquidity", {}).get("usd", 0),
-                    volume_24h=pair.get("volume", {}).get("h24", 0),
-                    maker_count=buys + sells,
-                    price_change_5m=pair.get("priceChange", {}).get("m5"),
-                    price_change_1h=pair.get("priceChange", {}).get("h1"),
-                    created_at=datetime.fromtimestamp(
-                        pair.get("pairCreatedAt", 0) / 1000
-                    )
-                )
-                tokens.append(token)
-
-            except (KeyError, ValueError) as e:
-                logger.warning(f"Failed to parse token: {e}")
-                continue
+            return TokenData(
+                key=to_key(base_token["address"]),
+                pair_address=pair.get("pairAddress"),
+                name=base_token.get("name", "Unknown"),
+                symbol=base_token.get("symbol", "???"),
+                price_usd=float(pair.get("priceUsd", 0)),
+                liquidity_usd=pair.get("liquidity", {}).get("usd", 0),
+                volume_24h=pair.get("volume", {}).get("h24", 0),
+                maker_count=buys + sells,
+                price_change_5m=pair.get("priceChange", {}).get("m5"),
+                price_change_1h=pair.get("priceChange", {}).get("h1"),
+                created_at_ms=pair.get("pairCreatedAt", 0),
+                chain_id=self.chain
+            )
 
-        return tokens
+        except (KeyError, ValueError) as e:
+            logger.warning("Failed to parse token: %s", e)
+            return None
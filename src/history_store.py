@@ -0,0 +1,231 @@
+"""Persistent SQLite history of every scored token"""
+import argparse
+import sqlite3
+import time
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Tuple
+from pydantic import BaseModel
+from src.dexscreener_client import TokenData
+from src.token_filter import TokenScore
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    scan_ms INTEGER NOT NULL,
+    address TEXT NOT NULL,
+    pair_address TEXT,
+    symbol TEXT NOT NULL,
+    price_usd REAL NOT NULL,
+    liquidity_usd REAL NOT NULL,
+    volume_24h REAL NOT NULL,
+    maker_count INTEGER NOT NULL,
+    price_change_5m REAL,
+    price_change_1h REAL,
+    created_at_ms INTEGER NOT NULL,
+    age_score INTEGER,
+    volume_score INTEGER,
+    momentum_score INTEGER,
+    total_score INTEGER,
+    passed INTEGER NOT NULL,
+    chain_id TEXT NOT NULL DEFAULT 'solana'
+);
+CREATE INDEX IF NOT EXISTS idx_scores_scan ON scores (scan_ms);
+CREATE INDEX IF NOT EXISTS idx_scores_address ON scores (address, scan_ms);
+CREATE INDEX IF NOT EXISTS idx_scores_total ON scores (total_score, scan_ms);
+"""
+
+COLUMNS = (
+    "scan_ms, address, pair_address, symbol, price_usd, liquidity_usd, volume_24h, "
+    "maker_count, price_change_5m, price_change_1h, created_at_ms, "
+    "age_score, volume_score, momentum_score, total_score, passed, chain_id"
+)
+
+# Inputs TokenFilter needs to re-score a recorded evaluation
+SNAPSHOT_COLUMNS = (
+    "scan_ms", "address", "price_usd", "liquidity_usd", "volume_24h", "maker_count",
+    "price_change_5m", "price_change_1h", "created_at_ms", "chain_id",
+)
+
+
+class HistoryRow(BaseModel):
+    """One recorded token evaluation; score fields are None on hard-filter failure"""
+    scan_ms: int
+    address: str
+    pair_address: Optional[str] = None
+    symbol: str
+    price_usd: float
+    liquidity_usd: float
+    volume_24h: float
+    maker_count: int
+    price_change_5m: Optional[float] = None
+    price_change_1h: Optional[float] = None
+    created_at_ms: int
+    age_score: Optional[int] = None
+    volume_score: Optional[int] = None
+    momentum_score: Optional[int] = None
+    total_score: Optional[int] = None
+    passed: bool = False
+    chain_id: str = "solana"
+
+
+class HistoryStore:
+    """Append-only store of token scores with indexed window/address queries"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._migrate()
+
+    def _migrate(self) -> None:
+        """Add columns introduced after a database was created"""
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(scores)")}
+        if "chain_id" not in columns:
+            with self._conn:
+                self._conn.execute("ALTER TABLE scores ADD COLUMN chain_id TEXT NOT NULL DEFAULT 'solana'")
+
+    def record_scan(self, scan_ms: int, evaluated: Iterable[Tuple[TokenData, Optional[TokenScore]]]) -> int:
+        """Insert all evaluations from one scan in a single transaction"""
+        rows = [self._to_row(scan_ms, token, score) for token, score in evaluated]
+        if not rows:
+            return 0
+
+        with self._conn:
+            self._conn.executemany(
+                f"INSERT INTO scores ({COLUMNS}) VALUES ({', '.join('?' * 17)})",
+                rows
+            )
+        return len(rows)
+
+    def top_scores(self, since_ms: int, until_ms: Optional[int] = None, limit: int = 20) -> List[HistoryRow]:
+        """Highest scores recorded within a time window"""
+        cursor = self._conn.execute(
+            f"SELECT {COLUMNS} FROM scores "
+            "WHERE scan_ms >= ? AND scan_ms < ? AND total_score IS NOT NULL "
+            "ORDER BY total_score DESC, scan_ms DESC LIMIT ?",
+            (since_ms, until_ms if until_ms is not None else 2 ** 62, limit)
+        )
+        return [self._from_row(row) for row in cursor]
+
+    def timeline(self, address: str, since_ms: int = 0, until_ms: Optional[int] = None) -> List[HistoryRow]:
+        """All recorded evaluations of one token, oldest first"""
+        cursor = self._conn.execute(
+            f"SELECT {COLUMNS} FROM scores "
+            "WHERE address = ? AND scan_ms >= ? AND scan_ms < ? ORDER BY scan_ms",
+            (address, since_ms, until_ms if until_ms is not None else 2 ** 62)
+        )
+        return [self._from_row(row) for row in cursor]
+
+    def iter_snapshots(self, since_ms: int = 0, until_ms: Optional[int] = None) -> Iterator[tuple]:
+        """Raw metric tuples for replay, in SNAPSHOT_COLUMNS order"""
+        cursor = self._conn.execute(
+            f"SELECT {', '.join(SNAPSHOT_COLUMNS)} FROM scores "
+            "WHERE scan_ms >= ? AND scan_ms < ?",
+            (since_ms, until_ms if until_ms is not None else 2 ** 62)
+        )
+        cursor.arraysize = 10_000
+        while True:
+            rows = cursor.fetchmany()
+            if not rows:
+                return
+            yield from rows
+
+    def score_distribution(self, since_ms: int, until_ms: Optional[int] = None) -> List[Tuple[Optional[int], int, int]]:
+        """(total_score, evaluations, passed) per score within a window"""
+        cursor = self._conn.execute(
+            "SELECT total_score, COUNT(*), SUM(passed) FROM scores "
+            "WHERE scan_ms >= ? AND scan_ms < ? GROUP BY total_score ORDER BY total_score",
+            (since_ms, until_ms if until_ms is not None else 2 ** 62)
+        )
+        return [(score, count, passed or 0) for score, count, passed in cursor]
+
+    def close(self) -> None:
+        self._conn.close()
+
+    @staticmethod
+    def _to_row(scan_ms: int, token: TokenData, score: Optional[TokenScore]) -> tuple:
+        return (
+            scan_ms, token.address, token.pair_address, token.symbol,
+            token.price_usd, token.liquidity_usd, token.volume_24h, token.maker_count,
+            token.price_change_5m, token.price_change_1h, token.created_at_ms,
+            score.age_score if score else None,
+            score.volume_score if score else None,
+            score.momentum_score if score else None,
+            score.total_score if score else None,
+            int(bool(score and score.passed)),
+            token.chain_id,
+        )
+
+    @staticmethod
+    def _from_row(row: tuple) -> HistoryRow:
+        return HistoryRow(**dict(zip(HistoryRow.model_fields, row)))
+
+
+def main():
+    """Query CLI for the match history store"""
+    parser = argparse.ArgumentParser(description="Query Solana scraper match history")
+    parser.add_argument(
+        "--db",
+        type=Path,
+        default=Path("data/history.sqlite3"),
+        help="Path to history database (default: data/history.sqlite3)"
+    )
+    parser.add_argument(
+        "--hours",
+        type=float,
+        default=24,
+        help="Look-back window in hours (default: 24)"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    top = commands.add_parser("top", help="Top scores in the window")
+    top.add_argument("--limit", type=int, default=20)
+
+    timeline = commands.add_parser("timeline", help="Score timeline for one address")
+    timeline.add_argument("address")
+
+    commands.add_parser("distribution", help="Score distribution and hit rate in the window")
+
+    args = parser.parse_args()
+
+    if not args.db.exists():
+        parser.error(f"History database not found: {args.db}")
+
+    store = HistoryStore(args.db)
+    since_ms = int((time.time() - args.hours * 3600) * 1000)
+
+    if args.command == "top":
+        for row in store.top_scores(since_ms, limit=args.limit):
+            _print_row(row)
+    elif args.command == "timeline":
+        for row in store.timeline(args.address, since_ms):
+            _print_row(row)
+    else:
+        distribution = store.score_distribution(since_ms)
+        total = sum(count for _, count, _ in distribution)
+        passed = sum(hits for _, _, hits in distribution)
+        for score, count, hits in distribution:
+            label = "hard filter" if score is None else f"score {score}"
+            print(f"{label:>12}: {count:>10} evaluated, {hits:>8} passed")
+        if total:
+            print(f"Hit rate: {passed}/{total} ({passed / total:.2%})")
+
+    store.close()
+
+
+def _print_row(row: HistoryRow) -> None:
+    scanned = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(row.scan_ms / 1000))
+    score = "-" if row.total_score is None else row.total_score
+    print(
+        f"{scanned} | {row.symbol:<10} | score {score} "
+        f"(age {row.age_score}, vol {row.volume_score}, mom {row.momentum_score}) | "
+        f"liq ${row.liquidity_usd:,.0f} | vol ${row.volume_24h:,.0f} | "
+        f"{'PASS' if row.passed else 'fail'} | {row.chain_id}:{row.address}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""Priority scheduler for re-fetching hot pairs between bulk scans"""
+import heapq
+import itertools
+import time
+from typing import Callable, Dict, List, Optional
+from src.address import AddressKey
+from src.config_manager import HotScanConfig
+from src.dexscreener_client import TokenData
+from src.token_filter import MS_PER_MINUTE, TokenScore
+
+
+class RequestBudget:
+    """Token bucket shared by every DexScreener request the process makes"""
+
+    def __init__(self, requests_per_minute: int, clock: Callable[[], float] = time.monotonic):
+        self.capacity = float(requests_per_minute)
+        self.rate_per_second = requests_per_minute / 60
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+        self.spent = 0
+
+    def try_acquire(self) -> bool:
+        """Take one request from the budget if available"""
+        self._refill()
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        self.spent += 1
+        return True
+
+    def consume(self) -> None:
+        """Account for a request that is made regardless of the budget"""
+        self._refill()
+        self._tokens -= 1
+        self.spent += 1
+
+    def available(self) -> float:
+        """Requests that can be made right now"""
+        self._refill()
+        return max(self._tokens, 0.0)
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed = now - self._updated
+        self._updated = now
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate_per_second)
+
+
+class TrackedPair:
+    """Heap entry for a pair being re-fetched on the fast cadence"""
+
+    __slots__ = ("token", "priority", "next_due", "removed")
+
+    def __init__(self, token: TokenData, priority: float, next_due: float):
+        self.token = token
+        self.priority = priority
+        self.next_due = next_due
+        self.removed = False
+
+
+class HotPairScheduler:
+    """Keeps tracked pairs in a priority queue and hands out the hottest due ones
+
+    Priority combines the token's score, how young it is and how volatile
+    it has been. Re-fetches are rationed by a shared RequestBudget; pairs
+    that fall outside the tracking window stay on the bulk scan only.
+    """
+
+    def __init__(
+        self,
+        config: HotScanConfig,
+        budget: RequestBudget,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.config = config
+        self.budget = budget
+        self._clock = clock
+        self._heap: List[list] = []
+        self._tracked: Dict[AddressKey, TrackedPair] = {}
+        self._counter = itertools.count()
+        self.refreshes = 0
+
+    def __len__(self) -> int:
+        return len(self._tracked)
+
+    def heap_size(self) -> int:
+        """Heap entries, including re-ranked ones not yet popped"""
+        return len(self._heap)
+
+    def is_tracked(self, key: AddressKey) -> bool:
+        return key in self._tracked
+
+    def track(self, token: TokenData, score: Optional[TokenScore], reference_ms: int) -> None:
+        """Add or re-rank a pair; pairs without a pair address or too old are dropped"""
+        max_age_ms = self.config.max_age_minutes * MS_PER_MINUTE
+        age_ms = reference_ms - token.created_at_ms
+        if token.pair_address is None or age_ms >= max_age_ms:
+            self.untrack(token.key)
+            return
+
+        previous = self._tracked.get(token.key)
+        priority = self._priority(token, score, age_ms, max_age_ms, previous)
+        next_due = previous.next_due if previous else self._clock()
+
+        if previous is not None:
+            previous.removed = True
+        elif len(self._tracked) >= self.config.max_tracked:
+            coldest = min(self._tracked.values(), key=lambda entry: entry.priority)
+            if coldest.priority >= priority:
+                return
+            self.untrack(coldest.token.key)
+
+        entry = TrackedPair(token, priority, next_due)
+        self._tracked[token.key] = entry
+        heapq.heappush(self._heap, [-priority, next(self._counter), entry])
+
+    def untrack(self, key: AddressKey) -> None:
+        """Stop re-fetching a pair"""
+        entry = self._tracked.pop(key, None)
+        if entry is not None:
+            entry.removed = True
+
+    def retain(self, keep: Callable[[AddressKey], bool]) -> int:
+        """Untrack every pair whose key fails keep(); returns how many were dropped"""
+        dropped = [key for key in self._tracked if not keep(key)]
+        for key in dropped:
+            self.untrack(key)
+        return len(dropped)
+
+    def due(self) -> List[TokenData]:
+        """Pop the hottest pairs whose refresh is due, within the request budget"""
+        now = self._clock()
+        selected: List[TokenData] = []
+        deferred: List[list] = []
+
+        while self._heap:
+            item = heapq.heappop(self._heap)
+            entry = item[2]
+            if entry.removed:
+                continue
+            deferred.append(item)
+            if entry.next_due > now:
+                continue
+            if not self.budget.try_acquire():
+                break
+            entry.next_due = now + self.config.interval_seconds
+            selected.append(entry.token)
+
+        for item in deferred:
+            heapq.heappush(self._heap, item)
+
+        self.refreshes += len(selected)
+        return selected
+
+    def _priority(
+        self,
+        token: TokenData,
+        score: Optional[TokenScore],
+        age_ms: int,
+        max_age_ms: int,
+        previous: Optional[TrackedPair]
+    ) -> float:
+        """Higher for well-scored, young and volatile pairs"""
+        total = score.total_score if score else 0
+        freshness = 3 * (1 - max(age_ms, 0) / max_age_ms)
+
+        volatility = min(abs(token.price_change_5m or 0) / 10, 3)
+        if previous is not None and previous.token.liquidity_usd > 0:
+            liquidity_change = abs(token.liquidity_usd / previous.token.liquidity_usd - 1)
+            volatility += min(liquidity_change * 10, 3)
+
+        return total + freshness + volatility
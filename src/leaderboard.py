@@ -0,0 +1,133 @@
+"""Incrementally maintained top-K of session matches"""
+import heapq
+import itertools
+import math
+from typing import Dict, List, Optional, Tuple
+from pydantic import BaseModel
+from src.address import AddressKey
+from src.config_manager import LeaderboardConfig
+from src.dexscreener_client import TokenData
+from src.token_filter import MS_PER_MINUTE, TokenScore
+
+# The same contract address can exist on several chains
+BoardKey = Tuple[str, AddressKey]
+
+
+class LeaderboardEntry(BaseModel):
+    """A ranked match and its score as of the query time"""
+    token: TokenData
+    score: TokenScore
+    scored_ms: int
+    effective_score: float
+
+
+class _Ranked:
+    """Heap entry; superseded or removed entries are skipped lazily"""
+
+    __slots__ = ("token", "score", "scored_ms", "removed")
+
+    def __init__(self, token: TokenData, score: TokenScore, scored_ms: int):
+        self.token = token
+        self.score = score
+        self.scored_ms = scored_ms
+        self.removed = False
+
+
+class Leaderboard:
+    """Best matches of the session by score, in O(log n) per update
+
+    Entries sit in a max-heap keyed by rank with a (chain, address) map
+    for re-scores: a new score for a known token marks the old heap entry
+    removed and pushes a fresh one. top() pops the k best live entries
+    and pushes them back, so reads cost O(k log n) rather than a sort.
+
+    With half_life_minutes set, a score decays as
+    score * 2 ** (-age / half_life). Ranking by that at any time t is
+    ranking by log2(score) + scored_ms / half_life, which does not depend
+    on t, so keys never need refreshing as time passes. The heap is
+    compacted, keeping the max_entries best, once it doubles past that.
+    """
+
+    def __init__(self, config: LeaderboardConfig):
+        self.config = config
+        self._half_life_ms = (
+            config.half_life_minutes * MS_PER_MINUTE if config.half_life_minutes else None
+        )
+        self._heap: List[tuple] = []
+        self._entries: Dict[BoardKey, _Ranked] = {}
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: BoardKey) -> bool:
+        return key in self._entries
+
+    def update(self, token: TokenData, score: TokenScore, scored_ms: int) -> None:
+        """Add a match or replace a token's earlier score"""
+        key = (token.chain_id, token.key)
+        previous = self._entries.get(key)
+        if previous is not None:
+            previous.removed = True
+
+        entry = _Ranked(token, score, scored_ms)
+        self._entries[key] = entry
+        # Ties go to the newer match
+        heapq.heappush(self._heap, (-self._rank(entry), -scored_ms, -next(self._counter), entry))
+
+        if len(self._heap) > 2 * self.config.max_entries:
+            self._compact()
+
+    def remove(self, chain_id: str, key: AddressKey) -> None:
+        """Drop a chain's token from the board"""
+        entry = self._entries.pop((chain_id, key), None)
+        if entry is not None:
+            entry.removed = True
+
+    def top(self, reference_ms: int, k: Optional[int] = None) -> List[LeaderboardEntry]:
+        """The k (default size) best live entries, best first"""
+        k = self.config.size if k is None else k
+        live: List[tuple] = []
+        while self._heap and len(live) < k:
+            item = heapq.heappop(self._heap)
+            if not item[-1].removed:
+                live.append(item)
+        for item in live:
+            heapq.heappush(self._heap, item)
+
+        return [
+            LeaderboardEntry(
+                token=entry.token,
+                score=entry.score,
+                scored_ms=entry.scored_ms,
+                effective_score=self._effective(entry, reference_ms),
+            )
+            for entry in (item[-1] for item in live)
+        ]
+
+    def _rank(self, entry: _Ranked) -> float:
+        total = entry.score.total_score
+        if self._half_life_ms is None:
+            return float(total)
+        if total <= 0:
+            return -math.inf
+        return math.log2(total) + entry.scored_ms / self._half_life_ms
+
+    def _effective(self, entry: _Ranked, reference_ms: int) -> float:
+        total = float(entry.score.total_score)
+        if self._half_life_ms is None:
+            return total
+        age_ms = max(reference_ms - entry.scored_ms, 0)
+        return total * 2 ** (-age_ms / self._half_life_ms)
+
+    def _compact(self) -> None:
+        """Rebuild from live entries, keeping the max_entries best"""
+        live = [item for item in self._heap if not item[-1].removed]
+        if len(live) > self.config.max_entries:
+            live = heapq.nsmallest(self.config.max_entries, live)
+            kept = {id(item[-1]) for item in live}
+            for key, entry in list(self._entries.items()):
+                if id(entry) not in kept:
+                    del self._entries[key]
+        heapq.heapify(live)
+        self._heap = live
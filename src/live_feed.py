@@ -0,0 +1,226 @@
+"""Server-Sent Events feed of matches and stats for many viewers"""
+import asyncio
+import json
+import logging
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Set
+from pydantic import BaseModel
+from src.config_manager import LiveFeedConfig
+from src.dexscreener_client import TokenData
+from src.token_filter import TokenScore
+
+
+logger = logging.getLogger(__name__)
+
+_PAGE = b"""<!doctype html>
+<html><head><meta charset="utf-8"><title>Solana Token Scraper</title>
+<style>body{font:14px monospace;background:#111;color:#ddd;margin:2em}
+.m{border-bottom:1px solid #333;padding:.5em 0}.s{color:#888}</style></head>
+<body><h3>Solana Token Scraper - live</h3><div id="stats" class="s">connecting...</div><div id="matches"></div>
+<script>
+const feed = new EventSource("/events");
+feed.addEventListener("stats", e => {
+  const s = JSON.parse(e.data);
+  document.getElementById("stats").textContent =
+    `scanned ${s.total_scanned} | matches ${s.total_matches} | duplicates ${s.total_duplicates} | blocked ${s.total_blocked}`;
+});
+feed.addEventListener("match", e => {
+  const m = JSON.parse(e.data), t = m.token, div = document.createElement("div");
+  div.className = "m";
+  div.textContent = `score ${m.score.total_score} | ${t.symbol} | liq $${Math.round(t.liquidity_usd)} | ` +
+    `vol $${Math.round(t.volume_24h)} | makers ${t.maker_count} | ${t.address}`;
+  document.getElementById("matches").prepend(div);
+});
+</script></body></html>
+"""
+
+
+def match_event(token: TokenData, score: TokenScore, found_ms: int) -> Dict[str, Any]:
+    """JSON-ready match payload; the address is encoded once here"""
+    data = token.model_dump(exclude={"key"})
+    data["address"] = token.address
+    return {"token": data, "score": score.model_dump(), "found_ms": found_ms}
+
+
+class LiveFeedStats(BaseModel):
+    """Subscriber and broadcast counters"""
+    clients: int = 0
+    published: int = 0
+    dropped_clients: int = 0
+
+
+class _Subscriber:
+    """One connected viewer and its bounded send buffer"""
+
+    __slots__ = ("writer", "queue", "dropped")
+
+    def __init__(self, writer: asyncio.StreamWriter, buffer_size: int):
+        self.writer = writer
+        self.queue: "asyncio.Queue[bytes]" = asyncio.Queue(maxsize=buffer_size)
+        self.dropped = False
+
+
+class LiveFeed:
+    """Embedded asyncio HTTP server broadcasting events over SSE
+
+    The server runs its own event loop on a background thread. publish()
+    serializes an event once and hands the bytes to that loop without
+    waiting, so the scan loop never blocks on viewers. Each subscriber has
+    a bounded buffer; a client whose buffer fills up is disconnected
+    rather than slowing everyone else down. Recent matches are replayed to
+    new viewers.
+    """
+
+    KEEPALIVE_SECONDS = 15
+
+    def __init__(self, config: LiveFeedConfig):
+        self.config = config
+        self.port = config.port
+        self.stats = LiveFeedStats()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self._ready = threading.Event()
+        self._subscribers: Set[_Subscriber] = set()
+        self._recent: Deque[bytes] = deque(maxlen=config.replay_matches)
+        self._last_stats: Optional[bytes] = None
+
+    def start(self) -> None:
+        """Start serving on a background thread; returns once bound"""
+        self._thread = threading.Thread(target=self._run_loop, name="live-feed", daemon=True)
+        self._thread.start()
+        self._ready.wait(timeout=10)
+        if self._server is None:
+            raise OSError(f"Live feed could not bind {self.config.host}:{self.config.port}")
+        logger.info("Live feed serving on http://%s:%d/", self.config.host, self.port)
+
+    def stop(self) -> None:
+        """Disconnect viewers and stop the server thread"""
+        if self._loop is None or self._thread is None:
+            return
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+        self._thread = None
+
+    def publish(self, event: str, data: Dict[str, Any]) -> None:
+        """Serialize an event once and broadcast it; never blocks"""
+        payload = f"event: {event}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n".encode()
+        if self._loop is None or self._loop.is_closed():
+            return
+        try:
+            self._loop.call_soon_threadsafe(self._broadcast, event, payload)
+        except RuntimeError:
+            # Loop stopped between the check and the call
+            pass
+
+    def _broadcast(self, event: str, payload: bytes) -> None:
+        """Fan a serialized event out to every subscriber (loop thread)"""
+        self.stats.published += 1
+        if event == "stats":
+            self._last_stats = payload
+        else:
+            self._recent.append(payload)
+
+        for subscriber in list(self._subscribers):
+            try:
+                subscriber.queue.put_nowait(payload)
+            except asyncio.QueueFull:
+                self._drop(subscriber)
+
+    def _drop(self, subscriber: _Subscriber) -> None:
+        """Disconnect a subscriber that fell too far behind"""
+        self._subscribers.discard(subscriber)
+        subscriber.dropped = True
+        self.stats.dropped_clients += 1
+        self.stats.clients = len(self._subscribers)
+        # Abort rather than close: a stalled client may never drain
+        subscriber.writer.transport.abort()
+
+    def _run_loop(self) -> None:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            self._server = loop.run_until_complete(
+                asyncio.start_server(self._handle, self.config.host, self.config.port)
+            )
+            self.port = self._server.sockets[0].getsockname()[1]
+        except OSError as e:
+            logger.error("Live feed failed to start: %s", e)
+            self._ready.set()
+            loop.close()
+            return
+
+        self._loop = loop
+        self._ready.set()
+        try:
+            loop.run_forever()
+        finally:
+            self._server.close()
+            tasks = asyncio.all_tasks(loop)
+            for task in tasks:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            loop.close()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Route one HTTP request"""
+        try:
+            request = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), timeout=10)
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, asyncio.TimeoutError, ConnectionError):
+            writer.close()
+            return
+
+        parts = request.split(b"\r\n", 1)[0].split()
+        path = parts[1].split(b"?", 1)[0] if len(parts) >= 2 else b""
+        try:
+            if parts[:1] != [b"GET"]:
+                await self._respond(writer, b"405 Method Not Allowed", b"text/plain", b"GET only\n")
+            elif path == b"/events":
+                await self._stream(writer)
+            elif path == b"/":
+                await self._respond(writer, b"200 OK", b"text/html; charset=utf-8", _PAGE)
+            else:
+                await self._respond(writer, b"404 Not Found", b"text/plain", b"Not found\n")
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _respond(writer: asyncio.StreamWriter, status: bytes, content_type: bytes, body: bytes) -> None:
+        writer.write(
+            b"HTTP/1.1 " + status + b"\r\nContent-Type: " + content_type
+            + b"\r\nContent-Length: " + str(len(body)).encode()
+            + b"\r\nConnection: close\r\n\r\n" + body
+        )
+        await writer.drain()
+
+    async def _stream(self, writer: asyncio.StreamWriter) -> None:
+        """Send replayed and live events to one subscriber until it drops"""
+        subscriber = _Subscriber(writer, self.config.client_buffer)
+        writer.write(
+            b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\n"
+            b"Cache-Control: no-cache\r\nConnection: keep-alive\r\n"
+            b"Access-Control-Allow-Origin: *\r\n\r\n"
+        )
+        backlog = list(self._recent)
+        if self._last_stats is not None:
+            backlog.append(self._last_stats)
+        writer.write(b"".join(backlog))
+
+        self._subscribers.add(subscriber)
+        self.stats.clients = len(self._subscribers)
+        try:
+            await writer.drain()
+            while True:
+                try:
+                    payload = await asyncio.wait_for(subscriber.queue.get(), self.KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    payload = b": keepalive\n\n"
+                writer.write(payload)
+                await writer.drain()
+        finally:
+            if not subscriber.dropped:
+                self._subscribers.discard(subscriber)
+                self.stats.clients = len(self._subscribers)
@@ -0,0 +1,168 @@
+"""Non-blocking logging: queue handler, background listener, rotation, sampling"""
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from src.config_manager import LoggingConfig
+
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """One JSON object per record"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": round(record.created, 3),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class RateLimitFilter(logging.Filter):
+    """Lets through `burst` records per message template per window
+
+    Only records from `loggers` (and their children) are sampled; matches,
+    anomalies and scan errors from everywhere else always pass. Records
+    are keyed by logger, level and the unformatted message, so
+    "Failed to parse token: %s" is one key however many tokens fail. The
+    first record after a suppressed stretch reports how many were dropped.
+    Windows idle for two periods are swept, so one-off messages do not
+    accumulate over a long session while a repeat still gets its count.
+    The filter runs on every logging thread, so state is kept under a lock.
+    """
+
+    def __init__(
+        self,
+        burst: int,
+        window_seconds: float,
+        loggers: Iterable[str] = ("src.dexscreener_client",),
+        clock: Callable[[], float] = time.monotonic
+    ):
+        super().__init__()
+        self.burst = burst
+        self.window_seconds = window_seconds
+        self.loggers = tuple(loggers)
+        self._clock = clock
+        self._lock = threading.Lock()
+        # key -> [window start, records passed, records suppressed]
+        self._windows: Dict[Tuple[str, int, str], List] = {}
+        self._next_sweep = clock() + window_seconds
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not self._sampled(record.name):
+            return True
+
+        key = (record.name, record.levelno, str(record.msg))
+        with self._lock:
+            now = self._clock()
+            if now >= self._next_sweep:
+                self._sweep(now)
+            window = self._windows.get(key)
+
+            if window is None or now - window[0] >= self.window_seconds:
+                suppressed = window[2] if window else 0
+                self._windows[key] = [now, 1, 0]
+                if suppressed:
+                    record.msg = f"{record.msg} ({suppressed} similar messages suppressed)"
+                return True
+
+            if window[1] < self.burst:
+                window[1] += 1
+                return True
+
+            window[2] += 1
+            return False
+
+    def _sampled(self, name: str) -> bool:
+        return any(name == prefix or name.startswith(prefix + ".") for prefix in self.loggers)
+
+    def _sweep(self, now: float) -> None:
+        """Forget windows idle for two periods; their templates start afresh"""
+        self._windows = {
+            key: window for key, window in self._windows.items()
+            if now - window[0] < 2 * self.window_seconds
+        }
+        self._next_sweep = now + self.window_seconds
+
+
+def setup_logging(
+    config: Optional[LoggingConfig] = None,
+    debug: bool = False,
+    log_to_file: bool = True,
+    log_to_console: bool = True
+) -> None:
+    """Route all logging through a queue drained by a background listener
+
+    Callers only enqueue the record; file and terminal writes happen on
+    the listener thread.
+    """
+    global _listener
+    config = config or LoggingConfig()
+    shutdown_logging()
+
+    handlers: List[logging.Handler] = []
+    if log_to_file:
+        handlers.append(_file_handler(config))
+    if log_to_console:
+        console = logging.StreamHandler()
+        console.setFormatter(logging.Formatter(LOG_FORMAT))
+        handlers.append(console)
+
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    if config.sample_burst > 0:
+        queue_handler.addFilter(
+            RateLimitFilter(config.sample_burst, config.sample_window_seconds, config.sample_loggers)
+        )
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    root.setLevel(logging.DEBUG if debug else logging.INFO)
+
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and stop the listener thread"""
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
+
+
+def _file_handler(config: LoggingConfig) -> logging.Handler:
+    """Rotating file handler per config"""
+    path = Path(config.path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    if config.rotation == "time":
+        handler: logging.Handler = logging.handlers.TimedRotatingFileHandler(
+            path, when=config.rotate_when, backupCount=config.backup_count
+        )
+    else:
+        handler = logging.handlers.RotatingFileHandler(
+            path, maxBytes=config.max_bytes, backupCount=config.backup_count
+        )
+
+    handler.setFormatter(JsonLinesFormatter() if config.json_lines else logging.Formatter(LOG_FORMAT))
+    return handler
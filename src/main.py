@@ -1,100 +1,514 @@
 """Main orchestrator for Solana token scraper"""
 import sys
+import math
 import time
 import signal
 import logging
 import argparse
+import contextlib
+from functools import partial
 from pathlib import Path
 from datetime import datetime
-from rich.live import Live
-from src.config_manager import ConfigManager
-from src.dexscreener_client import DexScreenerClient
-from src.token_filter import TokenFilter
+from typing import TYPE_CHECKING, ContextManager, Iterator, List, Optional, Tuple
+from src.config_manager import ConfigManager, ScraperConfig
+from src.logging_config import setup_logging, shutdown_logging
+from src.dexscreener_client import DexScreenerClient, HttpPool, TokenData
+from src.token_filter import TokenFilter, TokenScore, now_ms
 from src.token_cache import TokenCache
 from src.dashboard import Dashboard, MatchedToken
+from src.pipeline import Pipeline, Stage, StageStats
+from src.pair_aggregator import aggregate_pools
+from src.hot_scheduler import HotPairScheduler, RequestBudget
+from src.scan_scheduler import FixedRateScheduler
+from src.score_cache import ScoreCache, ScoreCacheStats
+from src.address import KEY_SIZE
+from src.address_index import AddressIndex
+from src.anomaly_detector import AnomalyDetector, AnomalyEvent
+from src.leaderboard import Leaderboard
+
+if TYPE_CHECKING:
+    from src.coordination import WorkerCoordinator, WorkerStats
+    from src.history_store import HistoryStore
+    from src.live_feed import LiveFeed
+    from src.memory_profiler import MemoryProfiler
 
 
-# Ensure logs directory exists
-Path('logs').mkdir(exist_ok=True)
+logger = logging.getLogger(__name__)
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('logs/scraper.log'),
-        logging.StreamHandler()
-    ]
-)
 
-logger = logging.getLogger(__name__)
+class ChainScanner:
+    """Per-chain client, filters, caches and dedup namespace
+
+    HTTP pooling, the request budget and scan scheduling belong to the
+    orchestrator and are shared by every chain.
+    """
+
+    def __init__(self, chain_id: str, config: ScraperConfig, http: HttpPool, budget: RequestBudget):
+        self.chain_id = chain_id
+        self.config = config
+        self.client = DexScreenerClient(chain=chain_id, http=http)
+        self.token_filter = TokenFilter(config)
+        self.score_cache = ScoreCache(self.token_filter, config, config.score_cache_size)
+        self.cache = TokenCache()
+        self.hot_scheduler = HotPairScheduler(config.hot_scan, budget)
+        self.blocklist = AddressIndex(config.blocklist_path) if config.blocklist_path else None
+        self.allowlist = AddressIndex(config.allowlist_path) if config.allowlist_path else None
+        self.anomaly_detector = AnomalyDetector(config.anomaly) if config.anomaly.enabled else None
+        self.pipeline: Optional[Pipeline] = None
+        for index in (self.blocklist, self.allowlist):
+            # Solana lists are base58; other DexScreener chains here are EVM 0x lists
+            if index is not None and (index.key_size == KEY_SIZE) != (chain_id == "solana"):
+                logger.warning(
+                    "%s uses %d-byte keys, which never match %s addresses; "
+                    "build it with --format %s",
+                    index.path, index.key_size, chain_id, "base58" if chain_id == "solana" else "hex"
+                )
+
+    def close(self) -> None:
+        for index in (self.blocklist, self.allowlist):
+            if index is not None:
+                index.close()
+        self.blocklist = self.allowlist = None
 
 
 class SolanaScraperOrchestrator:
     """Main orchestrator for the scraper"""
 
-    def __init__(self, config_path: Path):
+    def __init__(
+        self,
+        config_path: Path,
+        memory_profile: bool = False,
+        worker: bool = False,
+        worker_id: Optional[str] = None
+    ):
         self.config = ConfigManager.load(config_path)
-        self.client = DexScreenerClient()
-        self.token_filter = TokenFilter(self.config)
-        self.cache = TokenCache()
-        self.dashboard = Dashboard()
+        # Started first so the components below are traced too
+        self.memory_profiler: Optional["MemoryProfiler"] = None
+        if memory_profile or self.config.memory_profile.enabled:
+            from src.memory_profiler import MemoryProfiler
+            self.memory_profiler = MemoryProfiler(self.config.memory_profile)
+            self.memory_profiler.start()
+
+        self.http = HttpPool()
+        self.dashboard = Dashboard(Leaderboard(self.config.leaderboard))
+        self.budget = RequestBudget(self.config.hot_scan.max_requests_per_minute)
+        self.scan_scheduler = FixedRateScheduler(self.config.scan_interval_seconds)
+        # Needed by the chain pipelines when sharding by address
+        self.coordinator: Optional["WorkerCoordinator"] = None
+        if worker or worker_id or self.config.worker.enabled:
+            from src.coordination import WorkerCoordinator, WorkerStats
+            worker_config = self.config.worker
+            if worker_id:
+                worker_config = worker_config.model_copy(update={"worker_id": worker_id})
+            self.coordinator = WorkerCoordinator(worker_config)
+        self.chains = [self._build_chain(chain_id) for chain_id in self.config.chains]
+        self._chains_by_id = {chain.chain_id: chain for chain in self.chains}
+        self._hot_turn = 0
+
+        # Shortcuts to the first chain, which verify mode looks tokens up on
+        primary = self.chains[0]
+        self.client = primary.client
+        self.token_filter = primary.token_filter
+        self.score_cache = primary.score_cache
+        self.cache = primary.cache
+        self.hot_scheduler = primary.hot_scheduler
+
+        self._anomalies: List[AnomalyEvent] = []
+        self.history: Optional["HistoryStore"] = None
+        if self.config.history.enabled:
+            from src.history_store import HistoryStore
+            self.history = HistoryStore(self.config.history.path)
+        self._history_buffer: List[Tuple[TokenData, Optional[TokenScore]]] = []
+        self.live_feed: Optional["LiveFeed"] = None
+        if self.config.live_feed.enabled:
+            from src.live_feed import LiveFeed
+            self.live_feed = LiveFeed(self.config.live_feed)
+        self._worker_stats: Optional["WorkerStats"] = None
         self.running = True
+        self._scanned_count = 0
+        self._duplicate_count = 0
+        self._blocked_count = 0
+        self._reference_ms = now_ms()
+        if self.memory_profiler is not None:
+            self._register_memory_subsystems(self.memory_profiler)
 
         # Setup graceful shutdown
         signal.signal(signal.SIGINT, self._handle_shutdown)
 
+    def _build_chain(self, chain_id: str) -> ChainScanner:
+        """Chain state plus its scan pipeline, using the chain's config overrides"""
+        chain = ChainScanner(chain_id, self.config.for_chain(chain_id), self.http, self.budget)
+
+        stages = [
+            Stage("parse", partial(self._parse_stage, chain)),
+        ]
+        if self.coordinator is not None and self.config.worker.shard_by == "address":
+            # Every pool of a token hashes alike, so sharding before aggregation is safe
+            stages.append(Stage("shard", self._shard_stage))
+        if chain.blocklist is not None:
+            # Per pair, so a listed pool is dropped before its totals are merged
+            stages.append(Stage("pool_blocklist", partial(self._pool_blocklist_stage, chain)))
+        stages.append(Stage("aggregate", self._aggregate_stage))
+        if chain.blocklist is not None:
+            stages.append(Stage("blocklist", partial(self._blocklist_stage, chain)))
+        # Before dedup so tokens already shown keep being watched
+        if chain.anomaly_detector is not None:
+            stages.append(Stage("anomaly", partial(self._anomaly_stage, chain)))
+        stages += [
+            Stage("dedup", partial(self._dedup_stage, chain)),
+            Stage("score", partial(self._score_stage, chain)),
+        ]
+        chain.pipeline = Pipeline(stages, maxsize=self.config.pipeline_queue_size)
+        return chain
+
     def run(self) -> None:
         """Run the main scan loop with live dashboard"""
+        from rich.live import Live
+
         logger.info("Starting Solana Token Scraper")
 
+        if self.live_feed is not None:
+            self.live_feed.start()
+
+        scheduler = self.scan_scheduler
+        scheduler.start()
+
         with Live(self.dashboard.render(0), refresh_per_second=1) as live:
             while self.running:
-                # Perform scan
-                self._scan_once()
-
-                # Wait for next scan
-                for remaining in range(self.config.scan_interval_seconds, 0, -1):
-                    if not self.running:
-                        break
-                    live.update(self.dashboard.render(remaining))
-                    time.sleep(1)
+                # Perform scan on its fixed-rate deadline
+                scheduler.begin_tick()
+                with self._measure("scan"):
+                    self._scan_once()
+                scheduler.end_tick()
+                self.dashboard.update_schedule_stats(scheduler.stats)
+                if self.memory_profiler is not None:
+                    self.memory_profiler.sample()
+
+                # Wait out the rest of the period, re-fetching hot pairs meanwhile
+                while self.running and scheduler.remaining() > 0:
+                    with self._measure("hot_refresh"):
+                        self._refresh_hot_pairs(deadline=scheduler.deadline)
+                    with self._measure("render"):
+                        live.update(self.dashboard.render(math.ceil(scheduler.remaining())))
+                    time.sleep(min(1.0, scheduler.remaining()))
 
         logger.info("Scraper stopped")
+        self.close()
         self._print_summary()
 
-    def _scan_once(self) -> None:
-        """Perform single scan cycle"""
-        try:
-            # Fetch tokens from API
-            tokens = self.client.fetch_solana_tokens()
-
-            scanned_count = len(tokens)
-            duplicate_count = 0
+    def _scan_once(self, deadline: Optional[float] = None) -> None:
+        """Perform single scan cycle over every chain
+
+        deadline is a time.monotonic() value after which the fetch is
+        cancelled and any unprocessed tokens are dropped; it defaults to
+        scan_deadline_seconds (or the scan interval) from now and is
+        shared by all chains in the cycle.
+        """
+        if deadline is None:
+            budget_seconds = self.config.scan_deadline_seconds or self.config.scan_interval_seconds
+            deadline = time.monotonic() + budget_seconds
+
+        self._coordinate()
+        for chain in self._owned_chains():
+            if time.monotonic() > deadline:
+                logger.warning("Scan deadline reached before %s, skipping it", chain.chain_id)
+                self.dashboard.record_truncated_scan()
+                break
+            self._scan_chain(chain, deadline)
+
+        self.dashboard.update_queue_stats(self._queue_stats())
+        self.dashboard.update_cache_stats(self._cache_stats())
+        self._publish_stats()
+
+    def _scan_chain(self, chain: ChainScanner, deadline: float) -> None:
+        """Bulk scan of one chain through its pipeline"""
+        self._scanned_count = 0
+        self._duplicate_count = 0
+        self._blocked_count = 0
+        self._reference_ms = now_ms()
+
+        # The bulk call always happens; it is charged to the shared budget
+        self.budget.consume()
 
-            # Process each token
-            for token in tokens:
-                # Check if already seen
-                if self.cache.has_seen(token.address):
-                    duplicate_count += 1
-                    continue
-
-                # Mark as seen immediately
-                self.cache.mark_seen(token.address)
+        try:
+            # fetch -> parse -> aggregate -> dedup -> score run in pipeline threads,
+            # emit runs here so a slow dashboard backs up the stages
+            pairs = chain.client.iter_pairs(deadline=deadline)
+            for token, score in chain.pipeline.run(pairs, deadline=deadline):
+                self._emit_match(token, score)
 
-                # Score token
-                score = self.token_filter.score_token(token)
+        except Exception as e:
+            logger.error("Scan failed on %s: %s", chain.chain_id, e)
+
+        # The pipeline stops itself at the deadline, matches or not
+        if chain.pipeline.timed_out:
+            logger.warning("Scan deadline reached, truncated scan of %s", chain.chain_id)
+            self.dashboard.record_truncated_scan()
+
+        self._emit_anomalies()
+        self._flush_history(self._reference_ms)
+        self.dashboard.update_stats(self._scanned_count, self._duplicate_count, self._blocked_count)
+
+    def _parse_stage(self, chain: ChainScanner, pairs: Iterator[dict]) -> Iterator[TokenData]:
+        """Parse raw pairs into tokens, skipping malformed ones"""
+        for pair in pairs:
+            token = chain.client.parse_pair(pair)
+            if token is not None:
+                yield token
+
+    def _shard_stage(self, tokens: Iterator[TokenData]) -> Iterator[TokenData]:
+        """Keep only tokens in this worker's share"""
+        owns = self.coordinator.owns
+        for token in tokens:
+            if owns(token.key):
+                yield token
 
-                if score and score.passed:
-                    # Add to dashboard
-                    matched = MatchedToken(token=token, score=score)
-                    self.dashboard.add_match(matched)
-                    logger.info(f"Match found: {token.symbol} - Score: {score.total_score}")
+    def _aggregate_stage(self, tokens: Iterator[TokenData]) -> Iterator[TokenData]:
+        """Merge each token's pools into one entry, once the response is parsed"""
+        for token in aggregate_pools(tokens):
+            self._scanned_count += 1
+            yield token
 
-            # Update stats
-            self.dashboard.update_stats(scanned_count, duplicate_count)
+    def _pool_blocklist_stage(self, chain: ChainScanner, tokens: Iterator[TokenData]) -> Iterator[TokenData]:
+        """Drop pairs whose pool address is on the blocklist"""
+        for token in tokens:
+            if (
+                token.pair_address is not None
+                and token.pair_address in chain.blocklist
+                and not (chain.allowlist is not None and token.key in chain.allowlist)
+            ):
+                self._blocked_count += 1
+                continue
+            yield token
+
+    def _blocklist_stage(self, chain: ChainScanner, tokens: Iterator[TokenData]) -> Iterator[TokenData]:
+        """Drop merged tokens whose address is on the blocklist"""
+        for token in tokens:
+            if chain.allowlist is not None and token.key in chain.allowlist:
+                yield token
+                continue
+            if token.key in chain.blocklist:
+                self._blocked_count += 1
+                continue
+            yield token
+
+    def _anomaly_stage(self, chain: ChainScanner, tokens: Iterator[TokenData]) -> Iterator[TokenData]:
+        """Update per-token statistics and collect flagged moves"""
+        matched_only = chain.config.anomaly.matched_only
+        for token in tokens:
+            for event in chain.anomaly_detector.observe(token, self._reference_ms):
+                if event.matched or not matched_only:
+                    self._anomalies.append(event)
+            yield token
 
+    def _dedup_stage(self, chain: ChainScanner, tokens: Iterator[TokenData]) -> Iterator[TokenData]:
+        """Drop tokens already seen on this chain this session"""
+        for token in tokens:
+            if chain.cache.has_seen(token.key):
+                self._duplicate_count += 1
+                continue
+
+            # Mark as seen immediately
+            chain.cache.mark_seen(token.key)
+            yield token
+
+    def _score_stage(
+        self,
+        chain: ChainScanner,
+        tokens: Iterator[TokenData]
+    ) -> Iterator[Tuple[TokenData, TokenScore]]:
+        """Score tokens and pass on only those that match"""
+        for token in tokens:
+            score = chain.score_cache.score(token, self._reference_ms)
+            if self.history is not None:
+                self._history_buffer.append((token, score))
+            if score and score.passed:
+                yield token, score
+            elif chain.config.hot_scan.enabled:
+                # Not a match yet; young pairs get re-fetched on the fast cadence
+                chain.hot_scheduler.track(token, score, self._reference_ms)
+
+    def _refresh_hot_pairs(self, deadline: Optional[float] = None) -> None:
+        """Re-fetch due hot pairs individually and emit any that now match"""
+        self._coordinate()
+        enabled = [chain for chain in self._owned_chains() if chain.config.hot_scan.enabled]
+        if not enabled:
+            return
+
+        # Rotate which chain draws on the shared budget first
+        self._hot_turn = (self._hot_turn + 1) % len(enabled)
+        for chain in enabled[self._hot_turn:] + enabled[:self._hot_turn]:
+            self._refresh_chain_hot_pairs(chain, deadline)
+
+        self._flush_history(now_ms())
+        self.dashboard.update_hot_stats(
+            sum(len(chain.hot_scheduler) for chain in self.chains),
+            sum(chain.hot_scheduler.refreshes for chain in self.chains)
+        )
+
+    def _refresh_chain_hot_pairs(self, chain: ChainScanner, deadline: Optional[float]) -> None:
+        for tracked in chain.hot_scheduler.due():
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+            try:
+                if tracked.pool_count > 1:
+                    # A single pair would lose the other pools' totals
+                    token = chain.client.fetch_tokens([tracked.address]).get(tracked.address)
+                else:
+                    token = chain.client.fetch_pair(tracked.pair_address, deadline=deadline)
+            except Exception as e:
+                logger.error("Hot refresh failed for %s: %s", tracked.address, e)
+                continue
+
+            if token is None:
+                continue
+
+            reference_ms = now_ms()
+            score = chain.score_cache.score(token, reference_ms)
+            if self.history is not None:
+                self._history_buffer.append((token, score))
+            if score and score.passed:
+                chain.hot_scheduler.untrack(token.key)
+                self._emit_match(token, score)
+            else:
+                chain.hot_scheduler.track(token, score, reference_ms)
+
+    def _owned_chains(self) -> List[ChainScanner]:
+        """Chains this process scans; all of them unless sharding by chain"""
+        if self.coordinator is None or self.config.worker.shard_by != "chain":
+            return self.chains
+        return [chain for chain in self.chains if self.coordinator.owns(chain.chain_id)]
+
+    def _coordinate(self) -> None:
+        """Heartbeat in worker mode and hand off hot pairs outside the new share"""
+        if self.coordinator is None or not self.coordinator.heartbeat():
+            return
+
+        owned = self._owned_chains()
+        by_address = self.config.worker.shard_by == "address"
+        dropped = 0
+        for chain in self.chains:
+            if chain not in owned:
+                dropped += chain.hot_scheduler.retain(lambda key: False)
+            elif by_address:
+                dropped += chain.hot_scheduler.retain(self.coordinator.owns)
+        logger.info(
+            "Rebalanced across %d workers, handed off %d hot pairs",
+            len(self.coordinator.workers), dropped
+        )
+
+    def _flush_history(self, scan_ms: int) -> None:
+        """Write buffered evaluations to the history store in one batch"""
+        if self.history is None or not self._history_buffer:
+            return
+
+        rows, self._history_buffer = self._history_buffer, []
+        try:
+            self.history.record_scan(scan_ms, rows)
         except Exception as e:
-            logger.error(f"Scan failed: {e}")
+            logger.error("History write failed: %s", e)
+
+    def close(self) -> None:
+        """Release resources held by the orchestrator"""
+        if self.history is not None:
+            self.history.close()
+            self.history = None
+        for chain in self.chains:
+            chain.close()
+        self.http.close()
+        if self.coordinator is not None:
+            self.coordinator.close()
+            self._worker_stats = self.coordinator.stats
+            self.coordinator = None
+        if self.live_feed is not None:
+            self.live_feed.stop()
+        if self.memory_profiler is not None:
+            self.memory_profiler.stop()
+            logger.info("Memory report written to %s", self.config.memory_profile.report_path)
+            self.memory_profiler = None
+
+    def _queue_stats(self) -> List[StageStats]:
+        """Pipeline queue depths, prefixed by chain when scanning several"""
+        if len(self.chains) == 1:
+            return self.chains[0].pipeline.stats()
+        return [
+            stats.model_copy(update={"name": f"{chain.chain_id}:{stats.name}"})
+            for chain in self.chains
+            for stats in chain.pipeline.stats()
+        ]
+
+    def _cache_stats(self) -> ScoreCacheStats:
+        """Score cache counters summed over chains"""
+        if len(self.chains) == 1:
+            return self.chains[0].score_cache.stats
+        totals = ScoreCacheStats()
+        for chain in self.chains:
+            for field in ScoreCacheStats.model_fields:
+                setattr(totals, field, getattr(totals, field) + getattr(chain.score_cache.stats, field))
+        return totals
+
+    def _measure(self, scope: str) -> ContextManager[None]:
+        """Memory accounting for a block when profiling, else a no-op"""
+        if self.memory_profiler is None:
+            return contextlib.nullcontext()
+        return self.memory_profiler.measure(scope)
+
+    def _register_memory_subsystems(self, profiler: "MemoryProfiler") -> None:
+        """Entry counts of every structure that lives across scans, summed over chains"""
+        chains = self.chains
+        profiler.register("token_cache", lambda: sum(chain.cache.size() for chain in chains))
+        profiler.register("score_cache", lambda: sum(len(chain.score_cache) for chain in chains))
+        profiler.register("dashboard_matches", lambda: len(self.dashboard.matches))
+        profiler.register("leaderboard", lambda: len(self.dashboard.leaderboard))
+        profiler.register("history_buffer", lambda: len(self._history_buffer))
+        profiler.register("hot_tracked", lambda: sum(len(chain.hot_scheduler) for chain in chains))
+        profiler.register("hot_heap", lambda: sum(chain.hot_scheduler.heap_size() for chain in chains))
+        profiler.register("anomaly_tokens", lambda: sum(
+            len(chain.anomaly_detector) for chain in chains if chain.anomaly_detector is not None
+        ))
+
+    def _emit_anomalies(self) -> None:
+        """Publish anomalies flagged during the scan to the dashboard, log and feed"""
+        events, self._anomalies = self._anomalies, []
+        for event in events:
+            self.dashboard.add_anomaly(event)
+            change = f"{event.change_pct:+.0f}%" if event.change_pct is not None else "n/a"
+            logger.warning(
+                "Anomaly: %s %s %s (value %.0f, baseline %.0f, %s)",
+                event.kind, event.symbol, event.address, event.value, event.baseline, change
+            )
+            if self.live_feed is not None:
+                self.live_feed.publish("anomaly", event.model_dump())
+
+    def _emit_match(self, token: TokenData, score: TokenScore) -> None:
+        """Publish a matched token to the dashboard and log"""
+        if self.coordinator is not None and not self.coordinator.claim_match(token.chain_id, token.address):
+            logger.debug("Match %s already alerted by another worker", token.address)
+            return
+        matched = MatchedToken(token=token, score=score)
+        self.dashboard.add_match(matched)
+        chain = self._chains_by_id.get(token.chain_id)
+        if chain is not None and chain.anomaly_detector is not None:
+            chain.anomaly_detector.mark_matched(token.key)
+        logger.info("Match found: %s - Score: %s", token.symbol, score.total_score)
+        if self.live_feed is not None:
+            from src.live_feed import match_event
+            self.live_feed.publish("match", match_event(token, score, now_ms()))
+
+    def _publish_stats(self) -> None:
+        """Send session totals to live feed viewers"""
+        if self.live_feed is None:
+            return
+        dashboard = self.dashboard
+        self.live_feed.publish("stats", {
+            "total_scanned": dashboard.total_scanned,
+            "total_matches": dashboard.total_matches,
+            "total_duplicates": dashboard.total_duplicates,
+            "total_blocked": dashboard.total_blocked,
+            "hot_tracked": dashboard.hot_tracked,
+            "viewers": self.live_feed.stats.clients,
+            "ts_ms": now_ms(),
+        })
 
     def _handle_shutdown(self, signum, frame) -> None:
         """Handle graceful shutdown"""
@@ -109,36 +523,64 @@ class SolanaScraperOrchestrator:
         print(f"Total tokens scanned: {self.dashboard.total_scanned}")
         print(f"Total matches found: {self.dashboard.total_matches}")
         print(f"Total duplicates filtered: {self.dashboard.total_duplicates}")
+        cache_stats = self._cache_stats()
+        print(
+            f"Score cache hit rate: {cache_stats.hit_rate:.1%} "
+            f"({cache_stats.hits} hits, {cache_stats.misses} misses)"
+        )
+        detectors = [chain.anomaly_detector for chain in self.chains if chain.anomaly_detector is not None]
+        if detectors:
+            print(
+                f"Anomalies flagged: {sum(detector.flagged for detector in detectors)} "
+                f"({self.dashboard.total_anomalies} surfaced)"
+            )
+        stats = self.scan_scheduler.stats
+        if stats.ticks:
+            print(
+                f"Scan jitter: mean {stats.mean_jitter_ms:.0f}ms, max {stats.max_jitter_ms:.0f}ms | "
+                f"late ticks: {stats.late_ticks} | skipped ticks: {stats.skipped_ticks} | "
+                f"truncated scans: {self.dashboard.truncated_scans}"
+            )
+        if self.live_feed is not None:
+            feed_stats = self.live_feed.stats
+            print(f"Live feed: {feed_stats.published} events, {feed_stats.dropped_clients} slow viewers dropped")
+        if self._worker_stats is not None:
+            worker_stats = self._worker_stats
+            print(
+                f"Workers: {worker_stats.workers} | rebalances: {worker_stats.rebalances} | "
+                f"matches claimed: {worker_stats.claims_won} | left to other workers: {worker_stats.claims_lost}"
+            )
         print("="*60)
 
-    def verify_token(self, address: str) -> None:
-        """Verify a specific token against filters"""
-        print(f"\nVerifying token: {address}\n")
+    def verify_tokens(self, addresses: List[str]) -> None:
+        """Verify specific tokens against filters"""
+        tokens = self.client.fetch_tokens(addresses)
+        reference_ms = now_ms()
 
-        tokens = self.client.fetch_solana_tokens()
+        for address in addresses:
+            print(f"\nVerifying token: {address}\n")
 
-        for token in tokens:
-            if token.address == address:
-                print(f"Token found: {token.name} ({token.symbol})")
-                print(f"Liquidity: ${token.liquidity_usd:,.2f}")
-                print(f"Maker count: {token.maker_count}")
-                print(f"Age: {datetime.now() - token.created_at}")
-
-                score = self.token_filter.score_token(token)
-
-                if score:
-                    print(f"\nScore Breakdown:")
-                    print(f"  Age score: {score.age_score}")
-                    print(f"  Volume score: {score.volume_score}")
-                    print(f"  Momentum score: {score.momentum_score}")
-                    print(f"  Total: {score.total_score}")
-                    print(f"\nResult: {'✅ PASS' if score.passed else '❌ FAIL'}")
-                else:
-                    print("\nResult: ❌ FAIL (hard filter)")
+            token = tokens.get(address)
+            if token is None:
+                print("Token not found in current DexScreener data")
+                continue
+
+            print(f"Token found: {token.name} ({token.symbol})")
+            print(f"Liquidity: ${token.liquidity_usd:,.2f}")
+            print(f"Maker count: {token.maker_count}")
+            print(f"Age: {datetime.now() - token.created_at}")
 
-                return
+            score = self.token_filter.score_token(token, reference_ms)
 
-        print("Token not found in current DexScreener data")
+            if score:
+                print(f"\nScore Breakdown:")
+                print(f"  Age score: {score.age_score}")
+                print(f"  Volume score: {score.volume_score}")
+                print(f"  Momentum score: {score.momentum_score}")
+                print(f"  Total: {score.total_score}")
+                print(f"\nResult: {'✅ PASS' if score.passed else '❌ FAIL'}")
+            else:
+                print("\nResult: ❌ FAIL (hard filter)")
 
 
 def main():
@@ -160,37 +602,76 @@ def main():
         action="store_true",
         help="Run once and show stats only (no dashboard)"
     )
+    parser.add_argument(
+        "--memory-profile",
+        action="store_true",
+        help="Write periodic tracemalloc diffs and subsystem sizes to the memory report"
+    )
+    parser.add_argument(
+        "--worker",
+        action="store_true",
+        help="Run as one of several sharded workers coordinated through worker.store_url"
+    )
+    parser.add_argument(
+        "--worker-id",
+        metavar="ID",
+        help="Stable worker name (implies --worker; default: host-pid)"
+    )
     parser.add_argument(
         "--verify-token",
-        type=str,
-        help="Verify specific token address against filters"
+        nargs="+",
+        metavar="ADDRESS",
+        help="Verify one or more token addresses against filters"
     )
 
     args = parser.parse_args()
 
-    # Set log level
-    if args.debug:
-        logging.getLogger().setLevel(logging.DEBUG)
-
     # Check config exists
     if not args.config.exists():
-        logger.error(f"Config file not found: {args.config}")
+        logger.error("Config file not found: %s", args.config)
         sys.exit(1)
 
-    orchestrator = SolanaScraperOrchestrator(args.config)
+    # Verification is a one-off lookup and does not need the log file;
+    # the dashboard owns the terminal, so it only logs to file
+    config = ConfigManager.load(args.config)
+    setup_logging(
+        config.logging,
+        debug=args.debug,
+        log_to_file=not args.verify_token,
+        log_to_console=bool(args.verify_token or args.dry_run)
+    )
+
+    try:
+        _run_mode(args)
+    finally:
+        shutdown_logging()
 
-    # Handle special modes
-    if args.verify_token:
-        orchestrator.verify_token(args.verify_token)
-        return
 
-    if args.dry_run:
-        orchestrator._scan_once()
-        orchestrator._print_summary()
-        return
+def _run_mode(args: argparse.Namespace) -> None:
+    """Dispatch to the selected CLI mode"""
+    orchestrator = SolanaScraperOrchestrator(
+        args.config,
+        memory_profile=args.memory_profile,
+        # Verifying tokens must not take a share of the work
+        worker=args.worker and not args.verify_token,
+        worker_id=None if args.verify_token else args.worker_id
+    )
 
-    # Normal run
-    orchestrator.run()
+    try:
+        # Handle special modes
+        if args.verify_token:
+            orchestrator.verify_tokens(args.verify_token)
+        elif args.dry_run:
+            orchestrator._scan_once()
+            orchestrator.close()
+            orchestrator._print_summary()
+        else:
+            # Normal run
+            orchestrator.run()
+    finally:
+        # Every mode, and errors too, must release stores, sockets and indexes;
+        # close() is a no-op for whatever is already closed
+        orchestrator.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,195 @@
+"""Opt-in tracemalloc instrumentation for long-running sessions"""
+import contextlib
+import time
+import tracemalloc
+from typing import Callable, Dict, Iterator, List, Optional
+from pydantic import BaseModel
+from src.config_manager import MemoryProfileConfig
+
+
+# Allocation sites that belong to the instrumentation itself
+_IGNORED = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+class ScopeStats(BaseModel):
+    """Allocations made inside one instrumented call site"""
+    calls: int = 0
+    retained_bytes: int = 0
+    max_peak_bytes: int = 0
+
+
+class MemorySample(BaseModel):
+    """One interval of memory accounting"""
+    index: int
+    uptime_seconds: float
+    rss_bytes: Optional[int] = None
+    traced_bytes: int
+    traced_peak_bytes: int
+    subsystems: Dict[str, int]
+    scopes: Dict[str, ScopeStats]
+    top_growth: List[str]
+
+
+def rss_bytes() -> Optional[int]:
+    """Resident set size from /proc (Linux), None elsewhere"""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    import resource
+    return pages * resource.getpagesize()
+
+
+class MemoryProfiler:
+    """Periodic tracemalloc snapshots, subsystem sizes and scope accounting
+
+    Each sample diffs a snapshot against the previous one, grouped by
+    allocation line, and appends the largest growth to a text report
+    alongside registered subsystem sizes (entries, not bytes) and the
+    memory retained by measured scopes such as a scan or a render.
+    Growth that persists across samples points at the leak.
+    """
+
+    def __init__(self, config: MemoryProfileConfig, clock: Callable[[], float] = time.monotonic):
+        self.config = config
+        self._clock = clock
+        self._started = clock()
+        self._last_sample = self._started
+        self._sizes: Dict[str, Callable[[], int]] = {}
+        self._previous_sizes: Dict[str, int] = {}
+        self._scopes: Dict[str, ScopeStats] = {}
+        self._snapshot: Optional[tracemalloc.Snapshot] = None
+        self._previous_rss: Optional[int] = None
+        self._previous_traced = 0
+        self._owns_tracing = False
+        self.samples = 0
+
+    def start(self) -> None:
+        """Begin tracing and take the baseline snapshot"""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.config.frames)
+            self._owns_tracing = True
+        self._snapshot = self._take_snapshot()
+        self._previous_rss = rss_bytes()
+        self._previous_traced = tracemalloc.get_traced_memory()[0]
+        self.config.report_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.config.report_path, "a") as f:
+            f.write(f"=== memory profile started {time.strftime('%Y-%m-%d %H:%M:%S')} "
+                    f"(interval {self.config.interval_seconds}s, {self.config.frames} frames) ===\n")
+
+    def stop(self) -> None:
+        """Write a final sample and stop tracing"""
+        if self._snapshot is None:
+            return
+        self.sample(force=True)
+        self._snapshot = None
+        if self._owns_tracing:
+            tracemalloc.stop()
+            self._owns_tracing = False
+
+    def register(self, name: str, size: Callable[[], int]) -> None:
+        """Report size() (e.g. entry count) for a subsystem in every sample"""
+        self._sizes[name] = size
+
+    @contextlib.contextmanager
+    def measure(self, scope: str) -> Iterator[None]:
+        """Account memory retained and peak allocation inside a block"""
+        if not tracemalloc.is_tracing():
+            yield
+            return
+
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        try:
+            yield
+        finally:
+            after, peak = tracemalloc.get_traced_memory()
+            stats = self._scopes.setdefault(scope, ScopeStats())
+            stats.calls += 1
+            stats.retained_bytes += after - before
+            stats.max_peak_bytes = max(stats.max_peak_bytes, peak - before)
+
+    def sample(self, force: bool = False) -> Optional[MemorySample]:
+        """Snapshot and append a diff to the report if the interval has elapsed"""
+        now = self._clock()
+        if self._snapshot is None or (not force and now - self._last_sample < self.config.interval_seconds):
+            return None
+
+        snapshot = self._take_snapshot()
+        growth = [
+            stat for stat in snapshot.compare_to(self._snapshot, "lineno")
+            if stat.size_diff > 0
+        ][:self.config.top_n]
+        traced, peak = tracemalloc.get_traced_memory()
+
+        self.samples += 1
+        result = MemorySample(
+            index=self.samples,
+            uptime_seconds=now - self._started,
+            rss_bytes=rss_bytes(),
+            traced_bytes=traced,
+            traced_peak_bytes=peak,
+            subsystems={name: size() for name, size in self._sizes.items()},
+            scopes={name: stats.model_copy() for name, stats in self._scopes.items()},
+            top_growth=[
+                f"{_format_bytes(stat.size_diff, signed=True)} ({stat.count_diff:+d} blocks) {stat.traceback[0]}"
+                for stat in growth
+            ],
+        )
+        self._write(result)
+
+        self._snapshot = snapshot
+        self._last_sample = now
+        self._previous_rss = result.rss_bytes
+        self._previous_traced = traced
+        self._previous_sizes = dict(result.subsystems)
+        self._scopes = {}
+        return result
+
+    def _take_snapshot(self) -> tracemalloc.Snapshot:
+        return tracemalloc.take_snapshot().filter_traces(_IGNORED)
+
+    def _write(self, sample: MemorySample) -> None:
+        lines = [f"--- sample {sample.index} | {time.strftime('%Y-%m-%d %H:%M:%S')} "
+                 f"| uptime {sample.uptime_seconds:.0f}s ---"]
+
+        memory = f"traced {_format_bytes(sample.traced_bytes)} " \
+                 f"({_format_bytes(sample.traced_bytes - self._previous_traced, signed=True)}), " \
+                 f"peak {_format_bytes(sample.traced_peak_bytes)}"
+        if sample.rss_bytes is not None:
+            rss_diff = sample.rss_bytes - (self._previous_rss or sample.rss_bytes)
+            memory = f"RSS {_format_bytes(sample.rss_bytes)} ({_format_bytes(rss_diff, signed=True)}) | " + memory
+        lines.append(memory)
+
+        if sample.subsystems:
+            lines.append("subsystems: " + " | ".join(
+                f"{name} {size} ({size - self._previous_sizes.get(name, size):+d})"
+                for name, size in sample.subsystems.items()
+            ))
+        for name, stats in sample.scopes.items():
+            lines.append(
+                f"scope {name}: {stats.calls} calls, retained "
+                f"{_format_bytes(stats.retained_bytes, signed=True)}, max peak {_format_bytes(stats.max_peak_bytes)}"
+            )
+        if sample.top_growth:
+            lines.append("top growth since last sample:")
+            lines.extend(f"  {line}" for line in sample.top_growth)
+
+        with open(self.config.report_path, "a") as f:
+            f.write("\n".join(lines) + "\n")
+
+
+def _format_bytes(size: int, signed: bool = False) -> str:
+    sign = ("+" if size >= 0 else "-") if signed else ("-" if size < 0 else "")
+    size = abs(size)
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{sign}{size:.0f} {unit}" if unit == "B" else f"{sign}{size:.1f} {unit}"
+        size /= 1024
+    return f"{sign}{size:.1f} GB"
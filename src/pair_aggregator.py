@@ -0,0 +1,77 @@
+"""Single-pass hash aggregation of a token's pools"""
+from typing import TYPE_CHECKING, Dict, Iterable, List
+
+from src.address import AddressKey
+
+if TYPE_CHECKING:
+    from src.dexscreener_client import TokenData
+
+
+class _PoolGroup:
+    """Running totals for one base token"""
+
+    __slots__ = ("primary", "liquidity_usd", "volume_24h", "maker_count", "created_at_ms", "pool_count")
+
+    def __init__(self, token: "TokenData"):
+        self.primary = token
+        self.liquidity_usd = token.liquidity_usd
+        self.volume_24h = token.volume_24h
+        self.maker_count = token.maker_count
+        self.created_at_ms = token.created_at_ms
+        self.pool_count = 1
+
+    def add(self, token: "TokenData") -> None:
+        self.liquidity_usd += token.liquidity_usd
+        self.volume_24h += token.volume_24h
+        self.maker_count += token.maker_count
+        self.created_at_ms = min(self.created_at_ms, token.created_at_ms)
+        self.pool_count += 1
+        if token.liquidity_usd > self.primary.liquidity_usd:
+            self.primary = token
+
+
+class PairAggregator:
+    """Groups per-pair TokenData by base token in one pass
+
+    Liquidity, 24h volume and makers are summed across pools. Price,
+    momentum and the pair address come from the primary (deepest) pool,
+    and the token's age from its oldest pool, so a fresh pool on an old
+    token does not make it look new. Tokens keep first-seen order.
+    """
+
+    def __init__(self):
+        self._groups: Dict[AddressKey, _PoolGroup] = {}
+
+    def __len__(self) -> int:
+        return len(self._groups)
+
+    def add(self, token: "TokenData") -> None:
+        group = self._groups.get(token.key)
+        if group is None:
+            self._groups[token.key] = _PoolGroup(token)
+        else:
+            group.add(token)
+
+    def results(self) -> List["TokenData"]:
+        """One TokenData per base token; single-pool tokens are returned as-is"""
+        return [self._merge(group) for group in self._groups.values()]
+
+    @staticmethod
+    def _merge(group: _PoolGroup) -> "TokenData":
+        if group.pool_count == 1:
+            return group.primary
+        return group.primary.model_copy(update={
+            "liquidity_usd": group.liquidity_usd,
+            "volume_24h": group.volume_24h,
+            "maker_count": group.maker_count,
+            "created_at_ms": group.created_at_ms,
+            "pool_count": group.pool_count,
+        })
+
+
+def aggregate_pools(tokens: Iterable["TokenData"]) -> List["TokenData"]:
+    """Aggregate per-pair tokens into one entry per base token"""
+    aggregator = PairAggregator()
+    for token in tokens:
+        aggregator.add(token)
+    return aggregator.results()
@@ -0,0 +1,166 @@
+"""Streaming scan pipeline with bounded queues between stages"""
+import queue
+import threading
+import time
+from typing import Any, Callable, Iterable, Iterator, List, Optional
+from pydantic import BaseModel
+
+
+# Queue markers passed alongside regular items
+_DONE = object()
+
+
+class _Failure:
+    """Wraps an exception raised inside a stage thread"""
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+class Stage:
+    """A named pipeline stage transforming an item iterator into another"""
+
+    def __init__(self, name: str, func: Callable[[Iterator[Any]], Iterable[Any]]):
+        self.name = name
+        self.func = func
+
+
+class StageStats(BaseModel):
+    """Queue depth statistics for the input queue of a stage"""
+    name: str
+    depth: int = 0
+    max_depth: int = 0
+    capacity: int = 0
+    items: int = 0
+
+
+class _BoundedQueue:
+    """Bounded queue that records depth statistics and honours a stop flag"""
+
+    POLL_SECONDS = 0.1
+
+    def __init__(self, name: str, maxsize: int, stop: threading.Event):
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=maxsize)
+        self._stop = stop
+        self.stats = StageStats(name=name, capacity=maxsize)
+
+    def put(self, item: Any) -> bool:
+        """Block until there is room (backpressure), return False if stopped"""
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=self.POLL_SECONDS)
+            except queue.Full:
+                continue
+            depth = self._queue.qsize()
+            if depth > self.stats.max_depth:
+                self.stats.max_depth = depth
+            return True
+        return False
+
+    def __iter__(self) -> Iterator[Any]:
+        """Yield items until the upstream stage finishes"""
+        while not self._stop.is_set():
+            try:
+                item = self._queue.get(timeout=self.POLL_SECONDS)
+            except queue.Empty:
+                continue
+            if item is _DONE:
+                return
+            if isinstance(item, _Failure):
+                raise item.error
+            self.stats.items += 1
+            yield item
+
+    def depth(self) -> int:
+        return self._queue.qsize()
+
+
+class Pipeline:
+    """Runs generator stages in worker threads connected by bounded queues
+
+    Each stage consumes the output of the previous one. When the consumer
+    of ``run()`` falls behind, queues fill up and upstream stages block
+    instead of buffering the whole batch in memory. A run given a deadline
+    is stopped by a timer when it passes, whether or not anything reaches
+    the consumer; ``timed_out`` then reports the truncation.
+    """
+
+    # How long a timed-out run waits for stage threads before leaving them;
+    # a stage stuck in I/O exits on its own once its stop flag is seen
+    JOIN_GRACE_SECONDS = 0.5
+
+    def __init__(self, stages: List[Stage], maxsize: int = 64):
+        self.stages = stages
+        self.maxsize = maxsize
+        self._stop = threading.Event()
+        self._queues: List[_BoundedQueue] = []
+        self._threads: List[threading.Thread] = []
+        self.timed_out = False
+
+    def run(self, source: Iterable[Any], deadline: Optional[float] = None) -> Iterator[Any]:
+        """Stream items from source through all stages
+
+        deadline is a time.monotonic() value after which every stage is
+        stopped and the run ends early.
+        """
+        # A fresh flag per run, so threads left behind by a timed-out run stay stopped
+        self._stop = threading.Event()
+        self.timed_out = False
+        names = [stage.name for stage in self.stages] + ["emit"]
+        self._queues = [_BoundedQueue(name, self.maxsize, self._stop) for name in names]
+
+        self._threads = [self._spawn("source", iter(source), self._queues[0])]
+        for index, stage in enumerate(self.stages):
+            inbound = self._queues[index]
+            outbound = self._queues[index + 1]
+            self._threads.append(self._spawn(stage.name, stage.func(iter(inbound)), outbound))
+
+        timer = None
+        if deadline is not None:
+            timer = threading.Timer(max(deadline - time.monotonic(), 0), self._expire, args=(self._stop,))
+            timer.daemon = True
+            timer.start()
+
+        try:
+            yield from self._queues[-1]
+        finally:
+            if timer is not None:
+                timer.cancel()
+            self._stop.set()
+            grace = self.JOIN_GRACE_SECONDS if self.timed_out else None
+            for thread in self._threads:
+                thread.join(grace)
+
+    def stats(self) -> List[StageStats]:
+        """Current and peak depth of each stage's input queue"""
+        result = []
+        for bounded in self._queues:
+            stats = bounded.stats.model_copy()
+            stats.depth = bounded.depth()
+            result.append(stats)
+        return result
+
+    def stop(self) -> None:
+        """Ask all stages to stop at the next queue operation"""
+        self._stop.set()
+
+    def _expire(self, stop: threading.Event) -> None:
+        if stop is self._stop and not stop.is_set():
+            self.timed_out = True
+            stop.set()
+
+    def _spawn(self, name: str, items: Iterable[Any], outbound: _BoundedQueue) -> threading.Thread:
+        """Start a thread pumping items into the outbound queue"""
+        def pump() -> None:
+            try:
+                for item in items:
+                    if not outbound.put(item):
+                        return
+            except BaseException as e:
+                outbound.put(_Failure(e))
+                return
+            outbound.put(_DONE)
+
+        thread = threading.Thread(target=pump, name=f"pipeline-{name}", daemon=True)
+        thread.start()
+        return thread
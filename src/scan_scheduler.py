@@ -0,0 +1,70 @@
+"""Drift-free fixed-rate scheduling of bulk scans"""
+import time
+from typing import Callable
+from pydantic import BaseModel
+
+
+class ScheduleStats(BaseModel):
+    """Timing of scan ticks relative to their deadlines"""
+    ticks: int = 0
+    late_ticks: int = 0
+    skipped_ticks: int = 0
+    last_jitter_ms: float = 0.0
+    max_jitter_ms: float = 0.0
+    total_jitter_ms: float = 0.0
+    last_duration_ms: float = 0.0
+
+    @property
+    def mean_jitter_ms(self) -> float:
+        return self.total_jitter_ms / self.ticks if self.ticks else 0.0
+
+
+class FixedRateScheduler:
+    """Fires ticks on fixed deadlines of a monotonic clock
+
+    Deadlines are start + n * interval, so scan duration is absorbed by
+    the wait instead of adding to the period. A tick that runs past one
+    or more following deadlines counts as an overrun; the missed ticks
+    are skipped rather than fired back to back.
+    """
+
+    def __init__(self, interval_seconds: float, clock: Callable[[], float] = time.monotonic):
+        self.interval = float(interval_seconds)
+        self._clock = clock
+        self._deadline = clock()
+        self._tick_started = self._deadline
+        self.stats = ScheduleStats()
+
+    def start(self) -> None:
+        """Make the first tick due now"""
+        self._deadline = self._clock()
+
+    @property
+    def deadline(self) -> float:
+        """Monotonic time the current (or next) tick is due"""
+        return self._deadline
+
+    def remaining(self) -> float:
+        """Seconds until the next tick is due"""
+        return max(self._deadline - self._clock(), 0.0)
+
+    def begin_tick(self) -> None:
+        """Record how late this tick started relative to its deadline"""
+        self._tick_started = self._clock()
+        jitter_ms = max(self._tick_started - self._deadline, 0.0) * 1000
+        self.stats.ticks += 1
+        self.stats.last_jitter_ms = jitter_ms
+        self.stats.total_jitter_ms += jitter_ms
+        self.stats.max_jitter_ms = max(self.stats.max_jitter_ms, jitter_ms)
+
+    def end_tick(self) -> None:
+        """Advance to the next deadline, skipping any the tick overran"""
+        now = self._clock()
+        self.stats.last_duration_ms = (now - self._tick_started) * 1000
+        self._deadline += self.interval
+
+        if now > self._deadline:
+            missed = int((now - self._deadline) // self.interval) + 1
+            self.stats.late_ticks += 1
+            self.stats.skipped_ticks += missed
+            self._deadline += missed * self.interval
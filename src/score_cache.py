@@ -0,0 +1,89 @@
+"""Memoized token scoring with age-tier aware invalidation"""
+from collections import OrderedDict
+from typing import Optional, Tuple
+from pydantic import BaseModel
+from src.address import AddressKey
+from src.config_manager import ScraperConfig
+from src.dexscreener_client import TokenData
+from src.token_filter import AgeTiers, TokenFilter, TokenScore
+
+
+class ScoreCacheStats(BaseModel):
+    """Lookup counters for the score cache"""
+    hits: int = 0
+    misses: int = 0
+    expired: int = 0
+    changed: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ScoreCache:
+    """Caches TokenFilter.score_token results per address
+
+    An entry is reused while the token's metric fingerprint is unchanged
+    and the reference time stays inside the age tier the score was computed
+    in. Only the age component depends on time, so the result is exactly
+    what score_token would return. Hard-filter failures do not depend on
+    age and stay valid until the metrics change.
+    """
+
+    def __init__(self, token_filter: TokenFilter, config: ScraperConfig, max_entries: int = 50_000):
+        self.token_filter = token_filter
+        self.age_tiers = AgeTiers(config.scoring.age_tiers)
+        self.max_entries = max_entries
+        self.stats = ScoreCacheStats()
+        # address key -> (fingerprint, score, valid_from_ms, valid_until_ms)
+        self._entries: "OrderedDict[AddressKey, Tuple[tuple, Optional[TokenScore], float, float]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def score(self, token: TokenData, reference_ms: int) -> Optional[TokenScore]:
+        """Cached equivalent of TokenFilter.score_token(token, reference_ms)"""
+        fingerprint = self._fingerprint(token)
+        entry = self._entries.get(token.key)
+
+        if entry is not None:
+            cached_fingerprint, score, valid_from, valid_until = entry
+            if cached_fingerprint != fingerprint:
+                self.stats.changed += 1
+            elif valid_from <= reference_ms < valid_until:
+                self.stats.hits += 1
+                self._entries.move_to_end(token.key)
+                return score
+            else:
+                self.stats.expired += 1
+
+        self.stats.misses += 1
+        score = self.token_filter.score_token(token, reference_ms)
+        if score is None:
+            valid_from, valid_until = float("-inf"), float("inf")
+        else:
+            valid_from, valid_until = self.age_tiers.stable_window(token.created_at_ms, reference_ms)
+
+        self._entries[token.key] = (fingerprint, score, valid_from, valid_until)
+        self._entries.move_to_end(token.key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return score
+
+    def invalidate(self, key: AddressKey) -> None:
+        """Drop the cached score for an address key"""
+        self._entries.pop(key, None)
+
+    @staticmethod
+    def _fingerprint(token: TokenData) -> tuple:
+        """Every TokenData field score_token reads"""
+        return (
+            token.price_usd,
+            token.liquidity_usd,
+            token.volume_24h,
+            token.maker_count,
+            token.price_change_5m,
+            token.price_change_1h,
+            token.created_at_ms,
+        )
@@ -1,19 +1,20 @@
 """In-memory cache for token deduplication"""
+from src.address import AddressKey
 
 
 class TokenCache:
     """Session-based cache to track seen tokens"""
 
     def __init__(self):
-        self._seen: set[str] = set()
+        self._seen: set[AddressKey] = set()
 
-    def has_seen(self, token_address: str) -> bool:
+    def has_seen(self, key: AddressKey) -> bool:
         """Check if token has been seen this session"""
-        return token_address in self._seen
+        return key in self._seen
 
-    def mark_seen(self, token_address: str) -> None:
+    def mark_seen(self, key: AddressKey) -> None:
         """Mark token as seen"""
-        self._seen.add(token_address)
+        self._seen.add(key)
 
     def size(self) -> int:
         """Get number of cached tokens"""
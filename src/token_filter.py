@@ -1,9 +1,18 @@
 """Token filtering with balanced scoring logic"""
-from datetime import datetime, timedelta
-from typing import Optional
+import time
+from bisect import bisect_left, bisect_right
+from typing import List, Optional, Tuple
 from pydantic import BaseModel
 from src.dexscreener_client import TokenData
-from src.config_manager import ScraperConfig
+from src.config_manager import AgeTier, ScraperConfig
+
+
+MS_PER_MINUTE = 60_000
+
+
+def now_ms() -> int:
+    """Current wall-clock time in epoch milliseconds"""
+    return time.time_ns() // 1_000_000
 
 
 class TokenScore(BaseModel):
@@ -15,29 +24,64 @@ class TokenScore(BaseModel):
     passed: bool = False
 
 
+class AgeTiers:
+    """Age tiers resolved to epoch-millisecond creation-time cutoffs"""
+
+    def __init__(self, tiers: List[AgeTier]):
+        # Oldest boundary first so cutoffs come out in ascending time order
+        oldest_first = sorted(tiers, key=lambda tier: tier.max_age_minutes, reverse=True)
+        self._ages_ms = [tier.max_age_minutes * MS_PER_MINUTE for tier in oldest_first]
+        self._points = [0] + [tier.points for tier in oldest_first]
+        self._ages_ascending = self._ages_ms[::-1]
+        self._reference_ms: Optional[int] = None
+        self._cutoffs: List[int] = []
+
+    def cutoffs(self, reference_ms: int) -> List[int]:
+        """Ascending pairCreatedAt cutoffs for a scan reference time"""
+        if reference_ms != self._reference_ms:
+            self._cutoffs = [reference_ms - age_ms for age_ms in self._ages_ms]
+            self._reference_ms = reference_ms
+        return self._cutoffs
+
+    def points(self, created_at_ms: int, reference_ms: int) -> int:
+        """Points for a creation time; boundaries are exclusive (age < tier)"""
+        return self._points[bisect_left(self.cutoffs(reference_ms), created_at_ms)]
+
+    def stable_window(self, created_at_ms: int, reference_ms: int) -> Tuple[float, float]:
+        """Reference times [start, end) over which points() does not change"""
+        ages = self._ages_ascending
+        crossed = bisect_right(ages, reference_ms - created_at_ms)
+        start = created_at_ms + ages[crossed - 1] if crossed else float("-inf")
+        end = created_at_ms + ages[crossed] if crossed < len(ages) else float("inf")
+        return start, end
+
+
 class TokenFilter:
     """Filters and scores tokens based on config criteria"""
 
     def __init__(self, config: ScraperConfig):
         self.config = config
+        self.age_tiers = AgeTiers(config.scoring.age_tiers)
 
-    def score_token(self, token: TokenData) -> Optional[TokenScore]:
-        """Score a token, return None if it fails hard filters"""
+    def score_token(self, token: TokenData, reference_ms: Optional[int] = None) -> Optional[TokenScore]:
+        """Score a token, return None if it fails hard filters
+
+        reference_ms is the scan's single "now"; it defaults to the
+        current time for one-off calls.
+        """
         # Hard filters (safety gates)
         if not self._passes_hard_filters(token):
             return None
 
+        if reference_ms is None:
+            reference_ms = now_ms()
+
         # Calculate scores
-        age_score = self._calculate_age_score(token)
+        age_score = self._calculate_age_score(token, reference_ms)
         volume_score = self._calculate_volume_score(token)
         momentum_score = self._calculate_momentum_score(token)
 
-        # Apply weights
-        weighted_age = int(age_score * self.config.scoring.age_weight)
-        weighted_volume = int(volume_score * self.config.scoring.volume_weight)
-        weighted_momentum = int(momentum_score * self.config.scoring.momentum_weight)
-
-        total = weighted_age + weighted_volume + weighted_momentum
+        total = self.weighted_total(age_score, volume_score, momentum_score)
 
         return TokenScore(
             age_score=age_score,
@@ -47,6 +91,14 @@ class TokenFilter:
             passed=total >= self.config.scoring.min_score
         )
 
+    def weighted_total(self, age_score: int, volume_score: int, momentum_score: int) -> int:
+        """Combine component scores using the configured weights"""
+        weighted_age = int(age_score * self.config.scoring.age_weight)
+        weighted_volume = int(volume_score * self.config.scoring.volume_weight)
+        weighted_momentum = int(momentum_score * self.config.scoring.momentum_weight)
+
+        return weighted_age + weighted_volume + weighted_momentum
+
     def _passes_hard_filters(self, token: TokenData) -> bool:
         """Check if token passes safety gates"""
         if token.liquidity_usd < self.config.hard_filters.min_liquidity_usd:
@@ -57,17 +109,11 @@ class TokenFilter:
             return False
         return True
 
-    def _calculate_age_score(self, token: TokenData) -> int:
+    def _calculate_age_score(self, token: TokenData, reference_ms: Optional[int] = None) -> int:
         """Score based on token age"""
-        age = datetime.now() - token.created_at
-
-        if age < timedelta(minutes=30):
-            return 3
-        elif age < timedelta(hours=1):
-            return 2
-        elif age < timedelta(hours=2):
-            return 1
-        return 0
+        if reference_ms is None:
+            reference_ms = now_ms()
+        return self.age_tiers.points(token.created_at_ms, reference_ms)
 
     def _calculate_volume_score(self, token: TokenData) -> int:
         """Score based on volume/liquidity ratio"""
@@ -0,0 +1,32 @@
+import pytest
+from src.dexscreener_client import TokenData
+from src.token_filter import MS_PER_MINUTE
+
+
+# Fixed "now" that token ages are measured from
+REFERENCE_MS = 1_700_000_000_000
+
+
+class FakeClock:
+    """Manually advanced clock for code that takes a clock callable"""
+
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def make_token(address="A", minutes_old=10, liquidity=10000.0, volume=20000.0, **fields):
+    """Token aged minutes_old at REFERENCE_MS; other TokenData fields by keyword"""
+    return TokenData(**{
+        "address": address, "pair_address": f"PAIR_{address}", "name": address, "symbol": address,
+        "price_usd": 0.001, "liquidity_usd": liquidity, "volume_24h": volume, "maker_count": 50,
+        "created_at_ms": REFERENCE_MS - minutes_old * MS_PER_MINUTE,
+        **fields,
+    })
@@ -0,0 +1,69 @@
+import os
+import pytest
+from src.address import address_key, b58decode, b58encode, to_address, to_key
+
+
+def test_base58_round_trip():
+    """Test that random 32-byte keys survive encode/decode"""
+    for _ in range(50):
+        key = os.urandom(32)
+        assert b58decode(b58encode(key)) == key
+
+
+def test_base58_preserves_leading_zeros():
+    """Test that leading zero bytes map to leading '1' characters"""
+    key = b"\x00\x00" + os.urandom(30)
+
+    encoded = b58encode(key)
+
+    assert encoded.startswith("11")
+    assert b58decode(encoded) == key
+
+
+def test_address_key_for_known_address():
+    """Test a real Solana address decodes to 32 bytes"""
+    assert len(address_key("So11111111111111111111111111111111111111112")) == 32
+
+
+def test_address_key_rejects_non_addresses():
+    """Test that invalid characters and wrong lengths give None"""
+    assert address_key("TOKEN_ABC") is None
+    assert address_key("0OIl") is None
+    assert address_key("abc") is None
+
+
+def test_b58decode_invalid_character():
+    with pytest.raises(ValueError):
+        b58decode("abc0")
+
+
+def test_to_key_compacts_solana_addresses():
+    """Test that real addresses become 32-byte keys and round-trip for display"""
+    address = b58encode(os.urandom(32))
+
+    key = to_key(address)
+
+    assert isinstance(key, bytes) and len(key) == 32
+    assert to_address(key) == address
+
+
+def test_to_key_interns_other_strings():
+    """Test that non-address strings are kept as shared interned handles"""
+    first = to_key("".join(["TOKEN", "_ABC"]))
+    second = to_key("".join(["TOKEN_", "ABC"]))
+
+    assert first == "TOKEN_ABC"
+    assert first is second
+    assert to_address(first) == "TOKEN_ABC"
+
+
+def test_hex_key_for_evm_addresses():
+    """Test that 0x addresses decode to 20 bytes regardless of case"""
+    from src.address import hex_key
+    address = "0x4200000000000000000000000000000000000006"
+
+    assert hex_key(address) == bytes.fromhex(address[2:])
+    assert hex_key(address.upper().replace("0X", "0x")) == hex_key(address)
+    assert hex_key("0x42") is None
+    assert hex_key("0x" + "zz" * 20) is None
+    assert hex_key("So11111111111111111111111111111111111111112") is None
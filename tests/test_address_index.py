@@ -0,0 +1,84 @@
+import os
+import pytest
+from src.address import b58encode
+from src.address_index import AddressIndex, read_address_lists
+
+
+@pytest.fixture
+def addresses():
+    return [b58encode(os.urandom(32)) for _ in range(500)]
+
+
+def test_build_and_lookup(tmp_path, addresses):
+    """Test that every built address is found and others are not"""
+    path = tmp_path / "blocklist.idx"
+
+    written, invalid = AddressIndex.build(addresses + ["NOT_BASE58", addresses[0]], path)
+    index = AddressIndex(path)
+
+    assert (written, invalid) == (500, 1)
+    assert len(index) == 500
+    assert all(address in index for address in addresses)
+    assert b58encode(os.urandom(32)) not in index
+    assert "NOT_BASE58" not in index
+    index.close()
+
+
+def test_fanout_edges(tmp_path):
+    """Test lookups at the first and last prefix and within a shared prefix"""
+    keys = [b"\x00" * 32, b"\xff" * 32] + [b"\x12\x34" + bytes([i]) * 30 for i in range(1, 6)]
+    path = tmp_path / "edges.idx"
+    AddressIndex.build([b58encode(key) for key in keys], path)
+
+    index = AddressIndex(path)
+
+    assert all(index.contains_key(key) for key in keys)
+    assert not index.contains_key(b"\x12\x34" + b"\x09" * 30)
+    assert not index.contains_key(b"\x12\x35" + b"\x01" * 30)
+    assert not index.contains_key(b"\x00" * 31)
+    index.close()
+
+
+def test_empty_index(tmp_path):
+    """Test that an index with no keys answers False"""
+    path = tmp_path / "empty.idx"
+    AddressIndex.build([], path)
+
+    index = AddressIndex(path)
+
+    assert len(index) == 0
+    assert b58encode(os.urandom(32)) not in index
+    index.close()
+
+
+def test_rejects_foreign_files(tmp_path):
+    """Test that files without the index header are refused"""
+    path = tmp_path / "bogus.idx"
+    path.write_bytes(b"x" * 64)
+
+    with pytest.raises(ValueError):
+        AddressIndex(path)
+
+
+def test_read_address_lists_skips_comments(tmp_path):
+    """Test list parsing with comments and blank lines"""
+    path = tmp_path / "list.txt"
+    path.write_text("# scams\nAAA\n\nBBB  # rug\n")
+
+    assert list(read_address_lists([path])) == ["AAA", "BBB"]
+
+
+def test_hex_index_matches_evm_addresses(tmp_path):
+    """Test that a hex index holds 20-byte keys and matches any address case"""
+    from src.address import EVM_KEY_SIZE
+    addresses = ["0x" + os.urandom(20).hex() for _ in range(50)]
+    path = tmp_path / "evm.idx"
+
+    written, invalid = AddressIndex.build(addresses + [b58encode(os.urandom(32))], path, EVM_KEY_SIZE)
+    index = AddressIndex(path)
+
+    assert (written, invalid) == (50, 1)
+    assert index.key_size == EVM_KEY_SIZE
+    assert all("0x" + address[2:].upper() in index for address in addresses)
+    assert "0x" + os.urandom(20).hex() not in index
+    index.close()
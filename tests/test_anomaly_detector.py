@@ -0,0 +1,84 @@
+import random
+import statistics
+from src.anomaly_detector import AnomalyDetector, OnlineStats
+from src.config_manager import AnomalyConfig
+from tests.conftest import make_token
+
+
+def test_online_stats_match_batch_statistics():
+    """Test that Welford updates agree with the statistics module"""
+    values = [random.uniform(0, 1000) for _ in range(200)]
+    stats = OnlineStats(alpha=0.5)
+    for value in values:
+        stats.update(value)
+
+    assert stats.count == 200
+    assert abs(stats.mean - statistics.mean(values)) < 1e-6
+    assert abs(stats.variance - statistics.variance(values)) < 1e-4
+    expected_ewma = values[0]
+    for value in values[1:]:
+        expected_ewma = 0.5 * value + 0.5 * expected_ewma
+    assert abs(stats.ewma - expected_ewma) < 1e-9
+
+
+def test_online_stats_z_score_needs_spread():
+    """Test that z-scores are undefined until there is variance"""
+    stats = OnlineStats(alpha=0.3)
+    for _ in range(5):
+        stats.update(10.0)
+
+    assert stats.z_score(20.0) is None
+    stats.update(12.0)
+    assert stats.z_score(20.0) > 3
+
+
+def test_sudden_liquidity_drop_is_flagged_on_matched_token():
+    """Test that a liquidity pull on a matched token raises an event"""
+    detector = AnomalyDetector(AnomalyConfig())
+    detector.observe(make_token(liquidity=50000), 1)
+    detector.mark_matched(make_token().key)
+
+    events = detector.observe(make_token(liquidity=5000), 2)
+
+    assert [(e.kind, e.matched) for e in events] == [("liquidity_drop", True)]
+    assert round(events[0].change_pct) == -90
+    assert detector.flagged == 1
+
+
+def test_steady_liquidity_is_quiet():
+    """Test that normal fluctuation does not fire"""
+    detector = AnomalyDetector(AnomalyConfig())
+    rng = random.Random(1)
+
+    events = [
+        event
+        for i in range(50)
+        for event in detector.observe(make_token(liquidity=10000 + rng.uniform(-300, 300), volume=1000 * i), i)
+    ]
+
+    assert events == []
+
+
+def test_volume_spike_after_warmup():
+    """Test that volume added far above the usual per-scan rate is flagged"""
+    detector = AnomalyDetector(AnomalyConfig(min_samples=5))
+    rng = random.Random(2)
+    volume = 0.0
+    for i in range(10):
+        volume += 1000 + rng.uniform(-100, 100)
+        assert detector.observe(make_token(volume=volume), i) == []
+
+    events = detector.observe(make_token(volume=volume + 20000), 10)
+
+    assert [e.kind for e in events] == ["volume_spike"]
+    assert events[0].z_score > 3
+    assert events[0].matched is False
+
+
+def test_tracked_tokens_are_bounded():
+    """Test that the least recently seen tokens are evicted"""
+    detector = AnomalyDetector(AnomalyConfig(max_tokens=3))
+    for address in "ABCD":
+        detector.observe(make_token(address), 0)
+
+    assert len(detector) == 3
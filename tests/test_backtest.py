@@ -0,0 +1,116 @@
+import random
+import pytest
+from src.backtest import SnapshotSet, apply_overrides, evaluate, expand_grid, run_backtest
+from src.config_manager import ScraperConfig
+from src.dexscreener_client import TokenData
+from src.token_filter import TokenFilter
+
+
+SCAN_MS = 1_700_000_000_000
+
+
+def random_rows(count, seed=7, chains=("solana",)):
+    """Synthetic snapshots spread across every filter boundary"""
+    rng = random.Random(seed)
+    rows = []
+    for i in range(count):
+        rows.append((
+            SCAN_MS + rng.randrange(0, 3) * 30_000,
+            f"TOKEN{rng.randrange(count // 2)}",
+            rng.choice([0.0, 0.001, 0.5]),
+            rng.choice([1000, 4999, 5000, 12000, 40000]),
+            rng.choice([0, 5000, 20000, 80000, 300000]),
+            rng.choice([5, 19, 20, 60]),
+            rng.choice([None, -3.0, 0.0, 8.0]),
+            rng.choice([None, -1.0, 12.0]),
+            SCAN_MS - rng.choice([5, 29, 30, 45, 90, 200]) * 60_000,
+            rng.choice(chains),
+        ))
+    return rows
+
+
+def reference_matches(rows, config):
+    """Score each snapshot through TokenFilter.score_token"""
+    matched = set()
+    snapshots = 0
+    for scan_ms, address, price, liq, vol, makers, c5, c1, created, chain_id in rows:
+        token = TokenData(
+            address=address, name="", symbol="", price_usd=price, liquidity_usd=liq,
+            volume_24h=vol, maker_count=makers, price_change_5m=c5, price_change_1h=c1,
+            created_at_ms=created, chain_id=chain_id
+        )
+        score = TokenFilter(config.for_chain(chain_id)).score_token(token, scan_ms)
+        if score and score.passed:
+            snapshots += 1
+            matched.add((chain_id, address))
+    return snapshots, matched
+
+
+@pytest.mark.parametrize("overrides", [
+    {},
+    {"scoring.min_score": 3, "hard_filters.min_liquidity_usd": 5000},
+    {"scoring.age_weight": 2.0, "scoring.momentum_weight": 1.5, "hard_filters.min_maker_count": 20},
+    {"scoring.age_tiers": [{"max_age_minutes": 60, "points": 4}], "scoring.min_score": 4},
+])
+def test_evaluate_matches_token_filter(overrides):
+    """Test that the bitset evaluation agrees with TokenFilter exactly"""
+    rows = random_rows(400)
+    config = apply_overrides(ScraperConfig(), overrides)
+    data = SnapshotSet(rows)
+
+    snapshots, token_ids, histogram = evaluate(data, config)
+
+    expected_snapshots, expected_tokens = reference_matches(rows, config)
+    assert snapshots == expected_snapshots
+    assert {data.tokens[i] for i in token_ids} == expected_tokens
+    assert sum(count for score, count in histogram.items() if score >= config.scoring.min_score) == snapshots
+
+
+def test_evaluate_scores_each_chain_with_its_overrides():
+    """Test that chains keep separate tokens and use their own config"""
+    rows = random_rows(400, chains=("solana", "base"))
+    rows.append(rows[0][:-1] + ("base" if rows[0][-1] == "solana" else "solana",))
+    config = ScraperConfig(
+        chains=["solana", "base"],
+        chain_overrides={"base": {"scoring": {"min_score": 3}, "hard_filters": {"min_liquidity_usd": 20000}}}
+    )
+    data = SnapshotSet(rows)
+
+    snapshots, token_ids, _ = evaluate(data, config)
+
+    expected_snapshots, expected_tokens = reference_matches(rows, config)
+    assert snapshots == expected_snapshots
+    assert {data.tokens[i] for i in token_ids} == expected_tokens
+    assert len(data.tokens) == len({(row[-1], row[1]) for row in rows})
+
+def test_expand_grid_full_and_sampled():
+    """Test grid expansion and random sampling"""
+    grid = {"scoring.min_score": [4, 5, 6], "scoring.age_weight": [0.5, 1.0]}
+
+    assert len(expand_grid(grid)) == 6
+    sampled = expand_grid(grid, samples=4, seed=1)
+    assert len(sampled) == 4
+    assert all(combo["scoring.min_score"] in (4, 5, 6) for combo in sampled)
+
+
+def test_run_backtest_reports_overlap_with_base():
+    """Test that the base config overlaps itself fully"""
+    data = SnapshotSet(random_rows(200))
+    base = ScraperConfig(scoring={"min_score": 3})
+
+    results = run_backtest(data, base, [{}, {"scoring.min_score": 20}])
+
+    assert results[0].jaccard == 1.0
+    assert results[0].overlap_tokens == results[0].matched_tokens
+    assert results[1].matched_tokens == 0
+
+
+def test_run_backtest_process_pool_matches_serial():
+    """Test that pooled evaluation gives the same results as serial"""
+    data = SnapshotSet(random_rows(200))
+    combos = expand_grid({"scoring.min_score": [2, 4], "hard_filters.min_liquidity_usd": [0, 10000]})
+
+    serial = run_backtest(data, ScraperConfig(), combos, workers=1)
+    pooled = run_backtest(data, ScraperConfig(), combos, workers=2)
+
+    assert [r.model_dump() for r in serial] == [r.model_dump() for r in pooled]
@@ -43,3 +43,36 @@ def test_invalid_config_raises_error(tmp_path):
 
     with pytest.raises(ValueError):
         ConfigManager.load(config_file)
+
+
+def test_duplicate_age_tiers_rejected():
+    """Test that age tiers must have distinct boundaries"""
+    with pytest.raises(ValueError):
+        ScraperConfig(scoring={
+            "age_tiers": [
+                {"max_age_minutes": 30, "points": 3},
+                {"max_age_minutes": 30, "points": 2},
+            ]
+        })
+
+
+def test_chain_overrides_merge_per_chain():
+    """Test that a chain's overrides are deep-merged over the shared config"""
+    config = ScraperConfig(
+        chains=["solana", "base"],
+        chain_overrides={"base": {"hard_filters": {"min_liquidity_usd": 20000}, "scoring": {"min_score": 7}}}
+    )
+
+    base = config.for_chain("base")
+
+    assert base.hard_filters.min_liquidity_usd == 20000
+    assert base.hard_filters.min_maker_count == config.hard_filters.min_maker_count
+    assert base.scoring.min_score == 7
+    assert base.scoring.age_tiers == config.scoring.age_tiers
+    assert config.for_chain("solana") is config
+
+
+def test_overrides_for_unscanned_chain_rejected():
+    """Test that overrides must name a chain that is scanned"""
+    with pytest.raises(ValueError):
+        ScraperConfig(chain_overrides={"bsc": {"scoring": {"min_score": 1}}})
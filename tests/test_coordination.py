@@ -0,0 +1,126 @@
+import pytest
+from src.config_manager import WorkerConfig
+from src.coordination import SQLiteStore, WorkerCoordinator, open_store, rendezvous_owner
+
+
+def make_worker(tmp_path, clock, worker_id):
+    config = WorkerConfig(worker_id=worker_id, heartbeat_seconds=10, worker_ttl_seconds=30)
+    return WorkerCoordinator(config, SQLiteStore(tmp_path / "coord.sqlite3"), clock=clock)
+
+
+def test_first_claim_wins_across_connections(tmp_path):
+    """Test that only the first worker claims a key until the claim expires"""
+    first = SQLiteStore(tmp_path / "coord.sqlite3")
+    second = SQLiteStore(tmp_path / "coord.sqlite3")
+
+    assert first.claim("match:solana:A", "w1", now_ms=1000, ttl_ms=500)
+    assert not second.claim("match:solana:A", "w2", now_ms=1200, ttl_ms=500)
+    assert second.claim("match:solana:A", "w2", now_ms=1500, ttl_ms=500)
+    first.close()
+    second.close()
+
+
+def test_live_workers_expire_and_leave(tmp_path):
+    """Test that workers drop out on expiry or when they leave"""
+    store = SQLiteStore(tmp_path / "coord.sqlite3")
+    store.heartbeat("w1", expires_ms=2000)
+    store.heartbeat("w2", expires_ms=5000)
+    store.heartbeat("w3", expires_ms=5000)
+
+    store.leave("w3")
+
+    assert store.live_workers(now_ms=1000) == ["w1", "w2"]
+    assert store.live_workers(now_ms=3000) == ["w2"]
+    store.close()
+
+
+def test_rendezvous_moves_only_departed_workers_keys():
+    """Test that removing a worker reassigns only the keys it owned"""
+    keys = [f"TOKEN{i}".encode() for i in range(2000)]
+    before = {key: rendezvous_owner(key, ["w1", "w2", "w3"]) for key in keys}
+    after = {key: rendezvous_owner(key, ["w1", "w2"]) for key in keys}
+
+    moved = [key for key in keys if before[key] != after[key]]
+
+    assert moved and all(before[key] == "w3" for key in moved)
+    counts = [list(before.values()).count(worker) for worker in ("w1", "w2", "w3")]
+    assert min(counts) > 500
+
+
+def test_workers_split_keys_and_rebalance_on_leave(tmp_path, clock):
+    """Test that live workers partition keys and take over a leaver's share"""
+    w1 = make_worker(tmp_path, clock, "w1")
+    w2 = make_worker(tmp_path, clock, "w2")
+    w1.heartbeat()
+    w2.heartbeat()
+    assert w1.heartbeat(force=True)
+
+    keys = [f"TOKEN{i}" for i in range(200)]
+    assert all(w1.owns(key) != w2.owns(key) for key in keys)
+
+    w2.close()
+    clock.now += 10
+
+    assert w1.heartbeat()
+    assert w1.workers == ["w1"]
+    assert all(w1.owns(key) for key in keys)
+    assert w1.stats.rebalances == 2
+
+
+def test_silent_worker_expires(tmp_path, clock):
+    """Test that a worker that stops heartbeating loses its share after the TTL"""
+    w1 = make_worker(tmp_path, clock, "w1")
+    w2 = make_worker(tmp_path, clock, "w2")
+    w2.heartbeat()
+    w1.heartbeat()
+    assert w1.workers == ["w1", "w2"]
+
+    clock.now += 31
+
+    assert w1.heartbeat()
+    assert w1.workers == ["w1"]
+
+
+def test_match_alerted_once_across_workers(tmp_path, clock):
+    """Test that a match claimed by one worker is refused to the others"""
+    w1 = make_worker(tmp_path, clock, "w1")
+    w2 = make_worker(tmp_path, clock, "w2")
+
+    assert w1.claim_match("solana", "TOKEN")
+    assert not w2.claim_match("solana", "TOKEN")
+    assert w2.claim_match("base", "TOKEN")
+    assert (w2.stats.claims_won, w2.stats.claims_lost) == (1, 1)
+
+
+def test_store_outage_keeps_membership_and_alerts(tmp_path, clock):
+    """Test that store errors keep the last shard map and do not suppress matches"""
+    worker = make_worker(tmp_path, clock, "w1")
+    worker.store.close()
+
+    assert not worker.heartbeat()
+    assert worker.workers == ["w1"]
+    assert worker.claim_match("solana", "TOKEN")
+    assert worker.stats.store_errors == 2
+
+
+def test_open_store_rejects_unknown_scheme(tmp_path):
+    """Test that store URLs pick a backend by scheme"""
+    store = open_store(f"sqlite:///{(tmp_path / 'coord.sqlite3').as_posix()}")
+    assert isinstance(store, SQLiteStore)
+    store.close()
+
+    with pytest.raises(ValueError):
+        open_store("memcached://localhost")
+
+
+def test_incomplete_store_fails_at_creation():
+    """Test that a backend missing part of the interface cannot be created"""
+    from src.coordination import SharedStore
+
+    class NoClaims(SharedStore):
+        def heartbeat(self, worker_id, expires_ms): ...
+        def leave(self, worker_id): ...
+        def live_workers(self, now_ms): return []
+
+    with pytest.raises(TypeError):
+        NoClaims()
@@ -65,13 +65,15 @@ def test_dashboard_format_token_age():
     """Test age formatting for display"""
     dashboard = Dashboard()
 
+    reference_ms = 1_700_000_000_000
+
     # Test minutes
-    age_25min = datetime.now() - timedelta(minutes=25)
-    assert dashboard._format_age(age_25min) == "25 minutes"
+    age_25min = reference_ms - 25 * 60_000
+    assert dashboard._format_age(age_25min, reference_ms) == "25 minutes"
 
     # Test hours
-    age_90min = datetime.now() - timedelta(minutes=90)
-    assert dashboard._format_age(age_90min) == "1.5 hours"
+    age_90min = reference_ms - 90 * 60_000
+    assert dashboard._format_age(age_90min, reference_ms) == "1.5 hours"
 
 
 def test_dashboard_format_currency():
@@ -81,3 +83,34 @@ def test_dashboard_format_currency():
     assert dashboard._format_currency(12500) == "$12.5K"
     assert dashboard._format_currency(1500000) == "$1.5M"
     assert dashboard._format_currency(500) == "$500"
+
+
+def test_dashboard_keeps_latest_anomalies():
+    """Test that alerts are newest first and capped"""
+    from src.anomaly_detector import AnomalyEvent
+
+    dashboard = Dashboard()
+    for i in range(7):
+        dashboard.add_anomaly(AnomalyEvent(
+            address=f"A{i}", symbol="S", kind="liquidity_drop",
+            value=100, baseline=1000, change_pct=-90, matched=True, at_ms=i
+        ))
+
+    assert dashboard.total_anomalies == 7
+    assert [event.address for event in dashboard.anomalies] == ["A6", "A5", "A4", "A3", "A2"]
+    assert "LIQUIDITY PULL" in str(dashboard.render(10).renderable)
+
+
+def test_leaderboard_keeps_best_after_newer_matches(matched_token):
+    """Test that the best match stays on the leaderboard once it scrolls out of recent matches"""
+    dashboard = Dashboard()
+    dashboard.add_match(matched_token)
+    for i in range(12):
+        token = matched_token.token.model_copy(update={"key": f"WEAK{i}", "symbol": f"W{i}"})
+        dashboard.add_match(MatchedToken(token=token, score=TokenScore(total_score=5, passed=True)))
+
+    assert len(dashboard.matches) == 10
+    assert matched_token not in dashboard.matches
+    rendered = str(dashboard.render(10).renderable)
+    assert "Top 10 this session" in rendered
+    assert rendered.index("TEST") < rendered.index("W11")
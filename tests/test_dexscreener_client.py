@@ -36,7 +36,7 @@ def test_fetch_solana_tokens_success(mock_response):
     """Test successful API call returns parsed tokens"""
     client = DexScreenerClient()
 
-    with patch('requests.get') as mock_get:
+    with patch('requests.Session.get') as mock_get:
         mock_get.return_value.json.return_value = mock_response
         mock_get.return_value.status_code = 200
 
@@ -52,7 +52,7 @@ def test_fetch_with_network_error_retries():
     """Test that network errors trigger retry logic"""
     client = DexScreenerClient(max_retries=2)
 
-    with patch('requests.get') as mock_get:
+    with patch('requests.Session.get') as mock_get:
         mock_get.side_effect = [
             Exception("Network error"),
             Mock(json=lambda: {"pairs": []}, status_code=200)
@@ -68,9 +68,165 @@ def test_fetch_with_rate_limit_returns_empty():
     """Test that rate limit (429) returns empty list"""
     client = DexScreenerClient()
 
-    with patch('requests.get') as mock_get:
+    with patch('requests.Session.get') as mock_get:
         mock_get.return_value.status_code = 429
 
         tokens = client.fetch_solana_tokens()
 
         assert tokens == []
+
+
+def test_iter_latest_tokens_skips_malformed_pairs(mock_response):
+    """Test that the lazy iterator skips bad pairs and other chains"""
+    client = DexScreenerClient()
+    mock_response["pairs"].append({"chainId": "solana", "priceUsd": "1"})
+    mock_response["pairs"].append({**mock_response["pairs"][0], "chainId": "ethereum"})
+
+    with patch('requests.Session.get') as mock_get:
+        mock_get.return_value.json.return_value = mock_response
+        mock_get.return_value.status_code = 200
+
+        tokens = list(client.iter_latest_tokens())
+
+        assert [t.address for t in tokens] == ["TOKEN_ABC"]
+
+
+def test_fetch_pair_parses_single_pair(mock_response):
+    """Test per-pair lookup returns the parsed pair"""
+    client = DexScreenerClient()
+
+    with patch('requests.Session.get') as mock_get:
+        mock_get.return_value.json.return_value = mock_response
+        mock_get.return_value.status_code = 200
+
+        token = client.fetch_pair("ABC123")
+
+        assert mock_get.call_args[0][0].endswith("/pairs/solana/ABC123")
+        assert token.address == "TOKEN_ABC"
+        assert token.pair_address == "ABC123"
+
+
+def test_parse_pair_decodes_address_once(mock_response):
+    """Test that base58 addresses are held as 32-byte keys and encoded on demand"""
+    address = "So11111111111111111111111111111111111111112"
+    pair = dict(mock_response["pairs"][0], baseToken={"address": address})
+
+    token = DexScreenerClient().parse_pair(pair)
+
+    assert isinstance(token.key, bytes) and len(token.key) == 32
+    assert token.address == address
+    assert token == TokenData(**dict(token.model_dump(exclude={"key"}), address=address))
+
+
+def test_fetch_tokens_batches_addresses(mock_response):
+    """Test that lookups are split into maximum-size batches"""
+    client = DexScreenerClient()
+    addresses = [f"ADDR{i}" for i in range(65)] + ["TOKEN_ABC"]
+
+    with patch('requests.Session.get') as mock_get:
+        mock_get.return_value.json.return_value = mock_response
+        mock_get.return_value.status_code = 200
+
+        tokens = client.fetch_tokens(addresses)
+
+        assert mock_get.call_count == 3
+        batch_sizes = [len(call[0][0].rsplit("/", 1)[1].split(",")) for call in mock_get.call_args_list]
+        assert batch_sizes == [30, 30, 6]
+        assert list(tokens) == ["TOKEN_ABC"]
+
+
+def test_fetch_tokens_aggregates_pools(mock_response):
+    """Test that a token's pools are summed around its deepest pair"""
+    client = DexScreenerClient()
+    deeper = {**mock_response["pairs"][0], "pairAddress": "DEEP", "liquidity": {"usd": 90000}}
+    mock_response["pairs"].append(deeper)
+
+    with patch('requests.Session.get') as mock_get:
+        mock_get.return_value.json.return_value = mock_response
+        mock_get.return_value.status_code = 200
+
+        tokens = client.fetch_tokens(["TOKEN_ABC"])
+
+        token = tokens["TOKEN_ABC"]
+        assert token.pair_address == "DEEP"
+        assert (token.liquidity_usd, token.maker_count, token.pool_count) == (105000, 134, 2)
+
+
+def test_fetch_tokens_coalesces_concurrent_lookups(mock_response):
+    """Test that concurrent lookups for one address share a single request"""
+    import threading
+
+    client = DexScreenerClient()
+    release = threading.Event()
+    results = []
+
+    def slow_get(url, timeout):
+        release.wait(2)
+        return Mock(json=lambda: mock_response, status_code=200)
+
+    with patch('requests.Session.get', side_effect=slow_get) as mock_get:
+        threads = [
+            threading.Thread(target=lambda: results.append(client.fetch_tokens(["TOKEN_ABC"])))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        # Let every thread register before the request completes
+        threading.Event().wait(0.2)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert mock_get.call_count == 1
+        assert all(result["TOKEN_ABC"].address == "TOKEN_ABC" for result in results)
+
+
+def test_fetch_respects_deadline():
+    """Test that an expired deadline skips the request entirely"""
+    import time
+
+    client = DexScreenerClient()
+
+    with patch('requests.Session.get') as mock_get:
+        tokens = list(client.iter_pairs(deadline=time.monotonic() - 1))
+
+        assert tokens == []
+        mock_get.assert_not_called()
+
+
+def test_fetch_timeout_shrinks_to_deadline(mock_response):
+    """Test that the request timeout never exceeds the remaining deadline"""
+    import time
+
+    client = DexScreenerClient()
+
+    with patch('requests.Session.get') as mock_get:
+        mock_get.return_value.json.return_value = mock_response
+        mock_get.return_value.status_code = 200
+
+        list(client.iter_pairs(deadline=time.monotonic() + 2))
+
+        assert mock_get.call_args[1]["timeout"] <= 2
+
+
+def test_client_scans_its_own_chain(mock_response):
+    """Test that a client queries and keeps only pairs from its chain"""
+    from src.dexscreener_client import HttpPool
+    evm_pair = dict(mock_response["pairs"][0], chainId="base", baseToken={
+        "address": "0x4200000000000000000000000000000000000006", "name": "Wrapped", "symbol": "WETH"
+    })
+    http = HttpPool()
+    client = DexScreenerClient(chain="base", http=http)
+    other = DexScreenerClient(http=http)
+
+    with patch('requests.Session.get') as mock_get:
+        mock_get.return_value.json.return_value = {"pairs": mock_response["pairs"] + [evm_pair]}
+        mock_get.return_value.status_code = 200
+
+        tokens = client.fetch_latest_tokens()
+
+        assert mock_get.call_args[0][0].endswith("/tokens/base")
+        assert [(t.symbol, t.chain_id) for t in tokens] == [("WETH", "base")]
+        assert tokens[0].address == "0x4200000000000000000000000000000000000006"
+    assert client.http is other.http
+    http.close()
@@ -0,0 +1,86 @@
+import pytest
+from src.history_store import HistoryStore
+from src.token_filter import TokenScore
+from tests.conftest import make_token
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = HistoryStore(tmp_path / "history.sqlite3")
+    yield store
+    store.close()
+
+
+def test_record_scan_stores_breakdown(store):
+    """Test that a scan's evaluations are stored with their score breakdown"""
+    score = TokenScore(age_score=3, volume_score=2, momentum_score=1, total_score=6, passed=True)
+
+    inserted = store.record_scan(1000, [(make_token("A"), score), (make_token("B"), None)])
+
+    assert inserted == 2
+    rows = store.timeline("A")
+    assert len(rows) == 1
+    assert rows[0].age_score == 3
+    assert rows[0].total_score == 6
+    assert rows[0].passed is True
+    assert store.timeline("B")[0].total_score is None
+
+
+def test_top_scores_respects_window(store):
+    """Test that top scores are limited to the requested window and ordered"""
+    store.record_scan(1000, [(make_token("OLD"), TokenScore(total_score=9))])
+    store.record_scan(2000, [
+        (make_token("LOW"), TokenScore(total_score=2)),
+        (make_token("HIGH"), TokenScore(total_score=7)),
+        (make_token("FAIL"), None),
+    ])
+
+    rows = store.top_scores(since_ms=1500, limit=5)
+
+    assert [row.address for row in rows] == ["HIGH", "LOW"]
+
+
+def test_timeline_is_chronological(store):
+    """Test that an address timeline is returned oldest first"""
+    for scan_ms in (3000, 1000, 2000):
+        store.record_scan(scan_ms, [(make_token("A", liquidity=scan_ms), TokenScore(total_score=1))])
+
+    rows = store.timeline("A")
+
+    assert [row.scan_ms for row in rows] == [1000, 2000, 3000]
+
+
+def test_score_distribution_counts_hits(store):
+    """Test that the distribution reports evaluations and passes per score"""
+    store.record_scan(1000, [
+        (make_token("A"), TokenScore(total_score=6, passed=True)),
+        (make_token("B"), TokenScore(total_score=6, passed=True)),
+        (make_token("C"), TokenScore(total_score=2)),
+        (make_token("D"), None),
+    ])
+
+    assert store.score_distribution(0) == [(None, 1, 0), (2, 1, 0), (6, 2, 2)]
+
+
+def test_chain_column_added_to_existing_database(tmp_path):
+    """Test that databases created before multi-chain support gain chain_id"""
+    import sqlite3
+    path = tmp_path / "old.sqlite3"
+    conn = sqlite3.connect(str(path))
+    conn.execute(
+        "CREATE TABLE scores (scan_ms INTEGER NOT NULL, address TEXT NOT NULL, pair_address TEXT, "
+        "symbol TEXT NOT NULL, price_usd REAL NOT NULL, liquidity_usd REAL NOT NULL, "
+        "volume_24h REAL NOT NULL, maker_count INTEGER NOT NULL, price_change_5m REAL, "
+        "price_change_1h REAL, created_at_ms INTEGER NOT NULL, age_score INTEGER, "
+        "volume_score INTEGER, momentum_score INTEGER, total_score INTEGER, passed INTEGER NOT NULL)"
+    )
+    conn.execute("INSERT INTO scores VALUES (1, 'OLD', NULL, 'O', 1, 1, 1, 1, NULL, NULL, 1, NULL, NULL, NULL, NULL, 0)")
+    conn.commit()
+    conn.close()
+
+    store = HistoryStore(path)
+    store.record_scan(2, [(make_token("NEW").model_copy(update={"chain_id": "base"}), None)])
+
+    assert store.timeline("OLD")[0].chain_id == "solana"
+    assert store.timeline("NEW")[0].chain_id == "base"
+    store.close()
@@ -0,0 +1,87 @@
+import pytest
+from src.config_manager import HotScanConfig
+from src.hot_scheduler import HotPairScheduler, RequestBudget
+from src.token_filter import TokenScore
+from tests.conftest import REFERENCE_MS, make_token
+
+
+def test_budget_refills_over_time(clock):
+    """Test that the request budget refills at its per-minute rate"""
+    budget = RequestBudget(60, clock=clock)
+
+    assert sum(budget.try_acquire() for _ in range(100)) == 60
+    assert not budget.try_acquire()
+
+    clock.now += 2
+    assert budget.try_acquire()
+    assert budget.try_acquire()
+    assert not budget.try_acquire()
+
+
+def test_scheduler_returns_hottest_first(clock):
+    """Test that higher-scored pairs are refreshed first within the budget"""
+    budget = RequestBudget(2, clock=clock)
+    scheduler = HotPairScheduler(HotScanConfig(), budget, clock=clock)
+
+    scheduler.track(make_token("COLD", minutes_old=100), None, REFERENCE_MS)
+    scheduler.track(make_token("HOT", minutes_old=5), TokenScore(total_score=4), REFERENCE_MS)
+    scheduler.track(make_token("WARM", minutes_old=20), TokenScore(total_score=2), REFERENCE_MS)
+
+    due = scheduler.due()
+
+    assert [t.address for t in due] == ["HOT", "WARM"]
+    assert scheduler.refreshes == 2
+
+
+def test_scheduler_waits_for_interval(clock):
+    """Test that a refreshed pair is not due again until its interval passes"""
+    budget = RequestBudget(100, clock=clock)
+    scheduler = HotPairScheduler(HotScanConfig(interval_seconds=5), budget, clock=clock)
+    scheduler.track(make_token("A"), None, REFERENCE_MS)
+
+    assert len(scheduler.due()) == 1
+    assert scheduler.due() == []
+
+    clock.now += 5
+    assert len(scheduler.due()) == 1
+
+
+def test_scheduler_drops_old_and_evicts_coldest(clock):
+    """Test age cutoff and max_tracked eviction"""
+    budget = RequestBudget(100, clock=clock)
+    scheduler = HotPairScheduler(HotScanConfig(max_tracked=2, max_age_minutes=60), budget, clock=clock)
+
+    scheduler.track(make_token("OLD", minutes_old=90), None, REFERENCE_MS)
+    assert len(scheduler) == 0
+
+    scheduler.track(make_token("A", minutes_old=50), None, REFERENCE_MS)
+    scheduler.track(make_token("B", minutes_old=10), None, REFERENCE_MS)
+    scheduler.track(make_token("C", minutes_old=1), TokenScore(total_score=5), REFERENCE_MS)
+
+    assert len(scheduler) == 2
+    assert not scheduler.is_tracked("A")
+    assert scheduler.is_tracked("C")
+
+
+def test_volatility_raises_priority(clock):
+    """Test that a liquidity swing between refreshes bumps a pair up the queue"""
+    budget = RequestBudget(1, clock=clock)
+    scheduler = HotPairScheduler(HotScanConfig(), budget, clock=clock)
+
+    scheduler.track(make_token("STEADY", minutes_old=10), None, REFERENCE_MS)
+    scheduler.track(make_token("SWING", minutes_old=11), None, REFERENCE_MS)
+    scheduler.track(make_token("SWING", minutes_old=11, liquidity=5000), None, REFERENCE_MS)
+
+    assert [t.address for t in scheduler.due()] == ["SWING"]
+
+
+def test_retain_drops_pairs_handed_off(clock):
+    """Test that retain untracks pairs outside the kept set"""
+    scheduler = HotPairScheduler(HotScanConfig(), RequestBudget(100, clock=clock), clock=clock)
+    for address in ("A", "B", "C"):
+        scheduler.track(make_token(address), None, REFERENCE_MS)
+
+    assert scheduler.retain(lambda key: key != "B") == 1
+
+    assert len(scheduler) == 2
+    assert not scheduler.is_tracked("B")
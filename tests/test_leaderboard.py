@@ -0,0 +1,82 @@
+import pytest
+from src.config_manager import LeaderboardConfig
+from src.leaderboard import Leaderboard
+from src.token_filter import MS_PER_MINUTE, TokenScore
+from tests.conftest import REFERENCE_MS, make_token
+
+
+def add(board, address, total, scored_ms=REFERENCE_MS):
+    board.update(make_token(address), TokenScore(total_score=total, passed=True), scored_ms)
+
+
+def addresses(entries):
+    return [entry.token.address for entry in entries]
+
+
+def test_top_orders_by_score_then_recency():
+    """Test that the best scores lead and ties go to the newer match"""
+    board = Leaderboard(LeaderboardConfig(size=3))
+    add(board, "A", 6, REFERENCE_MS)
+    add(board, "B", 9, REFERENCE_MS)
+    add(board, "C", 6, REFERENCE_MS + 1)
+    add(board, "D", 5)
+
+    assert addresses(board.top(REFERENCE_MS)) == ["B", "C", "A"]
+    assert addresses(board.top(REFERENCE_MS, k=10)) == ["B", "C", "A", "D"]
+
+
+def test_rescore_replaces_and_remove_drops():
+    """Test that a token's new score supersedes the old one"""
+    board = Leaderboard(LeaderboardConfig())
+    add(board, "A", 9)
+    add(board, "B", 7)
+
+    add(board, "A", 4)
+    assert addresses(board.top(REFERENCE_MS)) == ["B", "A"]
+    assert len(board) == 2
+
+    board.remove("solana", make_token("B").key)
+    assert addresses(board.top(REFERENCE_MS)) == ["A"]
+    assert ("solana", "B") not in board
+
+
+def test_decay_lets_fresh_matches_overtake():
+    """Test that with a half-life an older high score decays below a fresh one"""
+    board = Leaderboard(LeaderboardConfig(half_life_minutes=30))
+    add(board, "OLD", 8, REFERENCE_MS)
+    add(board, "NEW", 5, REFERENCE_MS + 30 * MS_PER_MINUTE)
+
+    later = REFERENCE_MS + 30 * MS_PER_MINUTE
+    top = board.top(later)
+
+    assert addresses(top) == ["NEW", "OLD"]
+    assert top[1].effective_score == pytest.approx(4.0)
+    # Order is time-invariant: the same from any later reference time
+    assert addresses(board.top(later + 600 * MS_PER_MINUTE)) == ["NEW", "OLD"]
+
+
+def test_compaction_bounds_memory_and_keeps_best():
+    """Test that stale and surplus entries are dropped, keeping the best"""
+    board = Leaderboard(LeaderboardConfig(size=3, max_entries=5))
+    for i in range(20):
+        add(board, f"T{i}", i % 10)
+    for _ in range(10):
+        add(board, "T19", 9)
+
+    assert len(board._heap) <= 10
+    assert len(board) <= 10
+    assert addresses(board.top(REFERENCE_MS)) == ["T19", "T9", "T18"]
+
+
+def test_same_address_on_two_chains_ranks_separately():
+    """Test that one contract address matched on two chains keeps both entries"""
+    board = Leaderboard(LeaderboardConfig())
+    address = "0x" + "ab" * 20
+    board.update(make_token(address, chain_id="base"), TokenScore(total_score=8, passed=True), REFERENCE_MS)
+    board.update(make_token(address, chain_id="bsc"), TokenScore(total_score=6, passed=True), REFERENCE_MS)
+
+    top = board.top(REFERENCE_MS)
+
+    assert [entry.token.chain_id for entry in top] == ["base", "bsc"]
+    assert len(board) == 2
+    assert ("base", address) in board
@@ -0,0 +1,128 @@
+import json
+import socket
+import threading
+import time
+import pytest
+from src.config_manager import LiveFeedConfig
+from src.dexscreener_client import TokenData
+from src.live_feed import LiveFeed, match_event
+from src.token_filter import TokenScore
+
+
+@pytest.fixture
+def feed(request):
+    options = getattr(request, "param", {})
+    live_feed = LiveFeed(LiveFeedConfig(enabled=True, port=0, **options))
+    live_feed.start()
+    yield live_feed
+    live_feed.stop()
+
+
+def get(feed, path):
+    sock = socket.create_connection(("127.0.0.1", feed.port), timeout=5)
+    sock.sendall(f"GET {path} HTTP/1.1\r\nHost: test\r\n\r\n".encode())
+    return sock
+
+
+def read_until(sock, marker, limit=65536):
+    data = b""
+    while marker not in data and len(data) < limit:
+        chunk = sock.recv(4096)
+        if not chunk:
+            break
+        data += chunk
+    return data
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met"
+        time.sleep(0.01)
+
+
+def test_serves_viewer_page(feed):
+    """Test that the root path returns the HTML viewer"""
+    sock = get(feed, "/")
+
+    response = read_until(sock, b"</html>")
+
+    assert response.startswith(b"HTTP/1.1 200 OK")
+    assert b"EventSource" in response
+    sock.close()
+
+
+def test_unknown_path_is_404(feed):
+    """Test that other paths are rejected"""
+    sock = get(feed, "/nope")
+
+    assert read_until(sock, b"\r\n").startswith(b"HTTP/1.1 404")
+    sock.close()
+
+
+def test_event_is_broadcast_to_every_subscriber(feed):
+    """Test that all viewers receive the same serialized event"""
+    viewers = [get(feed, "/events") for _ in range(3)]
+    for sock in viewers:
+        assert b"text/event-stream" in read_until(sock, b"\r\n\r\n")
+    wait_for(lambda: feed.stats.clients == 3)
+
+    feed.publish("stats", {"total_scanned": 42})
+
+    received = [read_until(sock, b"\n\n").split(b"\r\n\r\n")[-1] for sock in viewers]
+    assert received == [b'event: stats\ndata: {"total_scanned":42}\n\n'] * 3
+    for sock in viewers:
+        sock.close()
+
+
+def test_new_viewer_gets_recent_matches_and_stats(feed):
+    """Test that late joiners see replayed matches and the latest stats"""
+    feed.publish("match", {"n": 1})
+    feed.publish("stats", {"total_scanned": 1})
+    feed.publish("stats", {"total_scanned": 2})
+    wait_for(lambda: feed.stats.published == 3)
+
+    sock = get(feed, "/events")
+    response = read_until(sock, b'{"total_scanned":2}')
+
+    assert b'event: match\ndata: {"n":1}' in response
+    assert b'{"total_scanned":1}' not in response
+    sock.close()
+
+
+@pytest.mark.parametrize("feed", [{"client_buffer": 2}], indirect=True)
+def test_slow_viewer_is_dropped(feed):
+    """Test that a viewer whose buffer overflows is disconnected"""
+    sock = get(feed, "/events")
+    read_until(sock, b"\r\n\r\n")
+    wait_for(lambda: feed.stats.clients == 1)
+
+    # Hold the loop so every publish lands before the viewer can drain
+    release = threading.Event()
+    feed._loop.call_soon_threadsafe(release.wait)
+    for i in range(5):
+        feed.publish("match", {"n": i})
+    release.set()
+
+    wait_for(lambda: feed.stats.dropped_clients == 1)
+    assert feed.stats.clients == 0
+    sock.close()
+
+
+def test_publish_without_server_is_a_no_op():
+    """Test that publishing before start neither raises nor blocks"""
+    LiveFeed(LiveFeedConfig()).publish("stats", {})
+
+
+def test_match_event_encodes_address():
+    """Test that match payloads carry the base58 address, not the key"""
+    token = TokenData(
+        address="So11111111111111111111111111111111111111112", name="W", symbol="W",
+        price_usd=1.0, liquidity_usd=1.0, volume_24h=1.0, maker_count=1, created_at_ms=0
+    )
+
+    event = match_event(token, TokenScore(passed=True, total_score=6), 123)
+
+    assert event["token"]["address"] == "So11111111111111111111111111111111111111112"
+    assert "key" not in event["token"]
+    json.dumps(event)
@@ -0,0 +1,104 @@
+import json
+import logging
+import pytest
+from src.config_manager import LoggingConfig
+from src.logging_config import JsonLinesFormatter, RateLimitFilter, setup_logging, shutdown_logging
+
+
+def make_record(msg, *args, name="src.dexscreener_client"):
+    return logging.LogRecord(name, logging.WARNING, __file__, 1, msg, args, None)
+
+
+def test_rate_limit_filter_samples_repeated_templates(clock):
+    """Test that repeats of one template are capped per window"""
+    sampler = RateLimitFilter(burst=2, window_seconds=60, clock=clock)
+
+    passed = [sampler.filter(make_record("Failed to parse token: %s", i)) for i in range(5)]
+
+    assert passed == [True, True, False, False, False]
+    assert sampler.filter(make_record("Other message"))
+
+
+def test_rate_limit_filter_reports_suppressed_count(clock):
+    """Test that the first record of a new window reports dropped records"""
+    sampler = RateLimitFilter(burst=1, window_seconds=60, clock=clock)
+    for i in range(4):
+        sampler.filter(make_record("Failed to parse token: %s", i))
+
+    clock.now += 60
+    record = make_record("Failed to parse token: %s", "x")
+
+    assert sampler.filter(record)
+    assert record.getMessage() == "Failed to parse token: x (3 similar messages suppressed)"
+
+
+def test_json_lines_formatter():
+    """Test that JSON output has one parseable object per record"""
+    line = JsonLinesFormatter().format(make_record("Match found: %s", "TEST"))
+
+    entry = json.loads(line)
+    assert entry["message"] == "Match found: TEST"
+    assert entry["level"] == "WARNING"
+    assert entry["logger"] == "src.dexscreener_client"
+
+
+def test_setup_logging_writes_through_listener(tmp_path):
+    """Test that records reach the rotating file once the listener drains"""
+    log_path = tmp_path / "logs" / "scraper.log"
+    root = logging.getLogger()
+    saved = (root.handlers[:], root.level)
+
+    try:
+        setup_logging(LoggingConfig(path=log_path, json_lines=True), log_to_console=False)
+        logging.getLogger("src.test").info("hello %s", "queue")
+        shutdown_logging()
+    finally:
+        root.handlers[:] = saved[0]
+        root.setLevel(saved[1])
+
+    entry = json.loads(log_path.read_text().splitlines()[0])
+    assert entry["message"] == "hello queue"
+
+
+def test_rate_limit_filter_forgets_idle_templates(clock):
+    """Test that one-off messages do not accumulate windows forever"""
+    sampler = RateLimitFilter(burst=1, window_seconds=60, clock=clock)
+    for i in range(100):
+        sampler.filter(make_record(f"Scan failed: error {i}"))
+    assert len(sampler._windows) == 100
+
+    clock.now += 120
+    sampler.filter(make_record("Failed to parse token: %s", "x"))
+
+    assert len(sampler._windows) == 1
+
+
+def test_rate_limit_filter_passes_unsampled_loggers(clock):
+    """Test that records outside the sampled loggers are never suppressed"""
+    sampler = RateLimitFilter(burst=1, window_seconds=60, clock=clock)
+
+    passed = [sampler.filter(make_record("Anomaly: %s", i, name="src.main")) for i in range(5)]
+
+    assert all(passed)
+    assert not sampler._windows
+
+
+def test_setup_logging_never_samples_matches(tmp_path):
+    """Test that every match line reaches the log while parse warnings are capped"""
+    log_path = tmp_path / "logs" / "scraper.log"
+    root = logging.getLogger()
+    saved = (root.handlers[:], root.level)
+
+    try:
+        setup_logging(LoggingConfig(path=log_path, sample_burst=2), log_to_console=False)
+        for i in range(12):
+            logging.getLogger("src.main").info("Match found: %s - Score: %s", f"T{i}", 8)
+            logging.getLogger("src.dexscreener_client").warning("Failed to parse token: %s", i)
+        shutdown_logging()
+    finally:
+        root.handlers[:] = saved[0]
+        root.setLevel(saved[1])
+
+    lines = log_path.read_text().splitlines()
+    assert sum("Match found" in line for line in lines) == 12
+    assert sum("Failed to parse token" in line for line in lines) == 2
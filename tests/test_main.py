@@ -42,7 +42,8 @@ def test_orchestrator_single_scan_cycle(mock_dash, mock_cache, mock_filter, mock
             maker_count=60, created_at=datetime.now() - timedelta(minutes=25)
         )
     ]
-    mock_client.return_value.fetch_solana_tokens.return_value = mock_tokens
+    mock_client.return_value.iter_pairs.return_value = [{}, {}]
+    mock_client.return_value.parse_pair.side_effect = mock_tokens
 
     # Setup score with proper model
     mock_score = TokenScore(passed=True, total_score=7, age_score=3, volume_score=2, momentum_score=2)
@@ -57,6 +58,415 @@ def test_orchestrator_single_scan_cycle(mock_dash, mock_cache, mock_filter, mock
     orchestrator._scan_once()
 
     # Verify flow
-    mock_client.return_value.fetch_solana_tokens.assert_called_once()
+    mock_client.return_value.iter_pairs.assert_called_once()
     assert mock_filter.return_value.score_token.call_count == 2
     assert mock_cache_instance.mark_seen.call_count == 2
+
+
+@patch('src.main.DexScreenerClient')
+@patch('src.main.TokenFilter')
+@patch('src.main.Dashboard')
+def test_orchestrator_scan_counts_duplicates(mock_dash, mock_filter, mock_client):
+    """Test that tokens seen in an earlier scan are counted and not re-scored"""
+    token = TokenData(
+        address="DUP", name="Dup", symbol="D",
+        price_usd=0.001, liquidity_usd=10000, volume_24h=20000,
+        maker_count=50, created_at=datetime.now() - timedelta(minutes=20)
+    )
+    mock_client.return_value.iter_pairs.return_value = [{}]
+    mock_client.return_value.parse_pair.return_value = token
+    mock_filter.return_value.score_token.return_value = TokenScore(passed=True, total_score=7)
+
+    orchestrator = SolanaScraperOrchestrator(Path("config.json"))
+    orchestrator._scan_once()
+    orchestrator._scan_once()
+
+    assert [c.args for c in mock_dash.return_value.update_stats.call_args_list] == [(1, 0, 0), (1, 1, 0)]
+    assert mock_filter.return_value.score_token.call_count == 1
+    mock_dash.return_value.add_match.assert_called_once()
+
+
+@patch('src.main.DexScreenerClient')
+@patch('src.main.TokenFilter')
+@patch('src.main.Dashboard')
+def test_orchestrator_scan_aggregates_pools(mock_dash, mock_filter, mock_client):
+    """Test that a token's pools are scored once with summed metrics"""
+    pools = [
+        TokenData(
+            address="MULTI", pair_address=f"POOL{i}", name="Multi", symbol="M",
+            price_usd=0.001, liquidity_usd=liquidity, volume_24h=20000,
+            maker_count=50, created_at=datetime.now() - timedelta(minutes=20)
+        )
+        for i, liquidity in enumerate([5000, 30000, 1000])
+    ]
+    mock_client.return_value.iter_pairs.return_value = [{}, {}, {}]
+    mock_client.return_value.parse_pair.side_effect = pools
+    mock_filter.return_value.score_token.return_value = TokenScore(passed=True, total_score=7)
+
+    orchestrator = SolanaScraperOrchestrator(Path("config.json"))
+    orchestrator._scan_once()
+
+    mock_dash.return_value.update_stats.assert_called_once_with(1, 0, 0)
+    scored = mock_filter.return_value.score_token.call_args[0][0]
+    assert (scored.pair_address, scored.pool_count) == ("POOL1", 3)
+    assert (scored.liquidity_usd, scored.volume_24h, scored.maker_count) == (36000, 60000, 150)
+
+
+@patch('src.main.DexScreenerClient')
+@patch('src.main.Dashboard')
+def test_hot_refresh_emits_token_that_now_passes(mock_dash, mock_client):
+    """Test that a tracked pair is emitted once a re-fetch makes it pass"""
+    young = dict(
+        address="HOT", pair_address="PAIR_HOT", name="Hot", symbol="H",
+        price_usd=0.001, volume_24h=90000, maker_count=50,
+        price_change_5m=5.0, price_change_1h=5.0,
+        created_at=datetime.now() - timedelta(minutes=5)
+    )
+    mock_client.return_value.iter_pairs.return_value = [{}]
+    mock_client.return_value.parse_pair.return_value = TokenData(liquidity_usd=1000, **young)
+    mock_client.return_value.fetch_pair.return_value = TokenData(liquidity_usd=15000, **young)
+
+    orchestrator = SolanaScraperOrchestrator(Path("config.json"))
+    orchestrator._scan_once()
+
+    assert orchestrator.hot_scheduler.is_tracked("HOT")
+    mock_dash.return_value.add_match.assert_not_called()
+
+    orchestrator._refresh_hot_pairs()
+
+    mock_client.return_value.fetch_pair.assert_called_once_with("PAIR_HOT", deadline=None)
+    mock_dash.return_value.add_match.assert_called_once()
+    assert not orchestrator.hot_scheduler.is_tracked("HOT")
+
+
+@patch('src.main.DexScreenerClient')
+@patch('src.main.Dashboard')
+def test_scan_records_history(mock_dash, mock_client, tmp_path):
+    """Test that every evaluated token is written to the history store"""
+    config_path = tmp_path / "config.json"
+    config_path.write_text(
+        '{"history": {"enabled": true, "path": "%s"}}' % (tmp_path / "history.sqlite3").as_posix()
+    )
+    tokens = [
+        TokenData(
+            address=f"T{i}", name="T", symbol="T",
+            price_usd=0.001, liquidity_usd=liquidity, volume_24h=20000,
+            maker_count=50, created_at=datetime.now() - timedelta(minutes=20)
+        )
+        for i, liquidity in enumerate([10000, 100])
+    ]
+    mock_client.return_value.iter_pairs.return_value = [{}, {}]
+    mock_client.return_value.parse_pair.side_effect = tokens
+
+    orchestrator = SolanaScraperOrchestrator(config_path)
+    orchestrator._scan_once()
+
+    assert len(orchestrator.history.timeline("T0")) == 1
+    assert orchestrator.history.timeline("T1")[0].total_score is None
+    orchestrator.close()
+
+
+def test_import_has_no_side_effects(tmp_path):
+    """Test that importing src.main skips Rich and does not create logs/"""
+    import subprocess
+    import sys
+
+    root = Path(__file__).resolve().parent.parent
+    result = subprocess.run(
+        [sys.executable, "-c",
+         "import sys, src.main; print(sorted(m for m in ('rich', 'requests') if m in sys.modules))"],
+        cwd=tmp_path,
+        env={"PYTHONPATH": str(root)},
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.stdout.strip() == "[]"
+    assert not (tmp_path / "logs").exists()
+
+
+@patch('src.main.DexScreenerClient')
+@patch('src.main.Dashboard')
+def test_scan_drops_blocklisted_tokens(mock_dash, mock_client, tmp_path):
+    """Test that blocklisted addresses never reach scoring"""
+    from src.address import b58encode
+    from src.address_index import AddressIndex
+
+    blocked, allowed, clean = (b58encode(bytes([i]) * 32) for i in (1, 2, 3))
+    AddressIndex.build([blocked, allowed], tmp_path / "block.idx")
+    AddressIndex.build([allowed], tmp_path / "allow.idx")
+    config_path = tmp_path / "config.json"
+    config_path.write_text(
+        '{"blocklist_path": "%s", "allowlist_path": "%s"}'
+        % ((tmp_path / "block.idx").as_posix(), (tmp_path / "allow.idx").as_posix())
+    )
+    tokens = [
+        TokenData(
+            address=address, name="T", symbol="T",
+            price_usd=0.001, liquidity_usd=10000, volume_24h=20000,
+            maker_count=50, created_at=datetime.now() - timedelta(minutes=20)
+        )
+        for address in (blocked, allowed, clean)
+    ]
+    mock_client.return_value.iter_pairs.return_value = [{}, {}, {}]
+    mock_client.return_value.parse_pair.side_effect = tokens
+
+    orchestrator = SolanaScraperOrchestrator(config_path)
+    orchestrator._scan_once()
+
+    mock_dash.return_value.update_stats.assert_called_once_with(3, 0, 1)
+    assert [orchestrator.cache.has_seen(token.key) for token in tokens] == [False, True, True]
+    orchestrator.close()
+
+
+@patch('src.main.DexScreenerClient')
+@patch('src.main.TokenFilter')
+@patch('src.main.Dashboard')
+def test_scan_drops_blocklisted_pool_before_aggregation(mock_dash, mock_filter, mock_client, tmp_path):
+    """Test that a listed pool that is not the token's deepest is left out of its totals"""
+    from src.address import b58encode
+    from src.address_index import AddressIndex
+
+    token_address, deep_pool, blocked_pool = (b58encode(bytes([i]) * 32) for i in (1, 2, 3))
+    AddressIndex.build([blocked_pool], tmp_path / "block.idx")
+    config_path = tmp_path / "config.json"
+    config_path.write_text('{"blocklist_path": "%s"}' % (tmp_path / "block.idx").as_posix())
+    pools = [
+        TokenData(
+            address=token_address, pair_address=pair_address, name="T", symbol="T",
+            price_usd=0.001, liquidity_usd=liquidity, volume_24h=20000,
+            maker_count=50, created_at=datetime.now() - timedelta(minutes=20)
+        )
+        for pair_address, liquidity in ((deep_pool, 9000), (blocked_pool, 4000))
+    ]
+    mock_client.return_value.iter_pairs.return_value = [{}, {}]
+    mock_client.return_value.parse_pair.side_effect = pools
+    mock_filter.return_value.score_token.return_value = None
+
+    orchestrator = SolanaScraperOrchestrator(config_path)
+    orchestrator._scan_once()
+
+    mock_dash.return_value.update_stats.assert_called_once_with(1, 0, 1)
+    scored = mock_filter.return_value.score_token.call_args[0][0]
+    assert (scored.pair_address, scored.liquidity_usd, scored.pool_count) == (deep_pool, 9000, 1)
+    orchestrator.close()
+
+
+@patch('src.live_feed.LiveFeed')
+@patch('src.main.DexScreenerClient')
+@patch('src.main.TokenFilter')
+@patch('src.main.Dashboard')
+def test_scan_publishes_to_live_feed(mock_dash, mock_filter, mock_client, mock_feed, tmp_path):
+    """Test that matches and scan stats are sent to live feed viewers"""
+    config_path = tmp_path / "config.json"
+    config_path.write_text('{"live_feed": {"enabled": true}}')
+    mock_client.return_value.iter_pairs.return_value = [{}]
+    mock_client.return_value.parse_pair.return_value = TokenData(
+        address="LIVE", name="Live", symbol="L",
+        price_usd=0.001, liquidity_usd=10000, volume_24h=20000,
+        maker_count=50, created_at=datetime.now() - timedelta(minutes=20)
+    )
+    mock_filter.return_value.score_token.return_value = TokenScore(passed=True, total_score=7)
+    mock_dash.return_value.total_scanned = 1
+
+    orchestrator = SolanaScraperOrchestrator(config_path)
+    orchestrator._scan_once()
+    orchestrator.close()
+
+    events = [c.args for c in mock_feed.return_value.publish.call_args_list]
+    assert [name for name, _ in events] == ["match", "stats"]
+    assert events[0][1]["token"]["address"] == "LIVE"
+    assert events[1][1]["total_scanned"] == 1
+    mock_feed.return_value.stop.assert_called_once()
+
+
+@patch('src.main.DexScreenerClient')
+@patch('src.main.Dashboard')
+def test_memory_profile_reports_subsystems(mock_dash, mock_client, tmp_path):
+    """Test that the opt-in memory mode writes subsystem sizes on close"""
+    report = tmp_path / "memory.log"
+    config_path = tmp_path / "config.json"
+    config_path.write_text('{"memory_profile": {"report_path": "%s"}}' % report.as_posix())
+    mock_client.return_value.iter_pairs.return_value = []
+    mock_dash.return_value.matches = []
+
+    orchestrator = SolanaScraperOrchestrator(config_path, memory_profile=True)
+    orchestrator._scan_once()
+    orchestrator.close()
+
+    text = report.read_text()
+    assert "--- sample 1" in text
+    assert "token_cache 0" in text and "hot_heap 0" in text
+
+
+@patch('src.main.DexScreenerClient')
+@patch('src.main.TokenFilter')
+@patch('src.main.Dashboard')
+def test_liquidity_pull_on_matched_token_is_surfaced(mock_dash, mock_filter, mock_client):
+    """Test that a matched token is still watched and its rug pull raised"""
+    def token(liquidity):
+        return TokenData(
+            address="RUG", name="Rug", symbol="R",
+            price_usd=0.001, liquidity_usd=liquidity, volume_24h=20000,
+            maker_count=50, created_at=datetime.now() - timedelta(minutes=20)
+        )
+    mock_client.return_value.iter_pairs.return_value = [{}]
+    mock_client.return_value.parse_pair.side_effect = [token(40000), token(2000)]
+    mock_filter.return_value.score_token.return_value = TokenScore(passed=True, total_score=7)
+
+    orchestrator = SolanaScraperOrchestrator(Path("config.json"))
+    orchestrator._scan_once()
+    orchestrator._scan_once()
+
+    mock_dash.return_value.add_match.assert_called_once()
+    event = mock_dash.return_value.add_anomaly.call_args[0][0]
+    assert (event.kind, event.address, event.matched) == ("liquidity_drop", "RUG", True)
+
+
+@patch('src.main.DexScreenerClient')
+@patch('src.main.TokenFilter')
+@patch('src.main.Dashboard')
+def test_each_chain_scans_with_its_own_dedup(mock_dash, mock_filter, mock_client, tmp_path):
+    """Test that chains share a scan cycle but not their seen-token caches"""
+    config_path = tmp_path / "config.json"
+    config_path.write_text('{"chains": ["solana", "base"], "chain_overrides": {"base": {"hard_filters": {"min_liquidity_usd": 1}}}}')
+
+    def chain_client(chain, http):
+        client = MagicMock()
+        client.iter_pairs.return_value = [{}]
+        client.parse_pair.return_value = TokenData(
+            address="SAME", name="Same", symbol="S", chain_id=chain,
+            price_usd=0.001, liquidity_usd=10000, volume_24h=20000,
+            maker_count=50, created_at=datetime.now() - timedelta(minutes=20)
+        )
+        return client
+    mock_client.side_effect = chain_client
+    mock_filter.return_value.score_token.return_value = TokenScore(passed=True, total_score=7)
+
+    orchestrator = SolanaScraperOrchestrator(config_path)
+    orchestrator._scan_once()
+
+    assert [chain.chain_id for chain in orchestrator.chains] == ["solana", "base"]
+    assert orchestrator.chains[1].config.hard_filters.min_liquidity_usd == 1
+    assert all(call[1]["http"] is orchestrator.http for call in mock_client.call_args_list)
+    matched = [call[0][0].token.chain_id for call in mock_dash.return_value.add_match.call_args_list]
+    assert matched == ["solana", "base"]
+    assert mock_dash.return_value.update_stats.call_count == 2
+
+
+@patch('src.main.DexScreenerClient')
+@patch('src.main.TokenFilter')
+@patch('src.main.Dashboard')
+def test_workers_never_alert_the_same_token_twice(mock_dash, mock_filter, mock_client, tmp_path):
+    """Test that sharded workers split tokens and share match claims"""
+    config_path = tmp_path / "config.json"
+    config_path.write_text(
+        '{"worker": {"store_url": "sqlite:///%s"}, "hot_scan": {"enabled": false}}'
+        % (tmp_path / "coord.sqlite3").as_posix()
+    )
+    addresses = [f"TOKEN{i}" for i in range(20)]
+    mock_client.return_value.iter_pairs.side_effect = lambda deadline=None: [{}] * len(addresses)
+    mock_client.return_value.parse_pair.side_effect = lambda pair, tokens=iter(addresses * 3): TokenData(
+        address=next(tokens), name="T", symbol="T",
+        price_usd=0.001, liquidity_usd=10000, volume_24h=20000,
+        maker_count=50, created_at=datetime.now() - timedelta(minutes=20)
+    )
+    mock_filter.return_value.score_token.return_value = TokenScore(passed=True, total_score=7)
+
+    # w1 joins alone and alerts everything; w2 then shares the work
+    w1 = SolanaScraperOrchestrator(config_path, worker_id="w1")
+    w1._scan_once()
+    w2 = SolanaScraperOrchestrator(config_path, worker_id="w2")
+    w2._scan_once()
+    w1.coordinator.heartbeat(force=True)
+    w1.cache.clear()
+    w1._scan_once()
+
+    assert w2.coordinator.workers == ["w1", "w2"]
+    assert mock_dash.return_value.add_match.call_count == len(addresses)
+    assert w1._scanned_count + w2._scanned_count == len(addresses)
+    assert w1.coordinator.stats.claims_lost + w2.coordinator.stats.claims_lost == len(addresses)
+    w1.close()
+    w2.close()
+
+
+@patch('src.main.DexScreenerClient')
+@patch('src.main.TokenFilter')
+@patch('src.main.Dashboard')
+def test_scan_deadline_truncates_scan_without_matches(mock_dash, mock_filter, mock_client):
+    """Test that a slow scan with no matches still stops at its deadline"""
+    import time
+
+    def slow_pairs(deadline=None):
+        for _ in range(30):
+            time.sleep(0.1)
+            yield {}
+    mock_client.return_value.iter_pairs.side_effect = slow_pairs
+    mock_client.return_value.parse_pair.side_effect = lambda pair: TokenData(
+        address="SLOW", name="Slow", symbol="S",
+        price_usd=0.001, liquidity_usd=10000, volume_24h=20000,
+        maker_count=50, created_at=datetime.now() - timedelta(minutes=20)
+    )
+    mock_filter.return_value.score_token.return_value = TokenScore(passed=False, total_score=1)
+
+    orchestrator = SolanaScraperOrchestrator(Path("config.json"))
+    started = time.monotonic()
+    orchestrator._scan_once(deadline=started + 0.5)
+
+    assert time.monotonic() - started < 1.5
+    mock_dash.return_value.record_truncated_scan.assert_called_once()
+    mock_dash.return_value.add_match.assert_not_called()
+
+
+@patch('src.main.DexScreenerClient')
+@patch('src.main.Dashboard')
+def test_evm_chain_uses_hex_blocklist(mock_dash, mock_client, tmp_path):
+    """Test that a chain's hex blocklist drops 0x addresses"""
+    from src.address import EVM_KEY_SIZE
+    from src.address_index import AddressIndex
+
+    blocked, clean = "0x" + "ab" * 20, "0x" + "cd" * 20
+    AddressIndex.build([blocked], tmp_path / "evm.idx", EVM_KEY_SIZE)
+    config_path = tmp_path / "config.json"
+    config_path.write_text(
+        '{"chains": ["base"], "chain_overrides": {"base": {"blocklist_path": "%s"}}}'
+        % (tmp_path / "evm.idx").as_posix()
+    )
+    tokens = [
+        TokenData(
+            address=address.upper().replace("0X", "0x"), name="T", symbol="T", chain_id="base",
+            price_usd=0.001, liquidity_usd=10000, volume_24h=20000,
+            maker_count=50, created_at=datetime.now() - timedelta(minutes=20)
+        )
+        for address in (blocked, clean)
+    ]
+    mock_client.return_value.iter_pairs.return_value = [{}, {}]
+    mock_client.return_value.parse_pair.side_effect = tokens
+
+    orchestrator = SolanaScraperOrchestrator(config_path)
+    orchestrator._scan_once()
+
+    mock_dash.return_value.update_stats.assert_called_once_with(2, 0, 1)
+    orchestrator.close()
+
+
+@pytest.mark.parametrize("mode", ["verify", "run"])
+@patch('src.main.SolanaScraperOrchestrator')
+def test_run_mode_always_closes_orchestrator(mock_orchestrator, mode):
+    """Test that every CLI mode closes the orchestrator, even when it fails"""
+    import argparse
+    from src.main import _run_mode
+
+    args = argparse.Namespace(
+        config=Path("config.json"), memory_profile=True, worker=False, worker_id=None,
+        verify_token=["TOKEN"] if mode == "verify" else None, dry_run=False
+    )
+    mock_orchestrator.return_value.run.side_effect = KeyboardInterrupt
+
+    if mode == "run":
+        with pytest.raises(KeyboardInterrupt):
+            _run_mode(args)
+    else:
+        _run_mode(args)
+
+    mock_orchestrator.return_value.close.assert_called_once()
@@ -0,0 +1,65 @@
+import tracemalloc
+import pytest
+from src.config_manager import MemoryProfileConfig
+from src.memory_profiler import MemoryProfiler
+
+
+@pytest.fixture
+def profiler(tmp_path, clock):
+    config = MemoryProfileConfig(enabled=True, report_path=tmp_path / "memory.log", interval_seconds=60, top_n=5)
+    memory_profiler = MemoryProfiler(config, clock=clock)
+    memory_profiler.clock = clock
+    memory_profiler.start()
+    yield memory_profiler
+    if tracemalloc.is_tracing():
+        memory_profiler.stop()
+
+
+def test_sample_waits_for_interval(profiler):
+    """Test that samples are only taken once the interval has elapsed"""
+    assert profiler.sample() is None
+
+    profiler.clock.now = 61
+
+    assert profiler.sample() is not None
+    assert profiler.sample() is None
+
+
+def test_sample_reports_subsystems_and_growth(profiler):
+    """Test that subsystem sizes and the growing allocation site are reported"""
+    leak = []
+    profiler.register("leak", lambda: len(leak))
+    leak.extend(bytearray(1024) for _ in range(500))
+    profiler.clock.now = 61
+
+    sample = profiler.sample()
+
+    assert sample.subsystems == {"leak": 500}
+    assert any("test_memory_profiler.py" in line for line in sample.top_growth)
+    report = profiler.config.report_path.read_text()
+    assert "leak 500 (+0)" in report
+    assert "top growth since last sample" in report
+
+
+def test_measure_tracks_retained_and_peak(profiler):
+    """Test that a scope records memory kept and its transient peak"""
+    kept = []
+    with profiler.measure("scan"):
+        transient = [bytearray(1024) for _ in range(200)]
+        kept.append(bytearray(50_000))
+        del transient
+
+    profiler.clock.now = 61
+    scope = profiler.sample().scopes["scan"]
+
+    assert scope.calls == 1
+    assert 50_000 <= scope.retained_bytes < 150_000
+    assert scope.max_peak_bytes >= 200 * 1024
+
+
+def test_stop_writes_final_sample_and_stops_tracing(profiler):
+    """Test that stopping flushes a sample regardless of the interval"""
+    profiler.stop()
+
+    assert not tracemalloc.is_tracing()
+    assert "--- sample 1" in profiler.config.report_path.read_text()
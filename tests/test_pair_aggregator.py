@@ -0,0 +1,57 @@
+from src.dexscreener_client import TokenData
+from src.pair_aggregator import PairAggregator, aggregate_pools
+
+
+CREATED_MS = 1_700_000_000_000
+
+
+def make_pool(address, pair, liquidity, volume=1000, makers=10, created_offset_ms=0, change_5m=None):
+    return TokenData(
+        address=address, pair_address=pair, name=address, symbol=address,
+        price_usd=0.001, liquidity_usd=liquidity, volume_24h=volume, maker_count=makers,
+        price_change_5m=change_5m, created_at_ms=CREATED_MS + created_offset_ms
+    )
+
+
+def test_single_pool_tokens_pass_through():
+    """Test that tokens with one pool are returned unchanged"""
+    token = make_pool("A", "PA", 5000)
+
+    assert aggregate_pools([token]) == [token]
+    assert aggregate_pools([token])[0] is token
+
+
+def test_pools_are_summed_around_primary():
+    """Test totals are summed and price fields come from the deepest pool"""
+    tokens = aggregate_pools([
+        make_pool("A", "SHALLOW", 1000, volume=500, makers=5, change_5m=50.0),
+        make_pool("A", "DEEP", 9000, volume=2000, makers=40, change_5m=4.0),
+    ])
+
+    assert len(tokens) == 1
+    merged = tokens[0]
+    assert merged.pair_address == "DEEP"
+    assert merged.price_change_5m == 4.0
+    assert (merged.liquidity_usd, merged.volume_24h, merged.maker_count) == (10000, 2500, 45)
+    assert merged.pool_count == 2
+
+
+def test_age_comes_from_oldest_pool():
+    """Test that a new pool on an old token does not make it look fresh"""
+    merged, = aggregate_pools([
+        make_pool("A", "NEW_DEEP", 9000, created_offset_ms=0),
+        make_pool("A", "OLD", 1000, created_offset_ms=-3_600_000),
+    ])
+
+    assert merged.pair_address == "NEW_DEEP"
+    assert merged.created_at_ms == CREATED_MS - 3_600_000
+
+
+def test_tokens_keep_first_seen_order():
+    """Test that interleaved pools group per token in arrival order"""
+    aggregator = PairAggregator()
+    for token in [make_pool("B", "B1", 1), make_pool("A", "A1", 1), make_pool("B", "B2", 2)]:
+        aggregator.add(token)
+
+    assert len(aggregator) == 2
+    assert [(t.address, t.pool_count) for t in aggregator.results()] == [("B", 2), ("A", 1)]
@@ -0,0 +1,96 @@
+import threading
+import pytest
+from src.pipeline import Pipeline, Stage
+
+
+def double(items):
+    for item in items:
+        yield item * 2
+
+
+def evens(items):
+    for item in items:
+        if item % 4 == 0:
+            yield item
+
+
+def test_pipeline_runs_stages_in_order():
+    """Test that items flow through every stage"""
+    pipeline = Pipeline([Stage("double", double), Stage("evens", evens)], maxsize=4)
+
+    result = list(pipeline.run(range(10)))
+
+    assert result == [0, 4, 8, 12, 16]
+
+
+def test_pipeline_reports_queue_stats():
+    """Test that each stage exposes its input queue depth"""
+    pipeline = Pipeline([Stage("double", double)], maxsize=3)
+
+    list(pipeline.run(range(20)))
+    stats = pipeline.stats()
+
+    assert [s.name for s in stats] == ["double", "emit"]
+    assert all(s.capacity == 3 for s in stats)
+    assert all(s.max_depth <= 3 for s in stats)
+    assert stats[0].items == 20
+    assert stats[1].items == 20
+
+
+def test_pipeline_applies_backpressure():
+    """Test that a slow consumer bounds how far the source runs ahead"""
+    produced = []
+
+    def source():
+        for i in range(100):
+            produced.append(i)
+            yield i
+
+    pipeline = Pipeline([Stage("double", double)], maxsize=2)
+    stream = pipeline.run(source())
+    next(stream)
+
+    # Wait for the source to fill the bounded queues
+    threading.Event().wait(0.3)
+
+    # source queue + stage in hand + emit queue + consumer, never the whole batch
+    assert len(produced) < 10
+    stream.close()
+
+
+def test_pipeline_propagates_stage_errors():
+    """Test that an exception in a stage reaches the consumer"""
+    def broken(items):
+        for item in items:
+            raise RuntimeError("stage failed")
+        yield
+
+    pipeline = Pipeline([Stage("broken", broken)])
+
+    with pytest.raises(RuntimeError, match="stage failed"):
+        list(pipeline.run(range(5)))
+
+
+def test_pipeline_stops_at_deadline_without_output():
+    """Test that a deadline ends the run even when nothing reaches the consumer"""
+    import time
+
+    def slow_source():
+        for item in range(30):
+            time.sleep(0.1)
+            yield item
+
+    def drop_all(items):
+        for _ in items:
+            continue
+        yield
+
+    pipeline = Pipeline([Stage("drop", drop_all)])
+    started = time.monotonic()
+
+    assert list(pipeline.run(slow_source(), deadline=started + 0.5)) == []
+
+    assert time.monotonic() - started < 1.5
+    assert pipeline.timed_out
+    list(pipeline.run(range(3)))
+    assert not pipeline.timed_out
@@ -0,0 +1,48 @@
+import pytest
+from src.scan_scheduler import FixedRateScheduler
+
+
+def test_scan_duration_is_subtracted_from_wait(clock):
+    """Test that the period stays fixed regardless of scan duration"""
+    scheduler = FixedRateScheduler(30, clock=clock)
+    scheduler.start()
+
+    scheduler.begin_tick()
+    clock.now += 12  # scan takes 12s
+    scheduler.end_tick()
+
+    assert scheduler.remaining() == pytest.approx(18)
+    assert scheduler.deadline == pytest.approx(30)
+    assert scheduler.stats.last_duration_ms == pytest.approx(12000)
+
+
+def test_deadlines_do_not_drift(clock):
+    """Test that deadlines stay on the start + n * interval grid"""
+    scheduler = FixedRateScheduler(10, clock=clock)
+    scheduler.start()
+
+    for tick in range(1, 6):
+        scheduler.begin_tick()
+        clock.now += 3
+        scheduler.end_tick()
+        clock.now = scheduler.deadline + 0.05  # woke slightly late
+
+    assert scheduler.deadline == pytest.approx(50)
+    assert scheduler.stats.ticks == 5
+    assert scheduler.stats.last_jitter_ms == pytest.approx(50)
+    assert scheduler.stats.late_ticks == 0
+
+
+def test_overrun_skips_missed_ticks(clock):
+    """Test that a scan overrunning its period skips the missed deadlines"""
+    scheduler = FixedRateScheduler(10, clock=clock)
+    scheduler.start()
+
+    scheduler.begin_tick()
+    clock.now += 25  # overruns the deadlines at 110 and 120
+    scheduler.end_tick()
+
+    assert scheduler.stats.late_ticks == 1
+    assert scheduler.stats.skipped_ticks == 2
+    assert scheduler.deadline == pytest.approx(30)
+    assert scheduler.remaining() == pytest.approx(5)
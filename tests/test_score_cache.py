@@ -0,0 +1,89 @@
+import random
+import pytest
+from unittest.mock import Mock
+from src.config_manager import ScraperConfig
+from src.score_cache import ScoreCache
+from src.token_filter import MS_PER_MINUTE, TokenFilter
+from tests.conftest import REFERENCE_MS, make_token
+
+
+@pytest.fixture
+def config():
+    return ScraperConfig()
+
+
+def counting_filter(config):
+    token_filter = TokenFilter(config)
+    token_filter.score_token = Mock(side_effect=token_filter.score_token)
+    return token_filter
+
+
+def test_unchanged_token_hits_within_tier(config):
+    """Test that an unchanged token is not re-scored inside its age tier"""
+    token_filter = counting_filter(config)
+    cache = ScoreCache(token_filter, config)
+    token = make_token(minutes_old=10)
+
+    first = cache.score(token, REFERENCE_MS)
+    second = cache.score(token, REFERENCE_MS + 15 * MS_PER_MINUTE)
+
+    assert first == second
+    assert token_filter.score_token.call_count == 1
+    assert cache.stats.hits == 1
+    assert cache.stats.hit_rate == 0.5
+
+
+def test_tier_boundary_forces_rescore(config):
+    """Test that crossing the 30 minute boundary re-scores at the exact moment"""
+    token_filter = counting_filter(config)
+    cache = ScoreCache(token_filter, config)
+    token = make_token(minutes_old=10)
+
+    assert cache.score(token, REFERENCE_MS + 20 * MS_PER_MINUTE - 1).age_score == 3
+    assert cache.score(token, REFERENCE_MS + 20 * MS_PER_MINUTE).age_score == 2
+    assert cache.stats.expired == 1
+    assert token_filter.score_token.call_count == 2
+
+
+def test_metric_change_forces_rescore(config):
+    """Test that changed metrics invalidate the entry"""
+    token_filter = counting_filter(config)
+    cache = ScoreCache(token_filter, config)
+
+    cache.score(make_token(volume=60000), REFERENCE_MS)
+    rescored = cache.score(make_token(volume=5000), REFERENCE_MS)
+
+    assert rescored.volume_score == 0
+    assert cache.stats.changed == 1
+
+
+def test_cache_is_bounded(config):
+    """Test that the least recently used entries are evicted"""
+    cache = ScoreCache(TokenFilter(config), config, max_entries=2)
+
+    for address in ("A", "B", "C"):
+        cache.score(make_token(address), REFERENCE_MS)
+
+    assert len(cache) == 2
+
+
+def test_cached_scores_identical_to_uncached(config):
+    """Test that cached results match score_token across many re-evaluations"""
+    rng = random.Random(3)
+    token_filter = TokenFilter(config)
+    cache = ScoreCache(token_filter, config)
+    tokens = [
+        make_token(f"T{i}", minutes_old=rng.choice([1, 25, 29, 55, 100, 130]),
+                   liquidity=rng.choice([1000, 10000]))
+        for i in range(50)
+    ]
+
+    reference_ms = REFERENCE_MS
+    for _ in range(200):
+        reference_ms += rng.choice([0, 1, 999, 30_000, 5 * MS_PER_MINUTE])
+        token = rng.choice(tokens)
+        if rng.random() < 0.1:
+            token = token.model_copy(update={"volume_24h": rng.choice([5000, 60000])})
+        assert cache.score(token, reference_ms) == token_filter.score_token(token, reference_ms)
+
+    assert cache.stats.hits > 0
@@ -145,3 +145,47 @@ def test_volume_ratio_scoring():
     score_low = filter.score_token(low_vol_token)
 
     assert score_high.volume_score > score_low.volume_score
+
+
+def test_age_tier_boundaries_are_exclusive():
+    """Test that a token exactly at a tier boundary drops to the next tier"""
+    filter = TokenFilter(ScraperConfig())
+    reference_ms = 1_700_000_000_000
+
+    def token_aged(minutes):
+        return TokenData(
+            address="T", name="T", symbol="T",
+            price_usd=0.001, liquidity_usd=10000,
+            volume_24h=20000, maker_count=50,
+            created_at_ms=reference_ms - minutes * 60_000
+        )
+
+    assert filter._calculate_age_score(token_aged(29.99), reference_ms) == 3
+    assert filter._calculate_age_score(token_aged(30), reference_ms) == 2
+    assert filter._calculate_age_score(token_aged(60), reference_ms) == 1
+    assert filter._calculate_age_score(token_aged(120), reference_ms) == 0
+
+
+def test_age_tiers_configurable():
+    """Test that age tiers come from ScoringConfig"""
+    config = ScraperConfig(scoring={
+        "age_tiers": [
+            {"max_age_minutes": 10, "points": 5},
+            {"max_age_minutes": 5, "points": 8},
+        ]
+    })
+    filter = TokenFilter(config)
+    reference_ms = 1_700_000_000_000
+
+    def age_score(minutes):
+        token = TokenData(
+            address="T", name="T", symbol="T",
+            price_usd=0.001, liquidity_usd=10000,
+            volume_24h=20000, maker_count=50,
+            created_at_ms=reference_ms - minutes * 60_000
+        )
+        return filter._calculate_age_score(token, reference_ms)
+
+    assert age_score(2) == 8
+    assert age_score(7) == 5
+    assert age_score(30) == 0